@@ -10,7 +10,7 @@ from server_side.connection_pool import Connection
 
 logger = logger_config("RPC API logger", log_file, "rpc_api_logs.log")
 db_utils = DatabaseUtils()
-connection = Connection(db_file)
+connection = Connection(db_file, read_only = True)
 process = None
 
 def establish_server_script_file_dir():
@@ -48,6 +48,7 @@ def server_start():
 def server_close():
     """
     Terminates the server process if it is running, updates the database, and closes the connection.
+    The end of the period is written with a short-lived writable connection, the module's own connection only reads.
 
     Returns:
         Success: A success message including the PID of the stopped process.
@@ -57,7 +58,9 @@ def server_close():
         process.terminate()
         process.wait()
         logger.info(f"Close script with PID {process.pid}")
-        db_utils.update_period_end(connection)
+        period_connection = Connection(db_file)
+        db_utils.update_period_end(period_connection)
+        period_connection.connection.close()
         connection.connection.close()
         return Success({"message": f"Server with {process.pid} stopped"})
     else:
@@ -0,0 +1,114 @@
+import argparse
+import itertools
+import json
+import os
+import tempfile
+import timeit
+from server_side.connection_pool import Connection
+from server_side.database_managment import DatabaseUtils
+
+
+def fill_database(connection, first_row, last_row, rows_per_period):
+    """
+    Inserts the connections of the airplanes from first_row to last_row, rows_per_period connections in every period,
+    with the statuses of the real traffic.
+
+    Parameters:
+    - connection (Connection): Connection to the filled database.
+    - first_row (int): Number of the first inserted connection.
+    - last_row (int): Number of the connection after the last inserted one.
+    - rows_per_period (int): Number of connections in every server_side period.
+    """
+    statuses = itertools.cycle([None, "SUCCESSFULLY LANDING", "CRASHED BY OUT OF FUEL", "CRASHED BY COLLISION"])
+    first_period = first_row // rows_per_period + 1
+    last_period = (last_row - 1) // rows_per_period + 1
+    with connection.connection:
+        connection.connection.executemany("INSERT OR IGNORE INTO server_periods (period_id) VALUES (?)",
+                                          ((period_id, ) for period_id in range(first_period, last_period + 1)))
+        connection.connection.executemany("INSERT INTO connections (period_id, airplane_id, status) VALUES (?, ?, ?)",
+                                          ((row // rows_per_period + 1, f"Airplane_{row % rows_per_period + 1}", next(statuses))
+                                           for row in range(first_row, last_row)))
+
+
+def count_airplanes(connection, database_utils, period_id):
+    """
+    Counts the airplanes of the period in the connections table, like the schemas without the period counters have to.
+
+    Returns:
+    - int: Number of airplanes of the period.
+    """
+    return database_utils.execute_sql_query(connection, "SELECT COUNT(*) FROM connections WHERE period_id = ?", (period_id, ),
+                                            fetch_option = "fetchone")[0]
+
+
+def measure_lookups(connection, database_utils, period_id, rows_per_period, number, version):
+    """
+    Measures the lookups of the server_side and of the API in the period.
+    The number of airplanes is taken from the period counters, or counted in the connections table
+    when the schema doesn't have them yet.
+
+    Parameters:
+    - connection (Connection): Connection to the database.
+    - database_utils (DatabaseUtils): Utility running the lookups.
+    - period_id (int): ID of the looked up period.
+    - rows_per_period (int): Number of connections in every server_side period.
+    - number (int): Number of runs of every lookup.
+    - version (int): Version of the schema of the database.
+
+    Returns:
+    - dict: Names of the lookups mapped to the time of one lookup, in microseconds.
+    """
+    if version >= 3:
+        airplanes_number = lambda: database_utils.get_all_airplanes_number_per_period(connection, period_id)
+    else:
+        airplanes_number = lambda: count_airplanes(connection, database_utils, period_id)
+    airplane_id = f"Airplane_{rows_per_period // 2}"
+    lookups = {
+        "single_airplane": lambda: database_utils.get_single_airplane_details(connection, airplane_id, period_id),
+        "airplanes_with_status": lambda: database_utils.get_airplanes_with_specified_status_per_period(
+            connection, "SUCCESSFULLY LANDING", period_id),
+        "airplanes_number": airplanes_number,
+        "update_status": lambda: database_utils.update_connection_status(connection, "SUCCESSFULLY LANDING", airplane_id, period_id)
+    }
+    return {name: timeit.timeit(lookup, number = number) / number * 1e6 for name, lookup in lookups.items()}
+
+
+def run_benchmark(sizes = (10000, 100000, 1000000), rows_per_period = 1000, number = 100, schema_versions = (1, None)):
+    """
+    Grows the connections table to every size and measures the lookups in its latest period,
+    for the schema without the indexes (version 1) and with them.
+
+    Parameters:
+    - sizes (tuple): Numbers of rows of the table at which the lookups are measured, ascending.
+    - rows_per_period (int): Number of connections in every server_side period.
+    - number (int): Number of runs of every lookup.
+    - schema_versions (tuple): Versions of the schema to compare, None for the latest one.
+
+    Returns:
+    - dict: Versions of the schema mapped to the sizes of the table mapped to the measurements.
+    """
+    results = {}
+    for schema_version in schema_versions:
+        with tempfile.TemporaryDirectory() as directory:
+            connection = Connection(os.path.join(directory, "airport_db.db"))
+            database_utils = DatabaseUtils()
+            version = database_utils.migrate(connection, schema_version)
+            measurements = results[f"schema_v{version}"] = {}
+            rows = 0
+            for size in sizes:
+                fill_database(connection, rows, size, rows_per_period)
+                rows = size
+                period_id = (size - 1) // rows_per_period + 1
+                measurements[size] = measure_lookups(connection, database_utils, period_id, rows_per_period, number, version)
+            connection.connection.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Lookup time of the connections as the table grows, with and without the indexes.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [10000, 100000, 1000000],
+                        help = "Numbers of rows of the table at which the lookups are measured.")
+    parser.add_argument("--rows-per-period", type = int, default = 1000, help = "Number of connections in every server period.")
+    parser.add_argument("--number", type = int, default = 100, help = "Number of runs of every lookup.")
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(sorted(args.sizes), args.rows_per_period, args.number), indent = 4))
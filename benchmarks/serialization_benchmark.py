@@ -0,0 +1,77 @@
+import argparse
+import json
+import timeit
+from client_side.client_messages import ClientProtocols
+from common.serialization_codecs import CODECS, create_codec
+from server_side.server_messages import HandlerProtocols
+
+
+def real_messages():
+    """
+    Builds the messages exchanged during a flight, with the shapes of the real traffic.
+
+    Returns:
+    - dict: Names of the messages mapped to the messages.
+    """
+    client_protocols = ClientProtocols()
+    handler_protocols = HandlerProtocols()
+    airplane_object = {"Airplane_1": {"id": 1, "coordinates": [4512, -2875, 3150], "quarter": "NW",
+                                      "fuel_time": 10800, "time_of_appearance": "2024-01-01 12:00:00",
+                                      "initial_landing_point": [-1500, 1500, 1000], "waiting_point": [-2000, 2000, 1000],
+                                      "zero_point": [-1500, 0, 0]}}
+    return {
+        "welcome": handler_protocols.welcome_message_to_client(1, list(CODECS)),
+        "coordinates": client_protocols.airplane_coordinates_message({"x": 4512, "y": -2875, "z": 3150}),
+        "points": handler_protocols.points_for_airplane_message("NW", (-1500, 1500, 1000), (-2000, 2000, 1000), (-1500, 0, 0)),
+        "airplane_object": client_protocols.message_with_airplane_object(airplane_object),
+        "direction": handler_protocols.direct_airplane_message("Zero point"),
+        "avoid_collision": handler_protocols.avoid_collision_message(),
+        "target_reached": client_protocols.reaching_the_target_message("Initial landing point")
+    }
+
+
+def measure_codec(codec_name, messages, number):
+    """
+    Measures the encoding and decoding of the messages with the codec.
+
+    Parameters:
+    - codec_name (str): Name of the codec.
+    - messages (dict): Names of the messages mapped to the messages.
+    - number (int): Number of encodings and decodings of every message.
+
+    Returns:
+    - dict: Names of the messages mapped to the size of the encoded message and the times of one encoding and decoding, in microseconds.
+    """
+    codec = create_codec(codec_name)
+    results = {}
+    for name, message in messages.items():
+        encoded = codec.encode(message)
+        encode_time = timeit.timeit(lambda: codec.encode(message), number = number)
+        decode_time = timeit.timeit(lambda: codec.decode(encoded), number = number)
+        results[name] = {"size": len(encoded),
+                         "encode_us": encode_time / number * 1e6,
+                         "decode_us": decode_time / number * 1e6}
+    return results
+
+
+def run_benchmark(number = 100000, codecs = None):
+    """
+    Compares the codecs on the real messages.
+
+    Parameters:
+    - number (int): Number of encodings and decodings of every message.
+    - codecs (list, optional): Names of the measured codecs, every available codec if not given.
+
+    Returns:
+    - dict: Names of the codecs mapped to their measurements.
+    """
+    messages = real_messages()
+    return {codec_name: measure_codec(codec_name, messages, number) for codec_name in codecs or CODECS}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Encoding and decoding cost of the messages with every available codec.")
+    parser.add_argument("--number", type = int, default = 100000, help = "Number of encodings and decodings of every message.")
+    parser.add_argument("--codecs", nargs = "+", help = "Measured codecs, every available codec if not given.")
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.number, args.codecs), indent = 4))
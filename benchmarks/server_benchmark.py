@@ -0,0 +1,211 @@
+import argparse
+import json
+import time
+from client_side.fleet_client import FleetAirplane, FleetClient
+from common.config_variables import HOST, PORT
+
+
+def percentiles(values):
+    """
+    Summarizes the measured values.
+
+    Parameters:
+    - values (list): Measured values, in seconds.
+
+    Returns:
+    - dict: Number of values, their 50th, 95th and 99th percentile and the maximum, None values if there are no values.
+    """
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    values = sorted(values)
+    def percentile(fraction):
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+    return {"count": len(values), "p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99), "max": values[-1]}
+
+
+class MeasuredFleetAirplane(FleetAirplane):
+    """
+    Fleet airplane recording the times of its messages.
+
+    Attributes:
+    - accepted_at (float): Monotonic time of the welcome message, None until it comes.
+    - coordinates_sent_at (float): Monotonic time of sending the newest coordinates during the flight,
+      None when they were already answered.
+    - order_requested_at (float): Monotonic time of reporting the initial landing point, None when no order is awaited.
+    """
+
+    def __init__(self, fleet, client_socket, clock):
+        super().__init__(fleet, client_socket, clock)
+        self.accepted_at = None
+        self.coordinates_sent_at = None
+        self.order_requested_at = None
+
+    def send_airplane_coordinates(self, client_socket, sleep_time_in_sec):
+        """
+        Sends the coordinates, noting the time of sending.
+        """
+        self.coordinates_sent_at = time.monotonic()
+        super().send_airplane_coordinates(client_socket, sleep_time_in_sec)
+
+    def send_message_to_server(self, client_socket, data):
+        """
+        Sends the message, noting the time of the report of the initial landing point.
+        """
+        if data["code"] == self.communication_utils.codes["target_reached"]:
+            self.order_requested_at = time.monotonic()
+        super().send_message_to_server(client_socket, data)
+
+    def handle_message(self, message):
+        """
+        Handles the message, measuring the accept time, the round-trips and the commands.
+        The coordinates round-trip is measured on the commands which the tick of the server_side sends in reply
+        to the coordinates, from the newest coordinates sent before the command.
+        """
+        now = time.monotonic()
+        state = self.state
+        if state == "welcome":
+            self.accepted_at = now
+        elif state == "flying":
+            self.fleet.commands += 1
+            codes = self.communication_utils.codes
+            code = self.communication_utils.message_code(message)
+            if code == codes["direction"] and self.order_requested_at is not None:
+                self.fleet.order_round_trips.append(now - self.order_requested_at)
+                self.order_requested_at = None
+            elif code in (codes["avoid_collision"], codes["collision"]) and self.coordinates_sent_at is not None:
+                self.fleet.coordinates_round_trips.append(now - self.coordinates_sent_at)
+                self.coordinates_sent_at = None
+        super().handle_message(message)
+        if state == "direction":
+            self.fleet.handshake_times.append(self.handshake_time)
+            self.fleet.accept_times.append(self.accepted_at)
+
+
+class MeasuredFleetClient(FleetClient):
+    """
+    Fleet client collecting the measurements of its airplanes.
+
+    Attributes:
+    - accept_times (list): Monotonic times of the welcome messages of the airplanes which finished the handshake.
+    - handshake_times (list): Durations of the initial correspondences.
+    - coordinates_round_trips (list): Times from sending the coordinates during the flight to receiving the collision commands.
+    - order_round_trips (list): Times from reporting the initial landing point to receiving the order.
+    - commands (int): Number of messages received during the flights.
+    """
+
+    airplane_class = MeasuredFleetAirplane
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accept_times = []
+        self.handshake_times = []
+        self.coordinates_round_trips = []
+        self.order_round_trips = []
+        self.commands = 0
+
+
+def run_stage(airplanes_number, connections_per_second, duration, host, port, clock_speed):
+    """
+    Flies one stage of the load and measures it.
+
+    Parameters:
+    - airplanes_number (int): Number of airplanes of the stage.
+    - connections_per_second (float): Rate at which the airplanes connect.
+    - duration (float): Length of the stage, in seconds.
+    - host (str): Address of the server_side.
+    - port (int): Port of the server_side.
+    - clock_speed (float): Speed of the airplanes' clock.
+
+    Returns:
+    - dict: Measurements of the stage.
+    """
+    fleet = MeasuredFleetClient(airplanes_number, connections_per_second, host, port, clock_speed)
+    started_at = time.monotonic()
+    statistics = fleet.main(duration)
+    elapsed = time.monotonic() - started_at
+    accept_span = max(fleet.accept_times) - started_at if fleet.accept_times else 0
+    return {
+        "airplanes": airplanes_number,
+        "connections_per_second": connections_per_second,
+        "duration": elapsed,
+        "accept_rate": len(fleet.accept_times) / accept_span if accept_span else 0,
+        "handshake_time": percentiles(fleet.handshake_times),
+        "coordinates_round_trip": percentiles(fleet.coordinates_round_trips),
+        "order_round_trip": percentiles(fleet.order_round_trips),
+        "commands_per_second": fleet.commands / elapsed,
+        "landings_per_minute": statistics["landed"] / elapsed * 60,
+        "fleet": statistics
+    }
+
+
+def is_saturated(stage, handshake_limit):
+    """
+    Checks whether the server_side was saturated during the stage - it sent airplanes away,
+    lost connections, or the 95th percentile of the handshake time went over the limit.
+
+    Returns:
+    - bool: True if the server_side was saturated.
+    """
+    fleet = stage["fleet"]
+    p95 = stage["handshake_time"]["p95"]
+    return fleet["rejected"] > 0 or fleet["failed"] > 0 or fleet["connected"] < fleet["started"] or (p95 is not None and p95 > handshake_limit)
+
+
+def run_benchmark(stages, connections_per_second, duration, host = HOST, port = PORT, clock_speed = 10, handshake_limit = 1):
+    """
+    Ramps the load up stage by stage until the server_side saturates.
+
+    Parameters:
+    - stages (list): Numbers of airplanes of the following stages.
+    - connections_per_second (float): Rate at which the airplanes connect.
+    - duration (float): Length of every stage, in seconds.
+    - host (str): Address of the server_side.
+    - port (int): Port of the server_side.
+    - clock_speed (float): Speed of the airplanes' clock.
+    - handshake_limit (float): Highest acceptable 95th percentile of the handshake time, in seconds.
+
+    Returns:
+    - dict: Settings, measurements of every stage and the saturation point.
+    """
+    results = []
+    saturation = {"saturated": False, "airplanes": None, "max_unsaturated_airplanes": None}
+    for airplanes_number in stages:
+        stage = run_stage(airplanes_number, connections_per_second, duration, host, port, clock_speed)
+        stage["saturated"] = is_saturated(stage, handshake_limit)
+        results.append(stage)
+        if stage["saturated"]:
+            saturation["saturated"] = True
+            saturation["airplanes"] = airplanes_number
+            break
+        saturation["max_unsaturated_airplanes"] = airplanes_number
+    return {
+        "host": host,
+        "port": port,
+        "clock_speed": clock_speed,
+        "connections_per_second": connections_per_second,
+        "stage_duration": duration,
+        "handshake_limit": handshake_limit,
+        "stages": results,
+        "saturation": saturation
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Load benchmark of a running airport server.")
+    parser.add_argument("--host", default = HOST)
+    parser.add_argument("--port", type = int, default = PORT)
+    parser.add_argument("--stages", type = int, nargs = "+", default = [10, 25, 50, 100, 200])
+    parser.add_argument("--connections-per-second", type = float, default = 50)
+    parser.add_argument("--duration", type = float, default = 30, help = "Length of every stage, in seconds.")
+    parser.add_argument("--clock-speed", type = float, default = 10)
+    parser.add_argument("--handshake-limit", type = float, default = 1)
+    parser.add_argument("--output", help = "File for the JSON results, the standard output if not given.")
+    args = parser.parse_args()
+    results = run_benchmark(args.stages, args.connections_per_second, args.duration, args.host, args.port,
+                            args.clock_speed, args.handshake_limit)
+    results_json = json.dumps(results, indent = 4)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(results_json)
+    else:
+        print(results_json)
@@ -1,5 +1,5 @@
-import datetime
 import random
+from common.clock import MonotonicClock
 from common.math_calculation import euclidean_formula, movement_formula
 
 
@@ -9,7 +9,9 @@ class Airplane:
 
     Attributes:
     - client_side: Client handling the airplane's communication with the server_side.
+    - clock: Clock measuring the airplane's fuel.
     - date_of_appearance: Date and time of the airplane's appearance.
+    - time_of_appearance: Monotonic time of the airplane's appearance, in seconds of the clock.
     - id: Identifier of the airplane.
     - x: X-coordinate of the airplane.
     - y: Y-coordinate of the airplane.
@@ -24,16 +26,21 @@ class Airplane:
     - fly_to_waiting_point: Flag indicating whether the airplane is flying to the waiting point.
     """
 
-    def __init__(self, client, coordinates):
+    fuel_time = 10800
+
+    def __init__(self, client, coordinates, clock = None):
         """
         Initializes the airplane object.
 
         Parameters:
         - client_side: Client handling the airplane's communication with the server_side.
         - coordinates: Dictionary containing the initial coordinates of the airplane.
+        - clock: Clock measuring the airplane's fuel, a new MonotonicClock if not given.
         """
         self.client = client
-        self.date_of_appearance = datetime.datetime.now()
+        self.clock = clock or MonotonicClock()
+        self.date_of_appearance = self.clock.now()
+        self.time_of_appearance = self.clock.monotonic()
         self.id = None
         self._x = coordinates["x"]
         self._y = coordinates["y"]
@@ -108,16 +115,19 @@ class Airplane:
         self._z = value
 
     @staticmethod
-    def establish_init_airplane_coordinates():
+    def establish_init_airplane_coordinates(rng = random):
         """
         Generates random initial coordinates for an airplane, ensuring that the airplane appears at the airport boundary
         with a minimum height of 2000.
 
+        Parameters:
+        - rng: Source of the random numbers, the random module or a seeded random.Random instance.
+
         Returns:
         - coordinates_dict: Dictionary containing random initial coordinates for the airplane, including 'x', 'y', and 'z'.
         """
-        height = random.randint(2000, 5000)
-        random_int = random.randint(-5000, 5000)
+        height = rng.randint(2000, 5000)
+        random_int = rng.randint(-5000, 5000)
         constant = 5000
         neg_constant = -5000
         possible_coordinates = [
@@ -126,7 +136,7 @@ class Airplane:
             [constant, random_int, height],
             [neg_constant, random_int, height]
         ]
-        choose_option = random.choice(possible_coordinates)
+        choose_option = rng.choice(possible_coordinates)
         coordinates_dict = {
             "x": choose_option[0],
             "y": choose_option[1],
@@ -149,15 +159,13 @@ class Airplane:
 
     def fuel_consumption(self):
         """
-        Checks the fuel consumption of the airplane based on the time since its appearance.
+        Checks the fuel consumption of the airplane based on the time of the clock since its appearance.
 
         Returns:
         - bool: False if the airplane has been running for more than 3 hours (10800 seconds), indicating it's out of fuel,
                 True otherwise.
         """
-        current_time = datetime.datetime.now()
-        time_difference = current_time - self.date_of_appearance
-        if time_difference >= datetime.timedelta(seconds = 10800):
+        if self.clock.monotonic() - self.time_of_appearance >= self.fuel_time:
             return False
         return True
 
@@ -216,13 +224,56 @@ class Airplane:
         distance = self.count_distance_and_send_airplane_coordinates(client_socket, self.initial_landing_point)
         if distance < 100:
             self.client.send_message_to_server(client_socket, self.client.communication_utils.reaching_the_target_message("Initial landing point"))
-            order_from_server = self.client.read_message_from_server(client_socket)
             self.fly_to_initial_landing_point = False
-            if "Waiting point" in order_from_server["data"]:
-                self.fly_to_waiting_point = True
-            elif "Zero point" in order_from_server["data"]:
-                self.fly_to_runaway = True
-                self.speed = 75
+            order_from_server = self.read_landing_order(client_socket)
+            if order_from_server is not None:
+                self.follow_landing_order(order_from_server)
+
+    def read_landing_order(self, client_socket):
+        """
+        Waits for the order of the server_side after the airplane reported the initial landing point.
+        The server_side's tick sends its commands at any moment, so the messages coming before the order
+        are passed to the client_side's handlers of the messages the server_side sends on its own.
+
+        Parameters:
+        - client_socket: The socket used for communication with the client_side.
+
+        Returns:
+        - dict or None: The order, None if the client_side doesn't wait for it or was stopped before it came.
+        """
+        communication_utils = self.client.communication_utils
+        message = self.client.read_message_from_server(client_socket)
+        while message is not None and communication_utils.message_code(message) != communication_utils.codes["direction"]:
+            handler = self.client.additional_message_handlers.get(communication_utils.message_code(message))
+            if handler is not None:
+                handler(client_socket, message)
+            if not self.client.is_running:
+                return None
+            message = self.client.read_message_from_server(client_socket)
+        return message
+
+    def follow_landing_order(self, order_from_server):
+        """
+        Directs the airplane to the waiting point or to the zero point, as the server_side ordered
+        after the airplane reached the initial landing point.
+        A client which doesn't wait for the order passes it here when it comes, until then the airplane holds its position.
+
+        Parameters:
+        - order_from_server: The order message from the server_side.
+        """
+        if "Waiting point" in order_from_server["data"]:
+            self.fly_to_waiting_point = True
+        elif "Zero point" in order_from_server["data"]:
+            self.direct_to_zero_point()
+
+    def direct_to_zero_point(self):
+        """
+        Switches the airplane to the landing approach, also when the order comes while it's flying to the waiting point.
+        """
+        self.fly_to_initial_landing_point = False
+        self.fly_to_waiting_point = False
+        self.fly_to_runaway = True
+        self.speed = 75
 
     def direct_to_waiting_point(self, client_socket):
         """
@@ -1,8 +1,10 @@
 import selectors
 import socket as s
-import time
-from common.config_variables import HOST, PORT, INTERNET_ADDRESS_FAMILY, SOCKET_TYPE, BUFFER, encode_format, log_file
+from common.clock import create_clock
+from common.config_variables import HOST, PORT, INTERNET_ADDRESS_FAMILY, SOCKET_TYPE, BUFFER, CLOCK_SPEED, encode_format, log_file
 from common.logger_config import logger_config
+from common.message_framing import FrameReader, frame_message, frame_telemetry
+from common.serialization_codecs import choose_codec
 from common.serialization_utils import SerializeUtils
 from client_side.airplane import Airplane
 from client_side.client_messages import ClientProtocols
@@ -21,14 +23,21 @@ class Client:
     - encode_format (str): The encoding format for messages.
     - logger: The logger object.
     - selector (selectors.DefaultSelector): The selector for monitoring read events.
+    - frame_reader (FrameReader): Decoder of length-prefixed messages, with the reusable receive buffer of the connection.
     - is_running (bool): Flag indicating whether the client_side is running.
     - communication_utils (ClientProtocols): Utility class for client_side-server_side communication.
     - airplane (Airplane): The airplane object associated with the client_side.
+    - telemetry (bool): Flag indicating whether the server_side accepts binary telemetry frames with the coordinates.
+    - telemetry_sequence (int): Sequence number of the last sent telemetry frame.
+    - additional_message_handlers (dict): Codes of the messages the server_side sends on its own mapped to their handlers.
     """
 
-    def __init__(self):
+    def __init__(self, clock = None):
         """
         Initializes the Client object.
+
+        Parameters:
+        - clock: Clock pacing the airplane and measuring its fuel, created for the CLOCK_SPEED if not given.
         """
         self.HOST = HOST
         self.PORT = PORT
@@ -38,10 +47,20 @@ class Client:
         self.encode_format = encode_format
         self.logger = logger_config("Client", log_file, "client_logs.log")
         self.selector = selectors.DefaultSelector()
+        self.frame_reader = FrameReader()
         self.serialize_utils = SerializeUtils()
         self.is_running = True
         self.communication_utils = ClientProtocols()
-        self.airplane = Airplane(self, Airplane.establish_init_airplane_coordinates())
+        self.clock = clock or create_clock(CLOCK_SPEED)
+        self.airplane = Airplane(self, Airplane.establish_init_airplane_coordinates(), self.clock)
+        self.telemetry = False
+        self.telemetry_sequence = 0
+        codes = self.communication_utils.codes
+        self.additional_message_handlers = {
+            codes["avoid_collision"]: self.handle_avoid_collision,
+            codes["direction"]: self.handle_direction,
+            codes["collision"]: self.handle_collision
+        }
 
     def read_message_from_server(self, client_socket):
         """
@@ -53,7 +72,7 @@ class Client:
         Returns:
         - dict: The message received from the server_side.
         """
-        message_from_server_json = client_socket.recv(self.BUFFER)
+        message_from_server_json = self.frame_reader.read_message(client_socket)
         deserialized_message = self.serialize_utils.deserialize_json(message_from_server_json)
         self.logger.info(f"Client_{self.airplane.id} message from server: >{deserialized_message}<")
         return deserialized_message
@@ -67,7 +86,7 @@ class Client:
         - data (dict): The data to be sent to the server_side.
         """
         client_request = self.serialize_utils.serialize_to_json(data)
-        client_socket.sendall(client_request)
+        client_socket.sendall(frame_message(client_request))
 
     def initial_correspondence_with_server(self, client_socket):
         """
@@ -77,30 +96,55 @@ class Client:
         - client_socket (socket): The client_side socket.
         """
         server_response = self.read_message_from_server(client_socket)
-        if "Airport`s full, you have to fly to another..." in server_response["message"]:
+        if self.communication_utils.message_code(server_response) == self.communication_utils.codes["airport_is_full"]:
             self.stop(client_socket)
         else:
             self.airplane.id = server_response["data"]
-            self.send_airplane_coordinates(client_socket, 0)
+            self.send_initial_airplane_coordinates(client_socket, server_response.get("codecs"))
             self.establish_initial_airplane_points(client_socket)
             self.send_airplane_obj_to_server(client_socket)
             self.read_message_from_server(client_socket)
+            self.telemetry = server_response.get("telemetry", False)
             self.airplane.fly_to_initial_landing_point = True
 
     def send_airplane_coordinates(self, client_socket, sleep_time_in_sec):
         """
-        Sends the current coordinates of the airplane to the server_side.
+        Sends the current coordinates of the airplane to the server_side, in a binary telemetry frame
+        if the server_side accepts them.
+
+        Parameters:
+        - client_socket (socket): The client_side socket.
+        """
+        if self.telemetry:
+            self.telemetry_sequence += 1
+            client_socket.sendall(frame_telemetry(self.airplane.id, self.telemetry_sequence, self.airplane.x, self.airplane.y, self.airplane.z))
+        else:
+            coordinates = self.communication_utils.airplane_coordinates_message(
+                {"x": self.airplane.x,
+                 "y": self.airplane.y,
+                 "z": self.airplane.z}
+            )
+            self.send_message_to_server(client_socket, coordinates)
+        self.clock.sleep(sleep_time_in_sec)
+
+    def send_initial_airplane_coordinates(self, client_socket, offered_codecs):
+        """
+        Sends the first coordinates of the airplane together with the codec chosen from the ones offered by the server_side,
+        and switches to that codec for the next messages.
 
         Parameters:
         - client_socket (socket): The client_side socket.
+        - offered_codecs (list or None): Names of the codecs offered in the welcome message, None from an older server_side.
         """
+        codec = choose_codec(offered_codecs)
         coordinates = self.communication_utils.airplane_coordinates_message(
             {"x": self.airplane.x,
              "y": self.airplane.y,
-             "z": self.airplane.z}
+             "z": self.airplane.z},
+            codec
         )
         self.send_message_to_server(client_socket, coordinates)
-        time.sleep(sleep_time_in_sec)
+        self.serialize_utils.set_codec(codec)
 
     def establish_initial_airplane_points(self, client_socket):
         """
@@ -125,33 +169,55 @@ class Client:
     def check_additional_messages_from_server(self):
         """
         Checks for additional messages from the server_side.
+        Messages already decoded from a previous read are returned first, without touching the socket.
 
         Returns:
         - dict or None: The message received from the server_side if available, otherwise None.
         """
-        events = self.selector.select(timeout = 0)
-        if events:
+        if not self.frame_reader.has_messages():
+            events = self.selector.select(timeout = 0)
             for key, mask in events:
                 if key.data is None:
-                    server_message_json = key.fileobj.recv(self.BUFFER)
-                    server_message = self.serialize_utils.deserialize_json(server_message_json)
-                    self.logger.info(f"Client_{self.airplane.id} message from server: >{server_message}<")
-                    return server_message
+                    self.frame_reader.receive(key.fileobj)
+        if self.frame_reader.has_messages():
+            server_message_json = self.frame_reader.messages.popleft()
+            server_message = self.serialize_utils.deserialize_json(server_message_json)
+            self.logger.info(f"Client_{self.airplane.id} message from server: >{server_message}<")
+            return server_message
 
     def handling_additional_messages_from_server(self, client_socket):
         """
-        Handles additional messages received from the server_side.
+        Handles all additional messages received from the server_side, including several messages decoded from one read.
 
         Parameters:
         - client_socket (socket): The client_side socket used for communication with the server_side.
         """
         event_message = self.check_additional_messages_from_server()
-        if event_message is not None:
-            if "You`re to close to another airplane ! Correct your flight." in event_message["message"]:
-                self.airplane.avoid_collision(100)
-            elif "Crash !..." in event_message["message"]:
-                self.send_message_to_server(client_socket, self.communication_utils.crash_message())
-                self.is_running = False
+        while event_message is not None and self.is_running:
+            handler = self.additional_message_handlers.get(self.communication_utils.message_code(event_message))
+            if handler is not None:
+                handler(client_socket, event_message)
+            event_message = self.check_additional_messages_from_server()
+
+    def handle_avoid_collision(self, client_socket, message):
+        """
+        Corrects the flight of the airplane, which is too close to another one.
+        """
+        self.airplane.avoid_collision(100)
+
+    def handle_direction(self, client_socket, message):
+        """
+        Sends the airplane to the zero point, when the server_side directs it there on its own.
+        """
+        if message["data"] == "Zero point":
+            self.airplane.direct_to_zero_point()
+
+    def handle_collision(self, client_socket, message):
+        """
+        Reports the crash of the airplane to the server_side and stops the client_side.
+        """
+        self.send_message_to_server(client_socket, self.communication_utils.crash_message())
+        self.is_running = False
 
     def main(self):
         """
@@ -11,17 +11,22 @@ class ClientProtocols(MessageTemplate):
     def __init__(self):
         super().__init__()
 
-    def airplane_coordinates_message(self, coordinates):
+    def airplane_coordinates_message(self, coordinates, codec = None):
         """
         Generates a message containing airplane coordinates.
 
         Parameters:
         - coordinates (dict): Dictionary containing airplane coordinates.
+        - codec (str, optional): Name of the codec chosen for the next messages, sent with the first coordinates.
 
         Returns:
         dict: A communication protocol template indicating the airplane's coordinates.
         """
-        return self.protocol_template(status = self.status["success_status"], message = "Our coordinates: ", data = coordinates)
+        message = self.protocol_template(status = self.status["success_status"], message = "Our coordinates: ", data = coordinates,
+                                         code = self.codes["coordinates"])
+        if codec is not None:
+            message["codec"] = codec
+        return message
 
     def message_with_airplane_object(self, object):
         """
@@ -33,7 +38,8 @@ class ClientProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template containing airplane data.
         """
-        return self.protocol_template(status = self.status["success_status"], message = "Our data: ", data = object)
+        return self.protocol_template(status = self.status["success_status"], message = "Our data: ", data = object,
+                                      code = self.codes["airplane_object"])
 
     def reaching_the_target_message(self, target):
         """
@@ -45,7 +51,8 @@ class ClientProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating the airplane has reached the target.
         """
-        return self.protocol_template(status = self.status["success_status"], message = "We reached the target: ", data = target)
+        return self.protocol_template(status = self.status["success_status"], message = "We reached the target: ", data = target,
+                                      code = self.codes["target_reached"])
 
     def successfully_landing_message(self):
         """
@@ -54,7 +61,8 @@ class ClientProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating successful airplane landing.
         """
-        return self.protocol_template(status = self.status["success_status"], message = "We was successfully landed")
+        return self.protocol_template(status = self.status["success_status"], message = "We was successfully landed",
+                                      code = self.codes["landed"])
 
     def out_of_fuel_message(self):
         """
@@ -63,7 +71,8 @@ class ClientProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating the airplane is out of fuel.
         """
-        return self.protocol_template(status = self.status["error_status"], message = "Out of fuel ! We`re falling...")
+        return self.protocol_template(status = self.status["error_status"], message = "Out of fuel ! We`re falling...",
+                                      code = self.codes["out_of_fuel"])
 
     def crash_message(self):
         """
@@ -72,4 +81,5 @@ class ClientProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating a crash has occurred.
         """
-        return self.protocol_template(status = self.status["error_status"], message = "Crash ! Bye, bye...")
+        return self.protocol_template(status = self.status["error_status"], message = "Crash ! Bye, bye...",
+                                      code = self.codes["crash"])
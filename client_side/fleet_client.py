@@ -0,0 +1,343 @@
+import heapq
+import itertools
+import selectors
+import socket as s
+import time
+from common.clock import create_clock
+from common.config_variables import HOST, PORT, INTERNET_ADDRESS_FAMILY, SOCKET_TYPE, CLOCK_SPEED, log_file
+from common.logger_config import logger_config
+from common.message_framing import FrameReader, frame_message, frame_telemetry
+from common.serialization_codecs import choose_codec
+from common.serialization_utils import SerializeUtils
+from client_side.airplane import Airplane
+from client_side.client_messages import ClientProtocols
+
+
+class FleetAirplane:
+    """
+    One airplane of the fleet with its non-blocking connection. For the Airplane it plays the role of the Client,
+    but it never waits: messages are written to the outgoing buffer of the connection, and the server_side's
+    messages are handled by the fleet's loop as they come.
+
+    Attributes:
+    - fleet: FleetClient driving the airplane.
+    - socket (socket): Non-blocking socket of the connection.
+    - airplane (Airplane): The airplane.
+    - frame_reader (FrameReader): Decoder of the messages received from the server_side.
+    - outgoing (bytearray): Framed messages waiting to be written to the socket.
+    - state (str): Stage of the connection - "welcome", "points", "direction" or "flying".
+    - is_running (bool): Flag indicating whether the airplane is still flying.
+    - communication_utils (ClientProtocols): Messages of the client_side, shared by the whole fleet.
+    - serialize_utils (SerializeUtils): Serialization of the messages, with the codec negotiated for this connection.
+    - telemetry (bool): Flag indicating whether the server_side accepts binary telemetry frames with the coordinates.
+    - telemetry_sequence (int): Sequence number of the last sent telemetry frame.
+    - connected_at (float): Monotonic time of the start of the connection.
+    - handshake_time (float): Duration of the initial correspondence, None until it's finished.
+    """
+
+    def __init__(self, fleet, client_socket, clock):
+        """
+        Initializes the airplane of the fleet.
+
+        Parameters:
+        - fleet: FleetClient driving the airplane.
+        - client_socket (socket): Non-blocking socket of the connection.
+        - clock: Clock measuring the airplane's fuel.
+        """
+        self.fleet = fleet
+        self.socket = client_socket
+        self.airplane = Airplane(self, Airplane.establish_init_airplane_coordinates(), clock)
+        self.frame_reader = FrameReader()
+        self.outgoing = bytearray()
+        self.state = "welcome"
+        self.is_running = True
+        self.communication_utils = fleet.communication_utils
+        self.serialize_utils = SerializeUtils()
+        self.telemetry = False
+        self.telemetry_sequence = 0
+        self.connected_at = time.monotonic()
+        self.handshake_time = None
+
+    def send_message_to_server(self, client_socket, data):
+        """
+        Queues the message for the server_side and writes as much as the socket takes at once.
+
+        Parameters:
+        - client_socket (socket): The socket of the connection.
+        - data (dict): The data to be sent to the server_side.
+        """
+        self.outgoing += frame_message(self.serialize_utils.serialize_to_json(data))
+        self.fleet.flush(self)
+
+    def send_airplane_coordinates(self, client_socket, sleep_time_in_sec):
+        """
+        Sends the current coordinates of the airplane, in a binary telemetry frame if the server_side accepts them.
+        There is no sleep, the fleet's loop paces the airplanes.
+        """
+        if self.telemetry:
+            self.telemetry_sequence += 1
+            self.outgoing += frame_telemetry(self.airplane.id, self.telemetry_sequence, self.airplane.x, self.airplane.y, self.airplane.z)
+            self.fleet.flush(self)
+        else:
+            coordinates = self.communication_utils.airplane_coordinates_message({"x": self.airplane.x,
+                                                                                "y": self.airplane.y,
+                                                                                "z": self.airplane.z})
+            self.send_message_to_server(client_socket, coordinates)
+
+    def send_initial_airplane_coordinates(self, client_socket, offered_codecs):
+        """
+        Sends the first coordinates of the airplane together with the codec chosen from the ones offered by the server_side,
+        and switches to that codec for the next messages.
+        """
+        codec = choose_codec(offered_codecs)
+        coordinates = self.communication_utils.airplane_coordinates_message({"x": self.airplane.x,
+                                                                            "y": self.airplane.y,
+                                                                            "z": self.airplane.z},
+                                                                           codec)
+        self.send_message_to_server(client_socket, coordinates)
+        self.serialize_utils.set_codec(codec)
+
+    def read_message_from_server(self, client_socket):
+        """
+        The fleet doesn't wait for replies, the order comes later to handle_message.
+
+        Returns:
+        - None
+        """
+        return None
+
+    def stop(self, client_socket):
+        """
+        Stops the airplane, its connection is closed by the fleet when the outgoing buffer is written.
+        """
+        self.is_running = False
+
+    def handle_message(self, message):
+        """
+        Handles the message of the server_side, depending on the stage of the connection.
+
+        Parameters:
+        - message (dict): The message of the server_side.
+        """
+        codes = self.communication_utils.codes
+        code = self.communication_utils.message_code(message)
+        if self.state == "welcome":
+            if code == codes["airport_is_full"]:
+                self.fleet.statistics["rejected"] += 1
+                self.stop(self.socket)
+                return
+            self.airplane.id = message["data"]
+            self.send_initial_airplane_coordinates(self.socket, message.get("codecs"))
+            self.telemetry = message.get("telemetry", False)
+            self.state = "points"
+        elif self.state == "points":
+            self.airplane.set_points(message)
+            self.send_message_to_server(self.socket, self.communication_utils.message_with_airplane_object(self.airplane.parse_airplane_obj_to_json()))
+            self.state = "direction"
+        elif self.state == "direction":
+            self.airplane.fly_to_initial_landing_point = True
+            self.state = "flying"
+            self.handshake_time = time.monotonic() - self.connected_at
+            self.fleet.statistics["connected"] += 1
+            self.fleet.schedule(self.fleet.step_interval, self.fleet.step_airplane, self)
+        elif code == codes["direction"]:
+            self.airplane.follow_landing_order(message)
+        elif code == codes["avoid_collision"]:
+            self.airplane.avoid_collision(100)
+        elif code == codes["collision"]:
+            self.send_message_to_server(self.socket, self.communication_utils.crash_message())
+            self.fleet.statistics["crashed"] += 1
+            self.stop(self.socket)
+
+
+class FleetClient:
+    """
+    Client flying many airplanes from one process. All connections are non-blocking and driven by a single
+    selectors loop, every airplane makes one step of its airplane_movement_manager per step interval,
+    scheduled on a timer heap instead of sleeping.
+
+    Attributes:
+    - airplane_class: Class of the fleet's airplanes, subclasses of FleetAirplane can measure or change their behaviour.
+    - airplanes_number (int): Number of airplanes of the fleet.
+    - connections_per_second (float): Rate at which the airplanes connect, None to connect all at once.
+    - HOST (str): The address of the server_side.
+    - PORT (int): The port of the server_side.
+    - clock: Clock shared by the airplanes, measuring their fuel.
+    - step_interval (float): Real seconds between two steps of an airplane, one second of the clock.
+    - logger: The logger object.
+    - selector (selectors.DefaultSelector): Selector of all connections.
+    - communication_utils (ClientProtocols): Messages of the client_side.
+    - timers (list): Heap of [monotonic time, order, callback, argument] entries.
+    - order (itertools.count): Tiebreaker of the timers with the same time.
+    - airplanes (set): Airplanes with open connections.
+    - statistics (dict): Numbers of started, connected, rejected, landed, crashed and failed airplanes.
+    """
+
+    airplane_class = FleetAirplane
+
+    def __init__(self, airplanes_number, connections_per_second = None, host = HOST, port = PORT, clock_speed = CLOCK_SPEED):
+        """
+        Initializes the fleet.
+
+        Parameters:
+        - airplanes_number (int): Number of airplanes of the fleet.
+        - connections_per_second (float): Rate at which the airplanes connect, None to connect all at once.
+        - host (str): The address of the server_side.
+        - port (int): The port of the server_side.
+        - clock_speed (float): Speed of the fleet's clock.
+        """
+        self.airplanes_number = airplanes_number
+        self.connections_per_second = connections_per_second
+        self.HOST = host
+        self.PORT = port
+        self.clock = create_clock(clock_speed)
+        self.step_interval = 1 / clock_speed
+        self.logger = logger_config("FleetClient", log_file, "client_logs.log")
+        self.selector = selectors.DefaultSelector()
+        self.communication_utils = ClientProtocols()
+        self.timers = []
+        self.order = itertools.count()
+        self.airplanes = set()
+        self.statistics = {"started": 0, "connected": 0, "rejected": 0, "landed": 0, "crashed": 0, "out_of_fuel": 0, "failed": 0}
+
+    def schedule(self, delay, callback, argument = None):
+        """
+        Runs the callback with the argument after the delay, in seconds.
+        """
+        heapq.heappush(self.timers, [time.monotonic() + delay, next(self.order), callback, argument])
+
+    def open_connection(self, argument = None):
+        """
+        Starts a non-blocking connection of a new airplane.
+        """
+        client_socket = s.socket(INTERNET_ADDRESS_FAMILY, SOCKET_TYPE)
+        client_socket.setblocking(False)
+        client_socket.connect_ex((self.HOST, self.PORT))
+        fleet_airplane = self.airplane_class(self, client_socket, self.clock)
+        self.airplanes.add(fleet_airplane)
+        self.selector.register(client_socket, selectors.EVENT_READ, data = fleet_airplane)
+        self.statistics["started"] += 1
+
+    def close_connection(self, fleet_airplane):
+        """
+        Closes the connection of the airplane.
+        """
+        fleet_airplane.is_running = False
+        if fleet_airplane in self.airplanes:
+            self.airplanes.discard(fleet_airplane)
+            self.selector.unregister(fleet_airplane.socket)
+            fleet_airplane.socket.close()
+
+    def flush(self, fleet_airplane):
+        """
+        Writes the outgoing buffer of the airplane as far as the socket takes it, and waits for the socket
+        to be writable again when something is left.
+        """
+        try:
+            sent = fleet_airplane.socket.send(fleet_airplane.outgoing)
+            del fleet_airplane.outgoing[:sent]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            self.logger.warning(f"Connection of Airplane_{fleet_airplane.airplane.id} failed: {e}")
+            self.statistics["failed"] += 1
+            self.close_connection(fleet_airplane)
+            return
+        events = selectors.EVENT_READ | selectors.EVENT_WRITE if fleet_airplane.outgoing else selectors.EVENT_READ
+        if fleet_airplane in self.airplanes:
+            self.selector.modify(fleet_airplane.socket, events, data = fleet_airplane)
+            if not fleet_airplane.outgoing and not fleet_airplane.is_running:
+                self.close_connection(fleet_airplane)
+
+    def receive(self, fleet_airplane):
+        """
+        Reads the data from the socket of the airplane and handles every complete message.
+        """
+        try:
+            fleet_airplane.frame_reader.receive(fleet_airplane.socket)
+        except (BlockingIOError, InterruptedError):
+            return
+        except (ConnectionError, OSError) as e:
+            if fleet_airplane.is_running:
+                self.logger.warning(f"Connection of Airplane_{fleet_airplane.airplane.id} lost: {e}")
+                self.statistics["failed"] += 1
+            self.close_connection(fleet_airplane)
+            return
+        while fleet_airplane.frame_reader.has_messages() and fleet_airplane.is_running:
+            message = fleet_airplane.serialize_utils.deserialize_json(fleet_airplane.frame_reader.messages.popleft())
+            fleet_airplane.handle_message(message)
+        if not fleet_airplane.is_running:
+            self.flush(fleet_airplane)
+
+    def step_airplane(self, fleet_airplane):
+        """
+        Makes one step of the airplane's movement and schedules the next one.
+        """
+        if not fleet_airplane.is_running:
+            return
+        airplane = fleet_airplane.airplane
+        landing = airplane.fly_to_runaway
+        airplane.airplane_movement_manager(fleet_airplane.socket)
+        if not fleet_airplane.is_running:
+            self.statistics["landed" if landing and airplane.fuel_consumption() else "out_of_fuel"] += 1
+            self.flush(fleet_airplane)
+        else:
+            self.schedule(self.step_interval, self.step_airplane, fleet_airplane)
+
+    def run_due_timers(self):
+        """
+        Runs the callbacks of the timers whose time has come.
+        """
+        now = time.monotonic()
+        while self.timers and self.timers[0][0] <= now:
+            due_time, order, callback, argument = heapq.heappop(self.timers)
+            callback(argument)
+
+    def time_to_next_timer(self):
+        """
+        Returns:
+        - float or None: Seconds left to the next timer, None if there are no timers.
+        """
+        if not self.timers:
+            return None
+        return max(0, self.timers[0][0] - time.monotonic())
+
+    def main(self, duration = None):
+        """
+        Connects the airplanes and flies them until the last one has landed, crashed or was sent away,
+        or until the duration passes.
+
+        Parameters:
+        - duration (float): Maximum running time in seconds, None to fly all airplanes to the end.
+
+        Returns:
+        - dict: The statistics of the fleet.
+        """
+        for number in range(self.airplanes_number):
+            delay = number / self.connections_per_second if self.connections_per_second else 0
+            self.schedule(delay, self.open_connection)
+        end_time = None if duration is None else time.monotonic() + duration
+        try:
+            while (self.airplanes or self.timers) and (end_time is None or time.monotonic() < end_time):
+                timeout = self.time_to_next_timer()
+                if end_time is not None:
+                    remaining_time = max(0, end_time - time.monotonic())
+                    timeout = remaining_time if timeout is None else min(timeout, remaining_time)
+                for key, mask in self.selector.select(timeout = timeout):
+                    fleet_airplane = key.data
+                    if mask & selectors.EVENT_WRITE:
+                        self.flush(fleet_airplane)
+                    if mask & selectors.EVENT_READ and fleet_airplane in self.airplanes:
+                        self.receive(fleet_airplane)
+                self.run_due_timers()
+        finally:
+            for fleet_airplane in list(self.airplanes):
+                self.close_connection(fleet_airplane)
+            self.selector.close()
+        self.logger.info(f"Fleet statistics: {self.statistics}")
+        return self.statistics
+
+
+if __name__ == "__main__":
+    fleet_client = FleetClient(500, connections_per_second = 50)
+    print(fleet_client.main())
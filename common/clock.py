@@ -0,0 +1,167 @@
+import datetime
+import time
+
+
+class WallClock:
+    """
+    Clock following the system's date and time. Its monotonic time is still taken from time.monotonic,
+    so the measured durations don't jump when the system time is changed.
+    """
+
+    def now(self):
+        """
+        Returns:
+        - datetime: Current date and time.
+        """
+        return datetime.datetime.now()
+
+    def monotonic(self):
+        """
+        Returns:
+        - float: Seconds from an arbitrary point, never going back.
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        """
+        Waits for the given number of seconds.
+        """
+        time.sleep(seconds)
+
+    def real_seconds(self, seconds):
+        """
+        Converts the clock's seconds to real seconds, for the waits which the clock doesn't do itself,
+        e.g. the timeout of a selector.
+
+        Returns:
+        - float: Number of real seconds.
+        """
+        return seconds
+
+
+class MonotonicClock(WallClock):
+    """
+    Clock reading the date only once, at its creation. Later dates are counted from the monotonic time,
+    so asking for the date is cheap and the dates never go back.
+
+    Attributes:
+    - start_date (datetime): Date and time of the clock's creation.
+    - start_time (float): Monotonic time of the clock's creation.
+    """
+
+    def __init__(self):
+        """
+        Initializes the clock with the current date and monotonic time.
+        """
+        self.start_date = datetime.datetime.now()
+        self.start_time = time.monotonic()
+
+    def now(self):
+        """
+        Returns:
+        - datetime: Current date and time, counted from the creation of the clock.
+        """
+        return self.start_date + datetime.timedelta(seconds = self.monotonic() - self.start_time)
+
+
+class AcceleratedClock(MonotonicClock):
+    """
+    Clock running faster than the real time - with the speed of 100, one real second is 100 seconds of the clock.
+    Sleeping for 100 seconds of the clock takes one real second.
+
+    Attributes:
+    - speed (float): Number of the clock's seconds in one real second.
+    """
+
+    def __init__(self, speed):
+        """
+        Initializes the clock.
+
+        Parameters:
+        - speed (float): Number of the clock's seconds in one real second.
+        """
+        super().__init__()
+        self.speed = speed
+
+    def monotonic(self):
+        """
+        Returns:
+        - float: Seconds of the clock from an arbitrary point, never going back.
+        """
+        return self.start_time + (time.monotonic() - self.start_time) * self.speed
+
+    def sleep(self, seconds):
+        """
+        Waits for the given number of the clock's seconds.
+        """
+        time.sleep(seconds / self.speed)
+
+    def real_seconds(self, seconds):
+        """
+        Returns:
+        - float: Number of real seconds in the given number of the clock's seconds.
+        """
+        return seconds / self.speed
+
+
+class VirtualClock(MonotonicClock):
+    """
+    Clock which moves only when it's told to - by advance or by sleep, which returns at once.
+    It's the clock of the simulations and tests.
+
+    Attributes:
+    - current_time (float): Current monotonic time of the clock, in seconds.
+    """
+
+    def __init__(self, start_date = datetime.datetime(2024, 1, 1), start_time = 0):
+        """
+        Initializes the clock.
+
+        Parameters:
+        - start_date (datetime): Date and time at the start time of the clock.
+        - start_time (float): Monotonic time of the clock at its start.
+        """
+        self.start_date = start_date
+        self.start_time = start_time
+        self.current_time = start_time
+
+    def monotonic(self):
+        """
+        Returns:
+        - float: Current time of the clock, in seconds.
+        """
+        return self.current_time
+
+    def advance(self, seconds):
+        """
+        Moves the clock forward by the given number of seconds.
+        """
+        self.current_time += seconds
+
+    def sleep(self, seconds):
+        """
+        Moves the clock forward by the given number of seconds, without waiting.
+        """
+        self.advance(seconds)
+
+    def real_seconds(self, seconds):
+        """
+        Returns:
+        - float: 0, the virtual time doesn't need real waiting.
+        """
+        return 0
+
+
+def create_clock(speed = 1):
+    """
+    Creates the clock for the given speed of time.
+
+    Parameters:
+    - speed (float): Number of the clock's seconds in one real second.
+
+    Returns:
+    - MonotonicClock or AcceleratedClock: Real time clock for the speed of 1, accelerated clock otherwise.
+    """
+    if speed == 1:
+        return MonotonicClock()
+    return AcceleratedClock(speed)
@@ -12,6 +12,21 @@ PORT: int
 BUFFER: int
     The size of the buffer used for sending and receiving data over sockets.
 
+RECEIVE_BUFFER_SIZE: int
+    The initial size of the reusable receive buffer kept for every socket.
+
+HEADER_FORMAT: str
+    The struct format of the length prefix sent before every message.
+
+TELEMETRY_FORMAT: str
+    The struct format of the binary telemetry frame - tag, airplane id, sequence number and x, y, z coordinates.
+
+TELEMETRY_TAG: int
+    The first byte of a telemetry frame, which never starts a JSON or MessagePack message.
+
+MAX_MESSAGE_SIZE: int
+    The maximum accepted size of a single message, in bytes.
+
 encode_format: str
     The encoding format used for encoding and decoding strings.
 
@@ -23,18 +38,51 @@ SOCKET_TYPE: int
 
 db_file: str
     The filename of the SQLite database file used for storing airport-related data.
+
+flights_dir: str
+    The directory of the flight recordings, with a directory of memory-mapped column files for every server_side period.
+
+CLOCK_SPEED: float
+    The speed of the time of servers and clients, taken from the AIRPORT_CLOCK_SPEED environment variable.
+    With the speed of 100 a whole airport run is replayed 100 times faster.
+
+SERIALIZATION_CODECS: list
+    Names of the codecs of the messages in the order of preference, taken from the comma separated
+    AIRPORT_CODECS environment variable. The codecs which aren't installed are skipped, json is always the last resort.
+
+DB_PROFILES: dict
+    Names of the SQLite tuning profiles mapped to the pragmas applied to every new database connection.
+    The performance profile journals to a write-ahead log, so the readers of the APIs don't block the server_side's writes,
+    and syncs to the disk at the checkpoints only. The durable profile syncs every transaction.
+
+DB_PROFILE: str
+    Name of the SQLite tuning profile of the connections, taken from the AIRPORT_DB_PROFILE environment variable.
 """
 
 HOST = "127.0.0.1"
 PORT = 65432
 BUFFER = 1024
+RECEIVE_BUFFER_SIZE = 64 * BUFFER
+HEADER_FORMAT = "!I"
+TELEMETRY_FORMAT = "!BIIiii"
+TELEMETRY_TAG = 1
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
 encode_format = "UTF-8"
 INTERNET_ADDRESS_FAMILY = s.AF_INET
 SOCKET_TYPE = s.SOCK_STREAM
+CLOCK_SPEED = float(os.environ.get("AIRPORT_CLOCK_SPEED", 1))
+SERIALIZATION_CODECS = os.environ.get("AIRPORT_CODECS", "msgpack,orjson,json").split(",")
+DB_PROFILES = {
+    "performance": {"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 5000,
+                    "mmap_size": 256 * 1024 * 1024, "cache_size": -16 * 1024, "temp_store": "MEMORY"},
+    "durable": {"journal_mode": "WAL", "synchronous": "FULL", "busy_timeout": 5000}
+}
+DB_PROFILE = os.environ.get("AIRPORT_DB_PROFILE", "performance")
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 db_file = os.path.join(DATA_DIR, "airport_db.db")
+flights_dir = os.path.join(DATA_DIR, "flights")
 
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 log_file = os.path.join(LOG_DIR)
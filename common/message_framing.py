@@ -0,0 +1,174 @@
+import struct
+from collections import deque
+from common.config_variables import RECEIVE_BUFFER_SIZE, HEADER_FORMAT, MAX_MESSAGE_SIZE, TELEMETRY_FORMAT, TELEMETRY_TAG
+
+
+HEADER = struct.Struct(HEADER_FORMAT)
+TELEMETRY = struct.Struct(TELEMETRY_FORMAT)
+TELEMETRY_FRAME = struct.Struct(HEADER_FORMAT + TELEMETRY_FORMAT[1:])
+
+
+def frame_message(payload):
+    """
+    Prefixes the payload with its length, so the receiver knows where the message ends.
+
+    Parameters:
+    - payload (bytes): The serialized message.
+
+    Returns:
+    - bytes: The length prefix followed by the payload.
+    """
+    return HEADER.pack(len(payload)) + payload
+
+
+def frame_telemetry(airplane_id, sequence, x, y, z):
+    """
+    Packs the coordinates of the airplane into a framed binary telemetry message, with a single struct call.
+
+    Parameters:
+    - airplane_id (int): Identifier of the airplane.
+    - sequence (int): Number of the telemetry frame, growing with every frame of the airplane.
+    - x (int): The x coordinate of the airplane.
+    - y (int): The y coordinate of the airplane.
+    - z (int): The z coordinate of the airplane.
+
+    Returns:
+    - bytes: The length prefix followed by the telemetry frame.
+    """
+    return TELEMETRY_FRAME.pack(TELEMETRY.size, TELEMETRY_TAG, airplane_id, sequence, x, y, z)
+
+
+def is_telemetry(payload):
+    """
+    Checks whether the payload is a binary telemetry frame.
+
+    Parameters:
+    - payload (bytes): The payload of a message.
+
+    Returns:
+    - bool: True if the payload is a telemetry frame, False otherwise.
+    """
+    return len(payload) == TELEMETRY.size and payload[0] == TELEMETRY_TAG
+
+
+class FrameReader:
+    """
+    Incremental decoder of length-prefixed messages received from a single socket.
+
+    Data is received with recv_into straight into a preallocated buffer, which is reused
+    for the whole connection. A single read may contain several messages or only a part of one,
+    every complete message is queued and returned one by one. Binary telemetry frames are unpacked
+    with struct.unpack_from straight from the buffer and queued as tuples (tag, airplane_id, sequence, x, y, z),
+    the other messages are queued as bytes.
+
+    Attributes:
+    - buffer (bytearray): The reusable receive buffer.
+    - view (memoryview): Memoryview over the buffer, used to receive and slice data without copying.
+    - start (int): Position of the first byte which was not decoded yet.
+    - end (int): Position right after the last received byte.
+    - messages (deque): Complete messages waiting to be read.
+    """
+
+    def __init__(self, buffer_size = RECEIVE_BUFFER_SIZE):
+        """
+        Initializes the frame reader.
+
+        Parameters:
+        - buffer_size (int): Initial size of the receive buffer, it grows when a bigger message comes.
+        """
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.messages = deque()
+
+    def has_messages(self):
+        """
+        Checks whether there are complete messages waiting to be read.
+
+        Returns:
+        - bool: True if at least one message is queued, False otherwise.
+        """
+        return len(self.messages) > 0
+
+    def make_room(self):
+        """
+        Makes free space at the end of the buffer, by moving not decoded bytes to its beginning
+        or, when the buffer is full of a single unfinished message, by doubling its size.
+        """
+        unread = self.end - self.start
+        if self.start > 0:
+            self.view[:unread] = self.view[self.start:self.end]
+        else:
+            self.view.release()
+            new_buffer = bytearray(len(self.buffer) * 2)
+            new_buffer[:unread] = self.buffer[:unread]
+            self.buffer = new_buffer
+            self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = unread
+
+    def receive(self, client_socket):
+        """
+        Receives available data from the socket with a single syscall and decodes all complete messages.
+
+        Parameters:
+        - client_socket (socket): The socket to read from.
+
+        Returns:
+        - int: Number of complete messages decoded from this read.
+
+        Raises:
+        - ConnectionError: If the other side closed the connection.
+        """
+        if self.end == len(self.buffer):
+            self.make_room()
+        received = client_socket.recv_into(self.view[self.end:])
+        if received == 0:
+            raise ConnectionError("Connection closed by the other side")
+        self.end += received
+        return self.extract_messages()
+
+    def extract_messages(self):
+        """
+        Decodes every complete message from the received data and puts it into the messages queue.
+
+        Returns:
+        - int: Number of decoded messages.
+
+        Raises:
+        - ValueError: If the length prefix exceeds the maximum message size.
+        """
+        decoded = 0
+        while self.end - self.start >= HEADER.size:
+            message_size = HEADER.unpack_from(self.buffer, self.start)[0]
+            if message_size > MAX_MESSAGE_SIZE:
+                raise ValueError(f"Message size {message_size} exceeds the limit of {MAX_MESSAGE_SIZE} bytes")
+            message_start = self.start + HEADER.size
+            message_end = message_start + message_size
+            if message_end > self.end:
+                break
+            if message_size == TELEMETRY.size and self.buffer[message_start] == TELEMETRY_TAG:
+                self.messages.append(TELEMETRY.unpack_from(self.buffer, message_start))
+            else:
+                self.messages.append(bytes(self.view[message_start:message_end]))
+            self.start = message_end
+            decoded += 1
+        if self.start == self.end:
+            self.start = 0
+            self.end = 0
+        return decoded
+
+    def read_message(self, client_socket):
+        """
+        Returns the next complete message, reading from the socket until one is available.
+
+        Parameters:
+        - client_socket (socket): The socket to read from.
+
+        Returns:
+        - bytes or tuple: The payload of the message, or the unpacked telemetry frame.
+        """
+        while not self.messages:
+            self.receive(client_socket)
+        return self.messages.popleft()
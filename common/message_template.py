@@ -5,13 +5,47 @@ class MessageTemplate:
     Attributes:
         status (dict): A dictionary holding the possible statuses of messages
                        such as 'success_status' and 'error_status'.
+        codes (dict): Names of the message types mapped to their codes, sent in the "code" field of every message.
+        legacy_codes (dict): Texts of the messages mapped to their codes, for messages of older versions without the code.
 
     Methods:
-        protocol_template(status, message, data=None):
+        protocol_template(status, message, data=None, code=None):
             Constructs a dictionary that formats a message according to a specified
-            protocol with a status, an optional message, and optional data.
+            protocol with a status, an optional message, optional data and the message type code.
+        message_code(message):
+            Returns the type code of the received message.
     """
 
+    codes = {
+        "welcome": 1,
+        "points": 2,
+        "direction": 3,
+        "avoid_collision": 4,
+        "collision": 5,
+        "airport_is_full": 6,
+        "coordinates": 10,
+        "airplane_object": 11,
+        "target_reached": 12,
+        "landed": 13,
+        "out_of_fuel": 14,
+        "crash": 15
+    }
+
+    legacy_codes = {
+        "Welcome to our airport !": codes["welcome"],
+        "Your coordinates points: ": codes["points"],
+        "Fly to: ": codes["direction"],
+        "You`re to close to another airplane ! Correct your flight.": codes["avoid_collision"],
+        "Crash !...": codes["collision"],
+        "Airport`s full, you have to fly to another...": codes["airport_is_full"],
+        "Our coordinates: ": codes["coordinates"],
+        "Our data: ": codes["airplane_object"],
+        "We reached the target: ": codes["target_reached"],
+        "We was successfully landed": codes["landed"],
+        "Out of fuel ! We`re falling...": codes["out_of_fuel"],
+        "Crash ! Bye, bye...": codes["crash"]
+    }
+
     def __init__(self):
         """
         Initialize the MessageTemplate with predefined statuses.
@@ -22,7 +56,7 @@ class MessageTemplate:
 
         }
 
-    def protocol_template(self, status, message, data = None):
+    def protocol_template(self, status, message, data = None, code = None):
         """
         Generate a formatted message template.
 
@@ -30,6 +64,7 @@ class MessageTemplate:
             status (str): The status of the message, usually indicating success or error.
             message (str): The main content of the message.
             data (any, optional): Additional data relevant to the message. Defaults to None.
+            code (int, optional): The type code of the message, one of the codes values. Defaults to None.
 
         Returns:
             dict: A dictionary containing the formatted message.
@@ -38,5 +73,23 @@ class MessageTemplate:
             "status": status,
             "message": message,
             "data": data,
+            "code": code
         }
         return template
+
+    @classmethod
+    def message_code(cls, message):
+        """
+        Establishes the type of the received message. Messages without the code, sent by older versions,
+        are recognized by their whole text.
+
+        Parameters:
+            message (dict): The received message.
+
+        Returns:
+            int or None: The type code of the message, None if the message is unknown.
+        """
+        code = message.get("code")
+        if code is None:
+            code = cls.legacy_codes.get(message.get("message"))
+        return code
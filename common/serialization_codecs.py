@@ -0,0 +1,164 @@
+import json
+from common.config_variables import SERIALIZATION_CODECS, encode_format
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JsonCodec:
+    """
+    Codec of the standard library's json module, understood by every client_side and server_side.
+    """
+
+    name = "json"
+
+    def encode(self, data):
+        """
+        Parameters:
+        - data (dict): The message to be encoded.
+
+        Returns:
+        - bytes: The JSON-encoded message.
+        """
+        return json.dumps(data).encode(encode_format)
+
+    def decode(self, data):
+        """
+        Parameters:
+        - data (bytes): The JSON-encoded message.
+
+        Returns:
+        - dict: The decoded message.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    Codec of the orjson package. It writes the same JSON as JsonCodec, several times faster and straight to bytes.
+    """
+
+    name = "orjson"
+
+    def encode(self, data):
+        """
+        Parameters:
+        - data (dict): The message to be encoded.
+
+        Returns:
+        - bytes: The JSON-encoded message.
+        """
+        return orjson.dumps(data, option = orjson.OPT_SERIALIZE_NUMPY)
+
+    def decode(self, data):
+        """
+        Parameters:
+        - data (bytes): The JSON-encoded message.
+
+        Returns:
+        - dict: The decoded message.
+        """
+        return orjson.loads(data)
+
+
+class MsgpackCodec:
+    """
+    Binary MessagePack codec of the msgspec package, with more compact messages than JSON.
+
+    Attributes:
+    - encoder (msgspec.msgpack.Encoder): Reusable encoder of the messages.
+    - decoder (msgspec.msgpack.Decoder): Reusable decoder of the messages.
+    """
+
+    name = "msgpack"
+
+    def __init__(self):
+        """
+        Initializes the encoder and the decoder of the codec.
+        """
+        self.encoder = msgspec.msgpack.Encoder()
+        self.decoder = msgspec.msgpack.Decoder()
+
+    def encode(self, data):
+        """
+        Parameters:
+        - data (dict): The message to be encoded.
+
+        Returns:
+        - bytes: The MessagePack-encoded message.
+        """
+        return self.encoder.encode(data)
+
+    def decode(self, data):
+        """
+        Parameters:
+        - data (bytes): The MessagePack-encoded message.
+
+        Returns:
+        - dict: The decoded message.
+        """
+        return self.decoder.decode(data)
+
+
+CODECS = {"json": JsonCodec}
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+if msgspec is not None:
+    CODECS["msgpack"] = MsgpackCodec
+
+
+def available_codecs():
+    """
+    Lists the codecs which can be used in this process, in the order of preference from the SERIALIZATION_CODECS.
+    The json codec is always available, as the last resort.
+
+    Returns:
+    - list: Names of the available codecs.
+    """
+    names = [name for name in SERIALIZATION_CODECS if name in CODECS]
+    if JsonCodec.name not in names:
+        names.append(JsonCodec.name)
+    return names
+
+
+def choose_codec(offered_codecs):
+    """
+    Chooses the codec of the connection from the codecs offered by the other side, the first available one wins.
+    The other side which offered nothing, like an older server_side, gets the json codec.
+
+    Parameters:
+    - offered_codecs (list or None): Names of the codecs offered by the other side, in its order of preference.
+
+    Returns:
+    - str: Name of the chosen codec.
+    """
+    available = available_codecs()
+    for name in offered_codecs or []:
+        if name in available:
+            return name
+    return JsonCodec.name
+
+
+def create_codec(name = JsonCodec.name):
+    """
+    Creates the codec with the given name.
+
+    Parameters:
+    - name (str): Name of the codec.
+
+    Returns:
+    - JsonCodec, OrjsonCodec or MsgpackCodec: The codec.
+
+    Raises:
+    - ValueError: If the codec isn't available in this process.
+    """
+    if name not in CODECS:
+        raise ValueError(f"Codec {name} is not available")
+    return CODECS[name]()
@@ -1,32 +1,54 @@
-import json
-from common.config_variables import encode_format
+from common.serialization_codecs import create_codec
 
 
 class SerializeUtils:
     """
-    Utility class for serializing and deserializing data to and from JSON format.
+    Utility class for serializing and deserializing the messages, with the codec chosen for the connection.
+    Until the codec is negotiated in the initial correspondence, the messages are JSON.
+
+    Attributes:
+    - codec (JsonCodec, OrjsonCodec or MsgpackCodec): The codec of the messages.
     """
 
+    def __init__(self, codec = "json"):
+        """
+        Initializes the serialization with the given codec.
+
+        Parameters:
+        - codec (str): Name of the codec.
+        """
+        self.codec = create_codec(codec)
+
+    def set_codec(self, codec):
+        """
+        Switches to another codec, for the messages after the negotiation.
+
+        Parameters:
+        - codec (str): Name of the codec.
+        """
+        if codec != self.codec.name:
+            self.codec = create_codec(codec)
+
     def serialize_to_json(self, dict_data):
         """
-        Serialize a dictionary to JSON format.
+        Serialize a dictionary with the codec of the connection, JSON format by default.
 
         Parameters:
         - dict_data (dict): The dictionary to be serialized.
 
         Returns:
-        - bytes: The JSON-encoded data.
+        - bytes: The encoded data.
         """
-        return json.dumps(dict_data).encode(encode_format)
+        return self.codec.encode(dict_data)
 
     def deserialize_json(self, dict_data):
         """
-        Deserialize JSON data to a dictionary.
+        Deserialize data encoded with the codec of the connection to a dictionary.
 
         Parameters:
-        - dict_data (bytes): The JSON-encoded data.
+        - dict_data (bytes): The encoded data.
 
         Returns:
         - dict: The deserialized dictionary.
         """
-        return json.loads(dict_data)
+        return self.codec.decode(dict_data)
@@ -18,7 +18,7 @@ class API:
 
     Attributes:
         logger (Logger): Logger object to log information and errors.
-        connection (Connection): Connection object to interact with the database.
+        connection (Connection): Read-only connection object to interact with the database.
         db_utils (DatabaseUtils): Utility object for database operations.
         process (subprocess.Popen): Represents the running server process.
     """
@@ -28,7 +28,7 @@ class API:
         Initializes the API class with default values and configurations.
         """
         self.logger = logger_config("Flask API logger", log_file, "flask_api_logs.log")
-        self.connection = Connection(db_file)
+        self.connection = Connection(db_file, read_only = True)
         self.db_utils = DatabaseUtils()
         self.process = None
 
@@ -47,6 +47,7 @@ class API:
     def server_close(self):
         """
         Terminates the server subprocess, updates the database, and closes the database connection.
+        The end of the period is written with a short-lived writable connection, the API's own connection only reads.
 
         Returns:
             dict: A response message indicating the server has stopped.
@@ -55,10 +56,18 @@ class API:
         self.process.wait()
         self.logger.info(f"Close script with PID {self.process.pid}")
         self.process = None
-        self.db_utils.update_period_end(self.connection)
+        self.close_period()
         self.connection.connection.close()
         return {"message": "Server stopped"}
 
+    def close_period(self):
+        """
+        Writes the end of the current period with a writable connection opened for this write only.
+        """
+        connection = Connection(db_file)
+        self.db_utils.update_period_end(connection)
+        connection.connection.close()
+
     def server_pause(self):
         """
         Creates a flag file to signal the server to pause its operations.
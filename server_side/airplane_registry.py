@@ -0,0 +1,175 @@
+from collections.abc import MutableMapping
+from threading import Lock
+import numpy as np
+
+
+class AirplaneRegistry(MutableMapping):
+    """
+    Compact store of the airplanes at the airport. Every airplane gets an integer slot, and its data lives
+    in the slot's row of NumPy columns instead of a nested dictionary. Slots of the airplanes which left
+    are kept on a free list and reused by the next airplanes.
+    The registry works like the old airplanes_list dictionary - airplane keys are mapped to details dictionaries
+    with coordinates, quarter, status and the service points of the quarter, built on every read.
+
+    Attributes:
+    - quarters (tuple): Quarter names, their index is the quarter code.
+    - statuses (tuple): Status names, their index is the status code.
+    - points_by_quarter (dict): Quarter names mapped to the service points of the quarter.
+    - positions (numpy.ndarray): Array of shape (capacity, 3) with x, y, z of the airplanes.
+    - quarter_codes (numpy.ndarray): Quarter code of the airplanes, -1 when unknown.
+    - status_codes (numpy.ndarray): Status code of the airplanes.
+    - active (numpy.ndarray): Flags of the slots taken by airplanes.
+    - keys (list): Airplane keys of the slots, None for free slots.
+    - slots (dict): Airplane keys mapped to their slots.
+    - free_slots (list): Free slots below the highest slot ever taken.
+    - slots_in_use (int): Number of slots ever taken, the end of the used part of the columns.
+    - lock (threading.Lock): Lock for thread-safe taking and freeing of slots.
+    """
+
+    quarters = ("NW", "NE", "SW", "SE")
+    statuses = ("IN THE AIR", "WAITING", "LANDING")
+
+    def __init__(self, points_by_quarter = None, capacity = 128):
+        """
+        Initializes an empty registry.
+
+        Parameters:
+        - points_by_quarter (dict): Quarter names mapped to the dictionaries with initial landing point,
+          waiting point and zero point of the quarter.
+        - capacity (int): Initial number of slots, it doubles when more airplanes come.
+        """
+        self.points_by_quarter = points_by_quarter or {}
+        self.positions = np.zeros((capacity, 3), dtype = np.float64)
+        self.quarter_codes = np.full(capacity, -1, dtype = np.int8)
+        self.status_codes = np.zeros(capacity, dtype = np.int8)
+        self.active = np.zeros(capacity, dtype = bool)
+        self.keys = [None] * capacity
+        self.slots = {}
+        self.free_slots = []
+        self.slots_in_use = 0
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        return iter(list(self.slots))
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def __getitem__(self, key):
+        return self.airplane_details(self.slots[key])
+
+    def __setitem__(self, key, airplane_details):
+        quarter = airplane_details.get("quarter")
+        quarter_code = self.quarters.index(quarter) if quarter in self.quarters else -1
+        with self.lock:
+            slot = self.slots.get(key)
+            if slot is None:
+                slot = self.take_slot(key)
+            self.positions[slot] = airplane_details["coordinates"]
+            self.quarter_codes[slot] = quarter_code
+
+    def __delitem__(self, key):
+        with self.lock:
+            slot = self.slots.pop(key)
+            self.active[slot] = False
+            self.keys[slot] = None
+            self.status_codes[slot] = 0
+            self.free_slots.append(slot)
+
+    def grow(self):
+        """
+        Doubles the number of slots of every column. It's called with the lock held.
+        """
+        capacity = len(self.positions)
+        self.positions = np.concatenate((self.positions, np.zeros_like(self.positions)))
+        self.quarter_codes = np.concatenate((self.quarter_codes, np.full(capacity, -1, dtype = np.int8)))
+        self.status_codes = np.concatenate((self.status_codes, np.zeros(capacity, dtype = np.int8)))
+        self.active = np.concatenate((self.active, np.zeros(capacity, dtype = bool)))
+        self.keys.extend([None] * capacity)
+
+    def take_slot(self, key):
+        """
+        Gives the airplane a slot - a free one if there is any, otherwise the next unused one.
+        It's called with the lock held.
+
+        Parameters:
+        - key: Key of the airplane.
+
+        Returns:
+        - int: The slot of the airplane.
+        """
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.slots_in_use == len(self.positions):
+                self.grow()
+            slot = self.slots_in_use
+            self.slots_in_use += 1
+        self.keys[slot] = key
+        self.active[slot] = True
+        self.slots[key] = slot
+        return slot
+
+    def slot_of(self, key):
+        """
+        Returns:
+        - int or None: The slot of the airplane, None if it's not in the registry.
+        """
+        return self.slots.get(key)
+
+    def set_status(self, key, status):
+        """
+        Sets the status of the airplane.
+
+        Parameters:
+        - key: Key of the airplane.
+        - status (str): One of the statuses names.
+        """
+        status_code = self.statuses.index(status)
+        with self.lock:
+            self.status_codes[self.slots[key]] = status_code
+
+    def airplane_details(self, slot):
+        """
+        Builds the details dictionary of the airplane from its slot.
+
+        Parameters:
+        - slot (int): The slot of the airplane.
+
+        Returns:
+        - dict: Coordinates, quarter, status and service points of the airplane.
+        """
+        quarter_code = self.quarter_codes[slot]
+        quarter = self.quarters[quarter_code] if quarter_code >= 0 else None
+        airplane_details = {
+            "coordinates": [int(coordinate) for coordinate in self.positions[slot]],
+            "quarter": quarter,
+            "status": self.statuses[self.status_codes[slot]]
+        }
+        airplane_details.update(self.points_by_quarter.get(quarter, {}))
+        return airplane_details
+
+    def active_positions(self):
+        """
+        Collects the positions of all airplanes, ready for the collision checks.
+
+        Returns:
+        - tuple: List of airplane keys and array of shape (n, 3) with their positions, in the same order.
+        """
+        keys, positions, quarter_codes, status_codes = self.active_columns()
+        return keys, positions
+
+    def active_columns(self):
+        """
+        Copies the columns of all airplanes, without the free slots.
+
+        Returns:
+        - tuple: List of airplane keys and arrays with their positions, quarter codes and status codes, in the same order.
+        """
+        with self.lock:
+            slots = np.flatnonzero(self.active[:self.slots_in_use])
+            keys = [self.keys[slot] for slot in slots]
+            return keys, self.positions[slots], self.quarter_codes[slots], self.status_codes[slots]
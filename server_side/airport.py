@@ -1,5 +1,10 @@
 import matplotlib.pyplot as plt
 from common.math_calculation import euclidean_formula
+from server_side.airplane_registry import AirplaneRegistry
+from server_side.airspace_state import AirspaceState
+from server_side.arrival_manager import ArrivalManager
+from server_side.collision_engine import CollisionEngine
+from server_side.spatial_index import SpatialGrid
 
 
 class Airport:
@@ -12,12 +17,19 @@ class Airport:
     - waiting_point: Dictionary containing waiting points for airplanes in different directions.
     - zero_point: Dictionary containing zero points for airplanes in different directions.
     - air_corridor: Dictionary containing air corridors for airplanes in different directions.
-    - airplanes_list: Dictionary containing the list of airplanes currently at the airport.
+    - arrival_manager: ArrivalManager deciding which airplane gets the air corridor, and in which order the others wait.
+    - airplanes_list: AirplaneRegistry with the airplanes currently at the airport, usable like a dictionary.
+    - airspace: AirspaceState through which the airplanes list is changed, and which gives snapshots to the readers.
+    - spatial_index: SpatialGrid with positions of the airplanes, in cells sized to the warning distance.
+    - collision_engine: CollisionEngine checking the pairs of nearby airplanes, on the positions of the airspace snapshot.
     """
 
-    def __init__(self):
+    def __init__(self, clock = None):
         """
         Initializes an Airport object with default attributes.
+
+        Parameters:
+        - clock: Clock of the arrival manager's holding times, a real time clock if not given.
         """
         self.airport_area = CustomSector(-5000, 5000, -5000, 5000, 0, 5000)
         self.initial_landing_point = {
@@ -40,7 +52,27 @@ class Airport:
                     "N": AirCorridor("N"),
                     "S": AirCorridor("S")
         }
-        self.airplanes_list = {}
+        self.airplanes_list = AirplaneRegistry(self.establish_points_by_quarter())
+        self.airspace = AirspaceState(self.airplanes_list)
+        self.arrival_manager = ArrivalManager(self.air_corridor, self.zero_point, clock, self.airspace)
+        self.spatial_index = SpatialGrid(400)
+        self.collision_engine = CollisionEngine()
+
+    def establish_points_by_quarter(self):
+        """
+        Collects the service points of every quarter, in the form in which they are sent to the airplanes.
+
+        Returns:
+        - dict: Quarter names mapped to the initial landing point, waiting point and zero point coordinates.
+        """
+        return {
+            quarter: {
+                "initial_landing_point": list(self.initial_landing_point[quarter].point_coordinates()),
+                "waiting_point": list(self.waiting_point[quarter].point_coordinates()),
+                "zero_point": list(self.zero_point[quarter[0]].point_coordinates())
+            }
+            for quarter in self.initial_landing_point
+        }
 
     @staticmethod
     def establish_airplane_quarter(coordinates):
@@ -93,6 +125,39 @@ class Airport:
                         return None
         return True
 
+    def update_airplane(self, airplane_object):
+        """
+        Adds the airplane to the airplanes list or updates its details, and moves it in the spatial index.
+
+        Parameters:
+        - airplane_object: Dictionary with the airplane key mapped to the airplane details.
+        """
+        self.airspace.update(airplane_object)
+        for airplane_id, airplane_details in airplane_object.items():
+            self.spatial_index.update(airplane_id, *airplane_details["coordinates"])
+
+    def remove_airplane(self, airplane_id):
+        """
+        Removes the airplane from the airplanes list and from the spatial index, if it's there.
+
+        Parameters:
+        - airplane_id: The ID of the airplane to remove.
+        """
+        self.airspace.remove(airplane_id)
+        self.spatial_index.remove(airplane_id)
+
+    def check_all_distances(self):
+        """
+        Checks the distances between the airplanes of the published airspace snapshot. The spatial index picks
+        the neighbourhoods of airplanes which can be close enough, and every neighbourhood is checked in one vectorized pass.
+
+        Returns:
+        - tuple: Two lists of airplane IDs - airplanes which crashed, and airplanes which have to avoid collision.
+        """
+        snapshot = self.airspace.snapshot()
+        return self.collision_engine.scan_neighbourhoods(snapshot.keys, snapshot.positions, snapshot.rows,
+                                                         self.spatial_index.neighbourhoods())
+
 
 class Radar:
     """
@@ -122,9 +187,12 @@ class Radar:
         self.ax.set_zlabel("Z")
         self.ax.legend(loc = "upper left", bbox_to_anchor = (0.8, 0.8))
 
-    def draw(self):
+    def draw(self, pause_time = 1):
         """
         Draws the radar plot with airport landmarks and airplane positions.
+
+        Parameters:
+        - pause_time: Time in seconds for which the plot window processes its events after drawing.
         """
         self.ax.clear()
         points = {
@@ -134,15 +202,15 @@ class Radar:
         for label, coordinates in points.items():
             x, y, z = coordinates.point_coordinates()
             self.ax.scatter(x, y, z, label = label, marker = "*", s = 100)
-        if len(self.airport.airplanes_list) > 0:
-            for airplane_id, airplane_details in list(self.airport.airplanes_list.items()):
-                x = airplane_details["coordinates"][0]
-                y = airplane_details["coordinates"][1]
-                z = airplane_details["coordinates"][2]
-                self.ax.scatter(x, y, z, label = airplane_id, marker = "^", s = 30)
+        snapshot = self.airport.airspace.snapshot()
+        for airplane_id, airplane_details in snapshot.items():
+            x = airplane_details["coordinates"][0]
+            y = airplane_details["coordinates"][1]
+            z = airplane_details["coordinates"][2]
+            self.ax.scatter(x, y, z, label = airplane_id, marker = "^", s = 30)
         self.ax.legend(loc = "upper left", bbox_to_anchor = (0.8, 0.8))
         plt.draw()
-        plt.pause(1)
+        plt.pause(pause_time)
 
 
 class AirCorridor:
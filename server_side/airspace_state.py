@@ -0,0 +1,171 @@
+from threading import Lock
+
+
+class AirspaceSnapshot:
+    """
+    Immutable view of the airspace at one moment. It's never changed after it's published,
+    so any number of readers can use it without locks while the handlers keep updating the airspace.
+
+    Attributes:
+    - version (int): Version of the airspace state the snapshot was taken from.
+    - keys (tuple): Airplane keys, in the order of the positions rows.
+    - positions (numpy.ndarray): Read-only array of shape (n, 3) with x, y, z of the airplanes.
+    - quarter_codes (numpy.ndarray): Read-only array with quarter codes of the airplanes.
+    - status_codes (numpy.ndarray): Read-only array with status codes of the airplanes.
+    - rows (dict): Airplane keys mapped to their row.
+    - quarters (tuple): Quarter names, their index is the quarter code.
+    - statuses (tuple): Status names, their index is the status code.
+    """
+
+    def __init__(self, version, keys, positions, quarter_codes, status_codes, quarters, statuses):
+        """
+        Initializes the snapshot and makes its arrays read-only.
+
+        Parameters:
+        - version (int): Version of the airspace state.
+        - keys (list): Airplane keys.
+        - positions (numpy.ndarray): Positions of the airplanes, owned by the snapshot from now on.
+        - quarter_codes (numpy.ndarray): Quarter codes of the airplanes, owned by the snapshot from now on.
+        - status_codes (numpy.ndarray): Status codes of the airplanes, owned by the snapshot from now on.
+        - quarters (tuple): Quarter names.
+        - statuses (tuple): Status names.
+        """
+        self.version = version
+        self.keys = tuple(keys)
+        self.positions = positions
+        self.quarter_codes = quarter_codes
+        self.status_codes = status_codes
+        for column in (self.positions, self.quarter_codes, self.status_codes):
+            column.flags.writeable = False
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.quarters = quarters
+        self.statuses = statuses
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def airplane_details(self, row):
+        """
+        Returns:
+        - dict: Coordinates, quarter and status of the airplane in the given row.
+        """
+        quarter_code = self.quarter_codes[row]
+        return {
+            "coordinates": [int(coordinate) for coordinate in self.positions[row]],
+            "quarter": self.quarters[quarter_code] if quarter_code >= 0 else None,
+            "status": self.statuses[self.status_codes[row]]
+        }
+
+    def get(self, key, default = None):
+        """
+        Returns:
+        - dict: Coordinates, quarter and status of the airplane, the default if it's not in the snapshot.
+        """
+        row = self.rows.get(key)
+        return default if row is None else self.airplane_details(row)
+
+    def items(self):
+        """
+        Returns:
+        - generator: (airplane key, airplane details) tuples of all airplanes in the snapshot.
+        """
+        return ((key, self.airplane_details(row)) for row, key in enumerate(self.keys))
+
+
+class AirspaceState:
+    """
+    Single writer entry to the airplanes of the airport, which publishes versioned snapshots for the readers.
+    Every change of an airplane takes the write lock only for the time of this one change and raises the version.
+    Readers (radar, collision checks, APIs) take the last published snapshot, which is a single reference read.
+    Only the writer side publishes a new snapshot - the tick engine once per tick - so a reader never copies
+    the airspace under the write lock.
+
+    Attributes:
+    - registry: The AirplaneRegistry holding the current airplanes.
+    - lock (threading.Lock): Write lock, it keeps the version consistent with the registry content.
+    - version (int): Number of changes made to the airspace.
+    - published: The last published AirspaceSnapshot.
+    """
+
+    def __init__(self, registry):
+        """
+        Initializes the state with an empty snapshot of the registry.
+
+        Parameters:
+        - registry: The AirplaneRegistry holding the airplanes.
+        """
+        self.registry = registry
+        self.lock = Lock()
+        self.version = 0
+        self.published = None
+        self.publish()
+
+    def update(self, airplane_object):
+        """
+        Adds the airplanes or updates their details.
+
+        Parameters:
+        - airplane_object: Dictionary with airplane keys mapped to the airplane details.
+        """
+        with self.lock:
+            self.registry.update(airplane_object)
+            self.version += 1
+
+    def remove(self, airplane_key):
+        """
+        Removes the airplane, if it's there.
+
+        Parameters:
+        - airplane_key: Key of the airplane.
+
+        Returns:
+        - bool: True if the airplane was removed.
+        """
+        with self.lock:
+            if airplane_key not in self.registry:
+                return False
+            del self.registry[airplane_key]
+            self.version += 1
+            return True
+
+    def set_status(self, airplane_key, status):
+        """
+        Sets the status of the airplane.
+
+        Parameters:
+        - airplane_key: Key of the airplane.
+        - status (str): One of the registry statuses names.
+        """
+        with self.lock:
+            self.registry.set_status(airplane_key, status)
+            self.version += 1
+
+    def publish(self):
+        """
+        Takes a new snapshot of the registry and makes it visible to the readers.
+
+        Returns:
+        - AirspaceSnapshot: The published snapshot.
+        """
+        with self.lock:
+            if self.published is not None and self.published.version == self.version:
+                return self.published
+            keys, positions, quarter_codes, status_codes = self.registry.active_columns()
+            self.published = AirspaceSnapshot(self.version, keys, positions, quarter_codes, status_codes,
+                                              self.registry.quarters, self.registry.statuses)
+            return self.published
+
+    def snapshot(self):
+        """
+        Returns the last published snapshot. It can be older than the airspace by the changes made since the last publish.
+
+        Returns:
+        - AirspaceSnapshot: Immutable view of the airspace.
+        """
+        return self.published
@@ -0,0 +1,180 @@
+import heapq
+import itertools
+import threading
+from common.clock import MonotonicClock
+from common.math_calculation import euclidean_formula
+
+
+class ArrivalManager:
+    """
+    Arrival sequencing of the air corridors. Airplanes asking for landing in an occupied corridor are queued
+    in the order of their estimated time to the zero point, and the corridor is reserved for the first
+    airplane of the queue as soon as the previous one leaves it. The waiting airplanes keep flying,
+    so their estimated times are counted again from the newest airspace snapshot when the corridor is freed.
+
+    Attributes:
+    - air_corridors (dict): Corridor directions mapped to the AirCorridor objects, their occupied flags are kept in sync.
+    - zero_points (dict): Corridor directions mapped to the CustomPoint of the corridor's zero point.
+    - approach_speed (int): Speed of the airplanes flying to the zero point, used for the estimated time of arrival.
+    - queues (dict): Corridor directions mapped to heaps of [estimated time of arrival, order, airplane key] entries.
+    - queued (dict): Airplane keys mapped to their corridor direction, the handler and the holding start time.
+    - reserved_by (dict): Corridor directions mapped to the airplane key holding the corridor, or None.
+    - order (itertools.count): Tiebreaker keeping the first come order for equal estimated times.
+    - lock (threading.Lock): Lock making the check and the reservation of a corridor one atomic step.
+    - clock: Clock measuring the holding times, the real time clock or the clock of a simulation.
+    - airspace: AirspaceState whose snapshots give the current positions of the queued airplanes, None to keep
+      the estimated times from the moment of queueing.
+    - started_at (float): Time of the manager's creation, the start of the landings per hour statistic.
+    - landings (int): Number of airplanes which landed.
+    - holding_airplanes (int): Number of airplanes which left the queue for the corridor.
+    - total_holding_time (float): Sum of the time spent in the queue by these airplanes, in seconds.
+    """
+
+    approach_speed = 75
+
+    def __init__(self, air_corridors, zero_points, clock = None, airspace = None):
+        """
+        Initializes the arrival manager with empty queues.
+
+        Parameters:
+        - air_corridors (dict): Corridor directions mapped to the AirCorridor objects.
+        - zero_points (dict): Corridor directions mapped to the zero points.
+        - clock: Clock measuring the holding times, a new MonotonicClock if not given.
+        - airspace: AirspaceState with the current positions of the airplanes.
+        """
+        self.air_corridors = air_corridors
+        self.zero_points = zero_points
+        self.queues = {direction: [] for direction in air_corridors}
+        self.queued = {}
+        self.reserved_by = {direction: None for direction in air_corridors}
+        self.order = itertools.count()
+        self.lock = threading.Lock()
+        self.clock = clock or MonotonicClock()
+        self.airspace = airspace
+        self.started_at = self.clock.monotonic()
+        self.landings = 0
+        self.holding_airplanes = 0
+        self.total_holding_time = 0
+
+    def estimated_time_of_arrival(self, direction, coordinates):
+        """
+        Estimates the time the airplane needs to reach the zero point of the corridor.
+
+        Parameters:
+        - direction (str): Direction of the corridor.
+        - coordinates (list): x, y and z coordinates of the airplane.
+
+        Returns:
+        - float: Estimated time of arrival, in seconds.
+        """
+        zero_point_x, zero_point_y, zero_point_z = self.zero_points[direction].point_coordinates()
+        distance = euclidean_formula(coordinates[0], coordinates[1], coordinates[2], zero_point_x, zero_point_y, zero_point_z)
+        return distance / self.approach_speed
+
+    def reserve(self, direction, airplane_key):
+        """
+        Reserves the corridor for the airplane. It's called with the lock held.
+        """
+        self.reserved_by[direction] = airplane_key
+        self.air_corridors[direction].occupied = True
+
+    def take_next_airplane(self, direction):
+        """
+        Takes the airplane which reaches the zero point of the corridor first. The estimated times are counted again
+        from the positions in the newest airspace snapshot, an airplane missing from it keeps its estimated time.
+        It's called with the lock held.
+
+        Parameters:
+        - direction (str): Direction of the corridor.
+
+        Returns:
+        - list: The [estimated time of arrival, order, airplane key] entry of the airplane.
+        """
+        queue = self.queues[direction]
+        if self.airspace is not None:
+            snapshot = self.airspace.snapshot()
+            for entry in queue:
+                row = snapshot.rows.get(entry[2])
+                if row is not None:
+                    entry[0] = self.estimated_time_of_arrival(direction, snapshot.positions[row])
+            heapq.heapify(queue)
+        return heapq.heappop(queue)
+
+    def request_landing(self, handler, direction, coordinates):
+        """
+        Reserves the corridor for the airplane if it's free and nobody is waiting for it,
+        otherwise puts the airplane in the queue of the corridor.
+        An airplane which is already queued keeps its place.
+
+        Parameters:
+        - handler: Handler of the airplane.
+        - direction (str): Direction of the corridor.
+        - coordinates (list): x, y and z coordinates of the airplane.
+
+        Returns:
+        - bool: True if the airplane can fly to the zero point, False if it has to wait.
+        """
+        airplane_key = handler.airplane_key
+        with self.lock:
+            if self.reserved_by[direction] == airplane_key:
+                return True
+            if airplane_key in self.queued:
+                return False
+            if self.reserved_by[direction] is None and not self.queues[direction]:
+                self.reserve(direction, airplane_key)
+                return True
+            estimated_time_of_arrival = self.estimated_time_of_arrival(direction, coordinates)
+            heapq.heappush(self.queues[direction], [estimated_time_of_arrival, next(self.order), airplane_key])
+            self.queued[airplane_key] = (direction, handler, self.clock.monotonic())
+            return False
+
+    def release(self, airplane_key, landed = False):
+        """
+        Takes the airplane out of the arrival sequence - frees its corridor or removes it from the queue.
+        A freed corridor is reserved at once for the queued airplane which is now the nearest to its zero point.
+
+        Parameters:
+        - airplane_key: Key of the airplane.
+        - landed (bool): Flag indicating whether the airplane left the corridor by landing.
+
+        Returns:
+        - handler or None: Handler of the airplane which got the corridor, it has to be sent to the zero point.
+        """
+        with self.lock:
+            if airplane_key in self.queued:
+                direction, handler, holding_start = self.queued.pop(airplane_key)
+                queue = self.queues[direction]
+                queue[:] = [entry for entry in queue if entry[2] != airplane_key]
+                heapq.heapify(queue)
+                return None
+            for direction, reserving_airplane in self.reserved_by.items():
+                if reserving_airplane == airplane_key:
+                    break
+            else:
+                return None
+            if landed:
+                self.landings += 1
+            self.reserved_by[direction] = None
+            self.air_corridors[direction].occupied = False
+            if not self.queues[direction]:
+                return None
+            estimated_time_of_arrival, order, next_airplane_key = self.take_next_airplane(direction)
+            direction, next_handler, holding_start = self.queued.pop(next_airplane_key)
+            self.holding_airplanes += 1
+            self.total_holding_time += self.clock.monotonic() - holding_start
+            self.reserve(direction, next_airplane_key)
+            return next_handler
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: Number of landings, landings per hour, average holding time and lengths of the queues.
+        """
+        with self.lock:
+            hours = max(self.clock.monotonic() - self.started_at, 1) / 3600
+            return {
+                "landings": self.landings,
+                "landings_per_hour": self.landings / hours,
+                "average_holding_time": self.total_holding_time / self.holding_airplanes if self.holding_airplanes else 0,
+                "queued": {direction: len(queue) for direction, queue in self.queues.items()}
+            }
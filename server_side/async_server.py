@@ -0,0 +1,235 @@
+import asyncio
+from common.config_variables import MAX_MESSAGE_SIZE
+from common.message_framing import HEADER, TELEMETRY, is_telemetry
+from connection_pool import ConnectionPool
+from client_handler import BaseClientHandler
+from server import Server
+
+
+class AsyncClientHandler(BaseClientHandler):
+    """
+    Handles communication with a single client_side as a coroutine, instead of a separate thread.
+
+    Attributes:
+        reader (asyncio.StreamReader): Stream from which the messages of the client_side are read.
+        writer (asyncio.StreamWriter): Stream to which the messages for the client_side are written.
+        write_buffer_limit (int): Number of unsent bytes above which the messages of the tick engine are dropped.
+    """
+
+    write_buffer_limit = 65536
+
+    def __init__(self, server, reader, writer, thread_id):
+        """
+        Initializes an AsyncClientHandler instance.
+        Parameters:
+            server: AsyncServer whose manage client_side handlers.
+            reader (asyncio.StreamReader): Stream from which the messages of the client_side are read.
+            writer (asyncio.StreamWriter): Stream to which the messages for the client_side are written.
+            thread_id (int): The unique identifier of the airplane handled by this connection.
+        """
+        super().__init__(server, writer.get_extra_info("peername"), thread_id)
+        self.reader = reader
+        self.writer = writer
+
+    def write_message(self, message):
+        """
+        Writes an already framed message to the stream, it is sent when the event loop gets control.
+
+        Parameters:
+            message (bytes): The framed message.
+        """
+        self.writer.write(message)
+
+    def try_write_message(self, message):
+        """
+        Writes an already framed message unless the stream is closing or the client_side left too much
+        of the previous messages unread.
+
+        Parameters:
+            message (bytes): The framed message.
+
+        Returns:
+            bool: True if the message was written, False if it was dropped.
+        """
+        if self.writer.is_closing() or self.writer.transport.get_write_buffer_size() > self.write_buffer_limit:
+            return False
+        self.writer.write(message)
+        return True
+
+    async def read_message_from_client(self):
+        """
+        Reads a single length-prefixed message from the client_side.
+
+        Returns:
+            dict or tuple: The deserialized message received from the client_side, or the unpacked telemetry frame.
+        """
+        header = await self.reader.readexactly(HEADER.size)
+        message_size = HEADER.unpack(header)[0]
+        if message_size > MAX_MESSAGE_SIZE:
+            raise ValueError(f"Message size {message_size} exceeds the limit of {MAX_MESSAGE_SIZE} bytes")
+        message_from_client_json = await self.reader.readexactly(message_size)
+        if is_telemetry(message_from_client_json):
+            return TELEMETRY.unpack(message_from_client_json)
+        return self.serialize_utils.deserialize_json(message_from_client_json)
+
+    async def initial_correspondence_with_client(self):
+        """
+        Handles the initial correspondence with the client_side, in the same way as ClientHandler.
+        Sends welcome message, obtains coordinates, establishes service points for the airplane,
+        reads airplane object from client_side, and sends direction message to client_side.
+        """
+        self.welcome_message(self.thread_id)
+        coordinates_message = await self.read_message_from_client()
+        self.accept_codec(coordinates_message)
+        self.establish_all_service_points_coordinates_for_airplane(coordinates_message["data"])
+        airplane_object = await self.read_message_from_client()
+        self.airplane_object = airplane_object["data"]
+        self.send_cached_message("Initial landing point")
+        await self.writer.drain()
+
+    async def run(self):
+        """
+        Manages the communication with the client_side, handles responses, and manages the client_side's lifecycle.
+        """
+        try:
+            await self.initial_correspondence_with_client()
+            self.server.database_writer.add_new_connection(self.airplane_key)
+            self.server.period_counters.count_connection()
+            self.add_airplane_to_list()
+            while self.is_running:
+                response_from_client = await self.read_message_from_client()
+                self.handle_response_from_client(response_from_client)
+                await self.writer.drain()
+        except asyncio.CancelledError:
+            self.is_running = False
+        except Exception as e:
+            self.logger.exception(f"Error in handler {self.thread_id}: {e}")
+            self.is_running = False
+        finally:
+            self.stop()
+
+    def stop(self):
+        """
+        Takes the airplane out of the airport, removes the client_side from the client_side list and closes the stream.
+        """
+        self.leave_airport()
+        self.server.clients_list.discard(self)
+        self.logger.info(f"Client {self.thread_id} out")
+        self.writer.close()
+
+
+class AsyncServer(Server):
+    """
+    Airport server_side serving every airplane with a coroutine in a single asyncio event loop.
+
+    Attributes:
+        max_clients (int): Maximum number of airplanes served at the same time.
+        clients_list (set): Handlers of the connected clients.
+        handler_tasks (set): Tasks running the handlers, cancelled when the server_side stops.
+        resumed (asyncio.Event): Set while the server_side is not paused.
+    """
+
+    def __init__(self, connection_pool, max_clients = 10000):
+        """
+        Initializes the AsyncServer class.
+
+        Parameters:
+            - connection_pool: Connection pool object initialized before start the server_side.
+            - max_clients (int): Maximum number of airplanes served at the same time.
+        """
+        super().__init__(connection_pool)
+        self.max_clients = max_clients
+        self.clients_list = set()
+        self.handler_tasks = set()
+        self.resumed = None
+
+    async def reject_client(self, writer):
+        """
+        Sends the airport is full message and closes the connection.
+
+        Parameters:
+            writer (asyncio.StreamWriter): Stream of the rejected client_side.
+        """
+        writer.write(self.message_cache.frame("json", "airport_is_full"))
+        await writer.drain()
+        writer.close()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves a new client_side connection, or rejects it when the airport is full.
+        Connections arriving while the server_side is paused wait until it's resumed.
+
+        Parameters:
+            reader (asyncio.StreamReader): Stream from which the messages of the client_side are read.
+            writer (asyncio.StreamWriter): Stream to which the messages for the client_side are written.
+        """
+        await self.resumed.wait()
+        self.logger.info(f"Connection from {writer.get_extra_info('peername')}")
+        if len(self.clients_list) >= self.max_clients:
+            await self.reject_client(writer)
+            return
+        client_handler = AsyncClientHandler(self, reader, writer, self.period_counters.allocate_airplane_id())
+        self.clients_list.add(client_handler)
+        task = asyncio.current_task()
+        self.handler_tasks.add(task)
+        try:
+            await client_handler.run()
+        finally:
+            self.handler_tasks.discard(task)
+
+    async def server_work_manager(self):
+        """
+        Checks once per second the server_side's lifetime and the pause flag file.
+        """
+        while self.is_running:
+            self.check_server_lifetime()
+            if self.check_file_flag_exists():
+                if self.resumed.is_set():
+                    self.logger.info("Server paused")
+                self.resumed.clear()
+            else:
+                self.resumed.set()
+            await asyncio.sleep(1)
+
+    async def tick_manager(self):
+        """
+        Runs the ticks of the tick engine in the event loop, so the commands are written by the loop's thread.
+        """
+        self.tick_engine.next_deadline = self.clock.monotonic() + self.tick_engine.tick_interval
+        while self.is_running:
+            await asyncio.sleep(self.clock.real_seconds(self.tick_engine.time_to_next_tick()))
+            self.tick_engine.run_tick()
+
+    async def serve(self):
+        """
+        Starts listening for client_side connections and works until the server_side's lifetime ends.
+        """
+        self.logger.info("Server`s up")
+        self.db_service_when_server_starts()
+        self.resumed = asyncio.Event()
+        self.resumed.set()
+        self.server_socket = await asyncio.start_server(self.handle_connection, self.HOST, self.PORT)
+        tick_task = asyncio.create_task(self.tick_manager())
+        try:
+            await self.server_work_manager()
+        except OSError as e:
+            self.logger.exception(f"Error in server_side: {e}")
+            self.is_running = False
+        finally:
+            tick_task.cancel()
+            for task in self.handler_tasks:
+                task.cancel()
+            await asyncio.gather(tick_task, *self.handler_tasks, return_exceptions = True)
+            self.stop()
+
+    def main(self):
+        """
+        Runs the server_side in the asyncio event loop.
+        """
+        asyncio.run(self.serve())
+
+
+if __name__ == "__main__":
+    connection_pool = ConnectionPool(10, 100)
+    server = AsyncServer(connection_pool)
+    server.main()
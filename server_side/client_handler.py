@@ -1,54 +1,90 @@
+import select
 import threading
+from abc import ABC, abstractmethod
 from common.config_variables import BUFFER, log_file
 from common.logger_config import logger_config
+from common.message_framing import FrameReader, frame_message
+from common.serialization_codecs import available_codecs
 from common.serialization_utils import SerializeUtils
-from database_managment import DatabaseUtils
 from server_messages import HandlerProtocols
 
 
-class ClientHandler(threading.Thread):
+class BaseClientHandler(ABC):
     """
-    Handles communication with a single client_side connected to the server_side.
+    Protocol logic of a single airplane connection, shared by the thread based and the asyncio based handlers.
+    Subclasses provide the way the messages are written to and read from the client_side.
 
     Attributes:
         server: server_side whose manage this handler.
-        client_socket (socket): The socket object representing the client_side connection.
         address (tuple): The address of the client_side (IP address, port number).
-        thread_id (int): The unique identifier of the thread handling this client_side connection.
-        connection (Connection): The database connection obtained from the connection pool.
-        BUFFER (int): The size of the buffer used for sending and receiving data.
+        thread_id (int): The unique identifier of the airplane handled by this connection.
         serialize_utils (SerializeUtils): An instance of the SerializeUtils class for serialization.
-        database_utils (DatabaseUtils): An instance of the DatabaseUtils class for database operations.
+        database_utils (DatabaseUtils): The server_side's DatabaseUtils, which knows the ID of the current period.
         communication_utils (HandlerProtocols): An instance of the HandlerProtocols class for communication protocols.
         is_running (bool): Flag indicating whether the client_side handler is running.
         airplane_object (dict): Dictionary representing the airplane object associated with the client_side.
         airplane_key (str): Key used to identify the airplane object in the dictionary.
+        response_handlers (dict): Codes of the client_side's messages mapped to their handlers.
+        telemetry_sequence (int): Sequence number of the last accepted telemetry frame.
     """
 
-    def __init__(self, server, client_socket, address, thread_id):
+    final_statuses = {
+        HandlerProtocols.codes["landed"]: "SUCCESSFULLY LANDING",
+        HandlerProtocols.codes["out_of_fuel"]: "CRASHED BY OUT OF FUEL",
+        HandlerProtocols.codes["crash"]: "CRASHED BY COLLISION"
+    }
+
+    def __init__(self, server, address, thread_id):
         """
-        Initializes a ClientHandler instance.
+        Initializes the protocol state of the handler.
 
         Parameters:
             server: server_side whose manage client_side handlers.
-            client_socket (socket): The socket object representing the client_side connection.
             address (tuple): The address of the client_side (IP address, port number).
-            thread_id (int): The unique identifier of the thread handling this client_side connection.
+            thread_id (int): The unique identifier of the airplane handled by this connection.
         """
-        super().__init__()
         self.server = server
-        self.client_socket = client_socket
         self.address = address
         self.thread_id = thread_id
-        self.connection = self.server.connection_pool.get_connection()
-        self.BUFFER = BUFFER
         self.logger = logger_config(f"ClientHandler_{self.thread_id}", log_file, "handlers_logs.log")
         self.serialize_utils = SerializeUtils()
-        self.database_utils = DatabaseUtils()
+        self.database_utils = server.database_utils
         self.communication_utils = HandlerProtocols()
         self.is_running = True
         self.airplane_object = None
         self.airplane_key = f"Airplane_{self.thread_id}"
+        self.telemetry_sequence = 0
+        codes = self.communication_utils.codes
+        self.response_handlers = {
+            codes["target_reached"]: self.handle_target_reached,
+            codes["landed"]: self.handle_final_status,
+            codes["out_of_fuel"]: self.handle_final_status,
+            codes["crash"]: self.handle_final_status
+        }
+
+    @abstractmethod
+    def write_message(self, message):
+        """
+        Writes an already framed message to the client_side.
+
+        Parameters:
+            message (bytes): The framed message.
+        """
+
+    def try_write_message(self, message):
+        """
+        Writes an already framed message only if it can be written without waiting for the client_side,
+        for the senders which mustn't be held up by a slow client_side, like the tick engine.
+        By default the message is written like any other, for the handlers whose writes never wait.
+
+        Parameters:
+            message (bytes): The framed message.
+
+        Returns:
+            bool: True if the message was written, False if it was dropped.
+        """
+        self.write_message(message)
+        return True
 
     def send_message_to_client(self, data):
         """
@@ -58,43 +94,52 @@ class ClientHandler(threading.Thread):
             data (dict): The message data to be sent to the client_side.
         """
         message = self.serialize_utils.serialize_to_json(data)
-        self.client_socket.sendall(message)
+        self.write_message(frame_message(message))
 
-    def read_message_from_client(self, client_socket):
+    def send_cached_message(self, message_name):
         """
-        Reads a message from the client_side socket.
+        Sends one of the constant messages, already serialized with the codec of the connection and framed.
 
         Parameters:
-            client_socket (socket): The client_side socket object from which to read the message.
+            message_name (str): Name of the message in the server_side's message cache.
+        """
+        self.write_message(self.server.message_cache.frame(self.serialize_utils.codec.name, message_name))
+
+    def try_send_cached_message(self, message_name):
+        """
+        Sends one of the constant messages only if it can be written without waiting for the client_side.
+
+        Parameters:
+            message_name (str): Name of the message in the server_side's message cache.
 
         Returns:
-            dict: The deserialized message received from the client_side.
+            bool: True if the message was sent, False if it was dropped.
         """
-        message_from_client_json = client_socket.recv(self.BUFFER)
-        deserialized_message = self.serialize_utils.deserialize_json(message_from_client_json)
-        return deserialized_message
+        return self.try_write_message(self.server.message_cache.frame(self.serialize_utils.codec.name, message_name))
 
     def welcome_message(self, id):
         """
-        Sends a welcome message to the client_side.
+        Sends a welcome message to the client_side, offering the codecs available for the next messages
+        and the binary telemetry frames.
 
         Parameters:
             id (int): The identifier of the client_side.
         """
-        welcome_message = self.communication_utils.welcome_message_to_client(id)
+        welcome_message = self.communication_utils.welcome_message_to_client(id, available_codecs(), telemetry = True)
         self.logger.info(f"Client_{self.thread_id} connected")
         self.send_message_to_client(welcome_message)
 
-    def response_from_client_with_coordinates(self):
+    def accept_codec(self, coordinates_message):
         """
-        Reads the coordinates message from the client_side and returns the coordinates.
+        Switches to the codec chosen by the client_side in its first coordinates message.
+        An older client_side, which doesn't choose, and an unknown codec keep the JSON messages.
 
-        Returns:
-            dict: The coordinates received from the client_side.
+        Parameters:
+            coordinates_message (dict): The first coordinates message of the client_side.
         """
-        coordinates_json = self.client_socket.recv(self.BUFFER)
-        coordinates = self.serialize_utils.deserialize_json(coordinates_json)["data"]
-        return coordinates
+        codec = coordinates_message.get("codec")
+        if codec in available_codecs():
+            self.serialize_utils.set_codec(codec)
 
     def establish_all_service_points_coordinates_for_airplane(self, coordinates):
         """
@@ -104,52 +149,84 @@ class ClientHandler(threading.Thread):
             coordinates (dict): The coordinates of the airplane.
         """
         quarter = self.server.airport.establish_airplane_quarter(coordinates)
-        points_to_send = self.communication_utils.points_for_airplane_message(quarter,
-                                                                              self.server.airport.initial_landing_point[quarter].point_coordinates(),
-                                                                              self.server.airport.waiting_point[quarter].point_coordinates(),
-                                                                              self.server.airport.zero_point[quarter[0]].point_coordinates())
-        self.send_message_to_client(points_to_send)
+        self.send_cached_message(self.server.message_cache.points_name(quarter))
 
-    def initial_correspondence_with_client(self, client_socket):
+    def add_airplane_to_list(self):
         """
-        Handles the initial correspondence with the client_side.
-        Sends welcome message, obtains coordinates, establishes service points for the airplane,
-        reads airplane object from client_side, and sends direction message to client_side.
+        Adds the airplane received in the initial correspondence to the airport, through the tick engine of the server_side.
+        """
+        self.server.tick_engine.register_handler(self)
+
+    def update_airplane_coordinates(self, response_from_client):
+        """
+        Updates the coordinates of the airplane object from the coordinates message.
 
         Parameters:
-            client_socket (socket): The client_side socket object.
+            response_from_client (dict): The response received from the client_side.
         """
-        self.welcome_message(self.thread_id)
-        coordinates = self.response_from_client_with_coordinates()
-        self.establish_all_service_points_coordinates_for_airplane(coordinates)
-        airplane_object = self.read_message_from_client(client_socket)
-        self.airplane_object = airplane_object["data"]
-        self.send_message_to_client(self.communication_utils.direct_airplane_message("Initial landing point"))
+        coordinates = [response_from_client["data"]["x"], response_from_client["data"]["y"], response_from_client["data"]["z"]]
+        self.apply_airplane_coordinates(coordinates)
 
-    def check_possible_collisions(self):
+    def handle_telemetry(self, telemetry_frame):
         """
-        Checks for possible collisions between airplanes.
-        Sends messages accordingly if there's a collision or if avoidance is necessary.
+        Updates the coordinates of the airplane from a binary telemetry frame.
+        Frames of another airplane and frames older than the last accepted one are dropped.
+
+        Parameters:
+            telemetry_frame (tuple): The unpacked frame - tag, airplane id, sequence number and x, y, z coordinates.
         """
-        possible_collisions = self.server.airport.check_distance_between_airplanes(self.airplane_object, self.airplane_key, self.server.airport.airplanes_list)
-        if possible_collisions == False:
-            self.send_message_to_client(self.communication_utils.avoid_collision_message())
-        elif possible_collisions == None:
-            self.send_message_to_client(self.communication_utils.collision_message())
-        else:
-            pass
+        tag, airplane_id, sequence, x, y, z = telemetry_frame
+        if airplane_id != self.thread_id or sequence <= self.telemetry_sequence:
+            self.logger.warning(f"Client_{self.thread_id} dropped telemetry frame {sequence} of airplane {airplane_id}")
+            return
+        self.telemetry_sequence = sequence
+        self.apply_airplane_coordinates([x, y, z])
 
-    def update_airplane_coordinates(self, response_from_client):
+    def apply_airplane_coordinates(self, coordinates):
         """
-        Updates the coordinates of the airplane object and checks for collisions.
+        Submits the coordinates of the airplane to the tick engine of the server_side,
+        which applies them, checks the collisions of all airplanes and records them once per tick.
 
         Parameters:
-            response_from_client (dict): The response received from the client_side.
+            coordinates (list): The x, y and z coordinates of the airplane.
         """
-        coordinates = [response_from_client["data"]["x"], response_from_client["data"]["y"], response_from_client["data"]["z"]]
-        self.airplane_object[self.airplane_key]["coordinates"] = coordinates
-        self.check_possible_collisions()
-        self.server.airport.airplanes_list.update(self.airplane_object)
+        self.server.tick_engine.submit_coordinates(self.airplane_key, coordinates)
+
+    def direct_to_zero_point(self):
+        """
+        Sends the airplane to the zero point of its air corridor, after the corridor was reserved for it.
+        """
+        self.server.airport.airspace.set_status(self.airplane_key, "LANDING")
+        self.send_cached_message("Zero point")
+
+    def leave_arrival_sequence(self, landed = False):
+        """
+        Takes the airplane out of the arrival sequence and sends the next airplane waiting for the freed corridor
+        to the zero point at once.
+
+        Parameters:
+            landed (bool): Flag indicating whether the airplane landed.
+        """
+        next_handler = self.server.airport.arrival_manager.release(self.airplane_key, landed)
+        if next_handler is not None:
+            try:
+                next_handler.direct_to_zero_point()
+            except (OSError, KeyError) as e:
+                self.logger.warning(f"{next_handler.airplane_key} not sent to the zero point: {e}")
+
+    def leave_airport(self, landed = False):
+        """
+        Takes the airplane out of the arrival sequence and deletes it from the list.
+        It can be called more than once, so the handler's stop calls it too - an airplane whose connection was lost
+        doesn't keep its air corridor reserved.
+
+        Parameters:
+            landed (bool): Flag indicating whether the airplane landed.
+        """
+        if self.airplane_object is None:
+            return
+        self.leave_arrival_sequence(landed)
+        self.server.tick_engine.remove_airplane(self.airplane_key)
 
     def delete_airplane_from_list_and_save_status_to_db(self, status):
         """
@@ -158,35 +235,158 @@ class ClientHandler(threading.Thread):
         Parameters:
             status (str): The status of the airplane.
         """
-        self.database_utils.update_connection_status(self.connection, status, self.airplane_key)
-        del self.server.airport.airplanes_list[self.airplane_key]
+        self.server.database_writer.update_connection_status(status, self.airplane_key)
+        self.server.period_counters.count_status(status)
+        self.leave_airport(landed = status == "SUCCESSFULLY LANDING")
         self.is_running = False
 
     def handle_response_from_client(self, response_from_client):
         """
         Handles the response received from the client_side.
-        Depending on the message received, it directs the airplane accordingly,
-        updates its coordinates, or handles landing or crashing scenarios.
+        The handler is looked up by the code of the message, the messages without a handler are the airplane's coordinates.
+        Telemetry frames come as tuples and go straight to handle_telemetry.
+
+        Parameters:
+            response_from_client (dict or tuple): The response received from the client_side.
+        """
+        if type(response_from_client) is tuple:
+            self.handle_telemetry(response_from_client)
+            return
+        handler = self.response_handlers.get(self.communication_utils.message_code(response_from_client), self.update_airplane_coordinates)
+        handler(response_from_client)
+
+    def handle_target_reached(self, response_from_client):
+        """
+        Handles the airplane which reached one of its points. An airplane which reached the initial landing point
+        flies to the zero point when the arrival manager reserves the corridor for it, otherwise it flies
+        to the waiting point and keeps its place in the queue.
 
         Parameters:
             response_from_client (dict): The response received from the client_side.
         """
-        air_corridor = getattr(self.server.airport, "air_corridor")[self.airplane_object[self.airplane_key]["quarter"][0]]
-        if "We reached the target: " in response_from_client["message"] and "Initial landing point" in response_from_client["data"]:
-            if air_corridor.occupied == True:
-                self.send_message_to_client(self.communication_utils.direct_airplane_message("Waiting point"))
+        if response_from_client["data"] == "Initial landing point":
+            direction = self.airplane_object[self.airplane_key]["quarter"][0]
+            coordinates = self.airplane_object[self.airplane_key]["coordinates"]
+            if self.server.airport.arrival_manager.request_landing(self, direction, coordinates):
+                self.direct_to_zero_point()
             else:
-                self.send_message_to_client(self.communication_utils.direct_airplane_message("Zero point"))
-                air_corridor.occupied = True
-        elif "We was successfully landed" in response_from_client["message"]:
-            air_corridor.occupied = False
-            self.delete_airplane_from_list_and_save_status_to_db("SUCCESSFULLY LANDING")
-        elif "Out of fuel ! We`re falling..." in response_from_client["message"]:
-            self.delete_airplane_from_list_and_save_status_to_db("CRASHED BY OUT OF FUEL")
-        elif "Crash ! Bye, bye..." in response_from_client["message"]:
-            self.delete_airplane_from_list_and_save_status_to_db("CRASHED BY COLLISION")
-        else:
-            self.update_airplane_coordinates(response_from_client)
+                self.server.airport.airspace.set_status(self.airplane_key, "WAITING")
+                self.send_cached_message("Waiting point")
+
+    def handle_final_status(self, response_from_client):
+        """
+        Handles the landing or the crash of the airplane.
+
+        Parameters:
+            response_from_client (dict): The response received from the client_side.
+        """
+        status = self.final_statuses[self.communication_utils.message_code(response_from_client)]
+        self.delete_airplane_from_list_and_save_status_to_db(status)
+
+
+class ClientHandler(BaseClientHandler, threading.Thread):
+    """
+    Handles communication with a single client_side connected to the server_side, in a separate thread.
+
+    Attributes:
+        client_socket (socket): The socket object representing the client_side connection.
+        BUFFER (int): The size of the buffer used for sending and receiving data.
+        frame_reader (FrameReader): Decoder of length-prefixed messages, with the reusable receive buffer of this connection.
+        send_lock (threading.Lock): Lock keeping whole messages together, when the handler and the tick engine send at the same time.
+    """
+
+    def __init__(self, server, client_socket, address, thread_id):
+        """
+        Initializes a ClientHandler instance.
+
+        Parameters:
+            server: server_side whose manage client_side handlers.
+            client_socket (socket): The socket object representing the client_side connection.
+            address (tuple): The address of the client_side (IP address, port number).
+            thread_id (int): The unique identifier of the thread handling this client_side connection.
+        """
+        threading.Thread.__init__(self)
+        BaseClientHandler.__init__(self, server, address, thread_id)
+        self.client_socket = client_socket
+        self.BUFFER = BUFFER
+        self.frame_reader = FrameReader()
+        self.send_lock = threading.Lock()
+
+    def write_message(self, message):
+        """
+        Writes an already framed message to the client_side socket.
+
+        Parameters:
+            message (bytes): The framed message.
+        """
+        with self.send_lock:
+            self.client_socket.sendall(message)
+
+    def try_write_message(self, message):
+        """
+        Writes an already framed message only if neither the handler is sending at the moment,
+        nor the client_side's receive buffer is full, so the caller never waits for a slow client_side.
+        A writable socket has room for far more than a command, so the message is written whole.
+
+        Parameters:
+            message (bytes): The framed message.
+
+        Returns:
+            bool: True if the message was written, False if it was dropped.
+        """
+        if not self.send_lock.acquire(blocking = False):
+            return False
+        try:
+            readable, writable, errored = select.select([], [self.client_socket], [], 0)
+            if not writable:
+                return False
+            self.client_socket.sendall(message)
+            return True
+        finally:
+            self.send_lock.release()
+
+    def read_message_from_client(self, client_socket):
+        """
+        Reads a message from the client_side socket.
+
+        Parameters:
+            client_socket (socket): The client_side socket object from which to read the message.
+
+        Returns:
+            dict or tuple: The deserialized message received from the client_side, or the unpacked telemetry frame.
+        """
+        message_from_client_json = self.frame_reader.read_message(client_socket)
+        if type(message_from_client_json) is tuple:
+            return message_from_client_json
+        deserialized_message = self.serialize_utils.deserialize_json(message_from_client_json)
+        return deserialized_message
+
+    def response_from_client_with_coordinates(self):
+        """
+        Reads the first coordinates message from the client_side, accepts the codec chosen in it and returns the coordinates.
+
+        Returns:
+            dict: The coordinates received from the client_side.
+        """
+        coordinates_message = self.read_message_from_client(self.client_socket)
+        self.accept_codec(coordinates_message)
+        return coordinates_message["data"]
+
+    def initial_correspondence_with_client(self, client_socket):
+        """
+        Handles the initial correspondence with the client_side.
+        Sends welcome message, obtains coordinates, establishes service points for the airplane,
+        reads airplane object from client_side, and sends direction message to client_side.
+
+        Parameters:
+            client_socket (socket): The client_side socket object.
+        """
+        self.welcome_message(self.thread_id)
+        coordinates = self.response_from_client_with_coordinates()
+        self.establish_all_service_points_coordinates_for_airplane(coordinates)
+        airplane_object = self.read_message_from_client(client_socket)
+        self.airplane_object = airplane_object["data"]
+        self.send_cached_message("Initial landing point")
 
     def run(self):
         """
@@ -194,8 +394,9 @@ class ClientHandler(threading.Thread):
         Manages the communication with the client_side, handles responses, and manages the client_side's lifecycle.
         """
         self.initial_correspondence_with_client(self.client_socket)
-        self.database_utils.add_new_connection_to_db(self.connection, self.airplane_key)
-        self.server.airport.airplanes_list.update(self.airplane_object)
+        self.server.database_writer.add_new_connection(self.airplane_key)
+        self.server.period_counters.count_connection()
+        self.add_airplane_to_list()
         try:
             while self.is_running:
                 response_from_client = self.read_message_from_client(self.client_socket)
@@ -209,9 +410,10 @@ class ClientHandler(threading.Thread):
     def stop(self):
         """
         Stops the client_side handler thread.
-        Releases the connection, removes the client_side from the client_side list, and closes the client_side socket.
+        Takes the airplane out of the airport, removes the client_side from the client_side list,
+        and closes the client_side socket.
         """
-        self.server.connection_pool.release_connection(self.connection)
+        self.leave_airport()
         self.server.clients_list.remove(self)
         self.logger.info(f"Client {self.thread_id} out")
         self.client_socket.close()
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class CollisionEngine:
+    """
+    Batch collision detection - positions of all airplanes, collected in one contiguous NumPy array,
+    are checked pair by pair with a single vectorized pass. The engine keeps no positions of its own,
+    it checks the arrays of the airspace snapshots - all pairs at once, or only the pairs inside
+    the neighbourhoods of a spatial grid.
+    The distance bands are the same as in Airport.check_distance_between_airplanes: a distance rounded
+    to less than 50 means a crash, a distance rounded to between 300 and 400 means the airplane has to avoid collision.
+
+    Attributes:
+    - chunk_elements (int): Maximum size of the distance matrix computed at once, it limits the memory used by a scan.
+    """
+
+    crash_distance_squared = 49.5 ** 2
+    avoid_distance_squared = (300.5 ** 2, 399.5 ** 2)
+
+    def __init__(self, chunk_elements = 2 ** 22):
+        """
+        Initializes the engine.
+
+        Parameters:
+        - chunk_elements (int): Maximum size of the distance matrix computed at once.
+        """
+        self.chunk_elements = chunk_elements
+
+    @classmethod
+    def classify_pairs(cls, positions, chunk_elements = 2 ** 22):
+        """
+        Computes squared distances between all pairs of positions and classifies every position.
+        Distances are computed from the Gram matrix, which is exact for integer coordinates.
+
+        Parameters:
+        - positions (numpy.ndarray): Array of shape (n, 3).
+        - chunk_elements (int): Maximum size of the distance matrix computed at once.
+
+        Returns:
+        - tuple: Two boolean arrays of length n - positions which crashed, and positions which have to avoid collision.
+        """
+        count = len(positions)
+        crashed = np.zeros(count, dtype = bool)
+        avoiding = np.zeros(count, dtype = bool)
+        if count < 2:
+            return crashed, avoiding
+        squared_norms = np.einsum("ij,ij->i", positions, positions)
+        chunk_size = max(1, chunk_elements // count)
+        for start in range(0, count, chunk_size):
+            end = min(start + chunk_size, count)
+            distances_squared = squared_norms[start:end, None] + squared_norms[None, :] - 2 * (positions[start:end] @ positions.T)
+            rows = np.arange(end - start)
+            distances_squared[rows, rows + start] = np.inf
+            crashed[start:end] = (distances_squared < cls.crash_distance_squared).any(axis = 1)
+            avoiding[start:end] = ((distances_squared >= cls.avoid_distance_squared[0]) &
+                                   (distances_squared < cls.avoid_distance_squared[1])).any(axis = 1)
+        avoiding &= ~crashed
+        return crashed, avoiding
+
+    def scan_positions(self, keys, positions):
+        """
+        Checks the distances between airplanes whose positions are already collected in an array.
+
+        Parameters:
+        - keys (list): Airplane keys.
+        - positions (numpy.ndarray): Array of shape (n, 3) with positions of the airplanes, in the order of keys.
+
+        Returns:
+        - tuple: Two lists of airplane keys - airplanes which crashed, and airplanes which have to avoid collision.
+        """
+        crashed, avoiding = self.classify_pairs(positions, self.chunk_elements)
+        return [keys[slot] for slot in np.flatnonzero(crashed)], [keys[slot] for slot in np.flatnonzero(avoiding)]
+
+    def scan_neighbourhoods(self, keys, positions, rows, neighbourhoods):
+        """
+        Checks the distances only between airplanes of the same neighbourhood of a spatial grid,
+        a vectorized pass per neighbourhood. With cells at least as big as the avoid collision distance,
+        it finds the same airplanes as scan_positions without computing the distances of the far apart pairs.
+
+        Parameters:
+        - keys (list): Airplane keys.
+        - positions (numpy.ndarray): Array of shape (n, 3) with positions of the airplanes, in the order of keys.
+        - rows (dict): Airplane keys mapped to their row in positions.
+        - neighbourhoods (list): (number of airplanes inside the cell, keys of the cell's and the adjacent cells' airplanes)
+          tuples, as returned by SpatialGrid.neighbourhoods. Keys missing in rows are skipped.
+
+        Returns:
+        - tuple: Two lists of airplane keys - airplanes which crashed, and airplanes which have to avoid collision.
+        """
+        crashed = np.zeros(len(keys), dtype = bool)
+        avoiding = np.zeros(len(keys), dtype = bool)
+        for cell_count, nearby_keys in neighbourhoods:
+            cell_rows = [rows[key] for key in nearby_keys[:cell_count] if key in rows]
+            nearby_rows = cell_rows + [rows[key] for key in nearby_keys[cell_count:] if key in rows]
+            if not cell_rows or len(nearby_rows) < 2:
+                continue
+            group_crashed, group_avoiding = self.classify_pairs(positions[nearby_rows], self.chunk_elements)
+            crashed[cell_rows] = group_crashed[:len(cell_rows)]
+            avoiding[cell_rows] = group_avoiding[:len(cell_rows)]
+        return [keys[row] for row in np.flatnonzero(crashed)], [keys[row] for row in np.flatnonzero(avoiding)]
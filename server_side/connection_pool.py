@@ -1,9 +1,74 @@
-import schedule
+import os
+import pathlib
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from threading import Lock
 from sqlite3 import Error
 from common.serialization_utils import SerializeUtils
-from common.config_variables import db_file
+from common.config_variables import db_file, DB_PROFILES, DB_PROFILE
+
+
+class ConnectionFactory:
+    """
+    Opens SQLite connections tuned with the pragmas of a profile.
+
+    Read-only connections are opened with a mode=ro URI, so a reader can never take the write lock of the database.
+    The journal mode is stored in the database file, so it's set by the writable connections only.
+
+    Attributes:
+    - profile (str): Name of the tuning profile.
+    - pragmas (dict): Pragmas of the profile mapped to their values.
+    - persistent_pragmas (tuple): Pragmas changing the database file, not applied to the read-only connections.
+    """
+
+    persistent_pragmas = ("journal_mode", )
+
+    def __init__(self, profile = None):
+        """
+        Initializes the factory.
+
+        Parameters:
+        - profile (str, optional): Name of the tuning profile, DB_PROFILE if not given.
+        """
+        self.profile = profile or DB_PROFILE
+        self.pragmas = DB_PROFILES[self.profile]
+
+    def connect(self, db_file, read_only = False):
+        """
+        Opens a connection to the database and applies the pragmas of the profile.
+        A read-only connection to a database which doesn't exist yet creates an empty database file first.
+
+        Parameters:
+        - db_file (str): The path to the SQLite database file.
+        - read_only (bool): Flag indicating whether the connection only reads.
+
+        Returns:
+        - sqlite3.Connection: The tuned connection.
+        """
+        if read_only:
+            if not os.path.exists(db_file):
+                sqlite3.connect(db_file).close()
+            connection = sqlite3.connect(f"{pathlib.Path(db_file).resolve().as_uri()}?mode=ro", uri = True, check_same_thread = False)
+        else:
+            connection = sqlite3.connect(db_file, check_same_thread = False)
+        self.apply_profile(connection, read_only)
+        return connection
+
+    def apply_profile(self, connection, read_only = False):
+        """
+        Applies the pragmas of the profile to the connection.
+
+        Parameters:
+        - connection (sqlite3.Connection): The tuned connection.
+        - read_only (bool): Flag indicating whether the connection only reads.
+        """
+        for pragma, value in self.pragmas.items():
+            if read_only and pragma in self.persistent_pragmas:
+                continue
+            connection.execute(f"PRAGMA {pragma} = {value}")
 
 
 class Connection:
@@ -12,96 +77,222 @@ class Connection:
 
     Attributes:
     - db_file (str): The path to the SQLite database file.
+    - read_only (bool): Flag indicating whether the connection only reads.
+    - factory (ConnectionFactory): Factory opening the connection with the pragmas of its profile.
     - connection: SQLite connection object.
     - cursor: Cursor object for executing SQL queries.
     - in_use (bool): Flag indicating whether the connection is in use.
+    - last_used (float): Monotonic time at which the connection was created or last returned to the pool.
     """
 
-    def __init__(self, db_file):
+    def __init__(self, db_file, read_only = False, factory = None):
         """
         Initializes a database connection.
 
         Parameters:
         - db_file (str): The path to the SQLite database file.
+        - read_only (bool, optional): Flag indicating whether the connection only reads, e.g. for the APIs.
+        - factory (ConnectionFactory, optional): Factory opening the connection, with the DB_PROFILE if not given.
         """
         self.db_file = db_file
+        self.read_only = read_only
+        self.factory = factory or ConnectionFactory()
         self.connection = self.create_connection()
         self.cursor = self.connection.cursor()
         self.in_use = False
+        self.last_used = time.monotonic()
 
     def create_connection(self):
         """
-        Creates a connection to the SQLite database.
+        Creates a connection to the SQLite database with the connection factory.
 
         Returns:
         sqlite3.Connection or None: The connection object if successful, None otherwise.
         """
         try:
-            with sqlite3.connect(self.db_file, check_same_thread = False) as connection:
-                return connection
+            return self.factory.connect(self.db_file, self.read_only)
         except Error as e:
             print(f"Error: {e}")
             return None
 
+    def is_valid(self):
+        """
+        Checks whether the connection still works, with the cheapest possible query.
+
+        Returns:
+        - bool: True if the connection answered, False otherwise.
+        """
+        try:
+            self.connection.execute("SELECT 1").fetchone()
+            return True
+        except Error:
+            return False
+
+
+class PoolTimeoutError(Exception):
+    """
+    Raised when no database connection becomes free in the pool before the timeout.
+    """
+
 
 class ConnectionPool:
     """
     Manages a pool of database connections.
 
+    The free connections wait in a bounded LIFO queue, so taking and returning a connection is O(1)
+    and the most recently used connections are reused first. When every connection is in use
+    and the pool has reached its maximum, get_connection waits for a returned connection
+    instead of failing at once. Every connection is validated before it's handed out, and the maintenance thread
+    closes the connections which stayed free for longer than the idle TTL, down to the minimum number.
+
     Attributes:
-    - connections_list (list): List of available connections.
-    - connections_in_use_list (list): List of connections currently in use.
-    - lock (threading.Lock): Lock for thread-safe access to the connection pool.
+    - idle_connections (queue.LifoQueue): Connections which are free to use.
+    - connections_in_use (set): Connections currently in use.
+    - lock (threading.Lock): Lock for thread-safe access to the number of connections and the statistics.
     - min_number_of_connections (int): Minimum number of connections to maintain.
     - max_number_of_connections (int): Maximum number of connections allowed in the pool.
+    - acquire_timeout (float): Default number of seconds get_connection waits for a free connection.
+    - number_of_connections (int): Number of open connections of the pool, free and in use.
+    - acquisitions (int): Number of connections handed out.
+    - waits (int): Number of acquisitions which had to wait for a free connection.
+    - timeouts (int): Number of acquisitions which gave up waiting.
+    - total_wait_time (float): Seconds spent waiting for free connections.
+    - max_wait_time (float): Longest wait for a free connection, in seconds.
+    - idle_ttl (float): Number of seconds after which a free connection above the minimum number is closed.
+    - created (int): Number of connections opened by the pool.
+    - evicted (int): Number of free connections closed after the idle TTL or above the minimum number.
+    - invalid (int): Number of connections which failed the validation and were closed.
+    - maintenance (PoolMaintenance): Thread evicting the idle connections and keeping the minimum number of connections.
     - serialize_utils (SerializeUtils): Utility for serialization.
     """
 
-    def __init__(self, min_numbers_of_connections, max_number_of_connections):
+    def __init__(self, min_numbers_of_connections, max_number_of_connections, acquire_timeout = 5, idle_ttl = 300,
+                 maintenance_interval = 60):
         """
         Initializes the connection pool.
 
         Parameters:
         - min_number_of_connections (int): Minimum number of connections to maintain.
         - max_number_of_connections (int): Maximum number of connections allowed in the pool.
+        - acquire_timeout (float): Default number of seconds get_connection waits for a free connection.
+        - idle_ttl (float): Number of seconds after which a free connection above the minimum number is closed.
+        - maintenance_interval (float): Number of seconds between the runs of the maintenance thread.
         """
-        self.connections_list = []
-        self.connections_in_use_list = []
+        self.idle_connections = queue.LifoQueue(maxsize = max_number_of_connections)
+        self.connections_in_use = set()
         self.lock = Lock()
         self.min_number_of_connections = min_numbers_of_connections
         self.max_number_of_connections = max_number_of_connections
+        self.acquire_timeout = acquire_timeout
+        self.number_of_connections = 0
+        self.acquisitions = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.total_wait_time = 0
+        self.max_wait_time = 0
+        self.idle_ttl = idle_ttl
+        self.created = 0
+        self.evicted = 0
+        self.invalid = 0
         self.create_start_connections()
         self.serialize_utils = SerializeUtils()
+        self.maintenance = PoolMaintenance(self, maintenance_interval)
         self.connections_manager()
 
     def create_start_connections(self):
         """Creates the initial connections in the pool."""
         for _ in range(self.min_number_of_connections):
-            connection = Connection(db_file)
-            self.connections_list.append(connection)
+            self.number_of_connections += 1
+            self.created += 1
+            self.idle_connections.put_nowait(Connection(db_file))
+
+    def create_connection_if_allowed(self):
+        """
+        Opens a new connection, if the pool hasn't reached its maximum.
+
+        Returns:
+        - Connection or None: The new connection, None if the pool is full.
+        """
+        with self.lock:
+            if self.number_of_connections >= self.max_number_of_connections:
+                return None
+            self.number_of_connections += 1
+            self.created += 1
+        return Connection(db_file)
+
+    def get_connection(self, timeout = None):
+        """
+        Retrieves a connection from the pool. A free connection is taken at once, otherwise a new one is opened,
+        and when the pool is full the call waits until another thread releases a connection.
+        A free connection which fails the validation is closed and the next one is taken.
+
+        Parameters:
+        - timeout (float, optional): Number of seconds to wait for a free connection, the pool's acquire_timeout if not given.
+
+        Returns:
+        - Connection: A connection object.
 
-    def get_connection(self):
+        Raises:
+        - PoolTimeoutError: If no connection became free before the timeout.
         """
-        Retrieves a connection from the pool.
+        timeout = self.acquire_timeout if timeout is None else timeout
+        while True:
+            try:
+                connection = self.idle_connections.get_nowait()
+            except queue.Empty:
+                connection = self.create_connection_if_allowed()
+                if connection is None:
+                    connection = self.wait_for_connection(timeout)
+            if connection.is_valid():
+                break
+            self.close_invalid_connection(connection)
+        with self.lock:
+            connection.in_use = True
+            self.connections_in_use.add(connection)
+            self.acquisitions += 1
+        return connection
+
+    def wait_for_connection(self, timeout):
+        """
+        Waits for a connection released by another thread, and records the wait.
+
+        Parameters:
+        - timeout (float): Number of seconds to wait.
 
         Returns:
-        - Connection: A connection object if available, False otherwise.
+        - Connection: The released connection.
+
+        Raises:
+        - PoolTimeoutError: If no connection became free before the timeout.
         """
+        started_at = time.monotonic()
+        try:
+            connection = self.idle_connections.get(timeout = timeout)
+        except queue.Empty:
+            with self.lock:
+                self.timeouts += 1
+            raise PoolTimeoutError(f"No database connection became free in {timeout} s")
+        wait_time = time.monotonic() - started_at
         with self.lock:
-            for connection in self.connections_list:
-                if connection.in_use == False:
-                    connection.in_use = True
-                    self.connections_in_use_list.append(connection)
-                    self.connections_list.remove(connection)
-                    return connection
-            if len(self.connections_list) < self.max_number_of_connections \
-                    and len(self.connections_list) + len(self.connections_in_use_list) < self.max_number_of_connections:
-                new_connection = Connection(db_file)
-                new_connection.in_use = True
-                self.connections_in_use_list.append(new_connection)
-                return new_connection
-            elif len(self.connections_list) + len(self.connections_in_use_list) >= self.max_number_of_connections:
-                return False
+            self.waits += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+        return connection
+
+    def close_invalid_connection(self, connection):
+        """
+        Closes a connection which failed the validation, making room for a new one.
+
+        Parameters:
+        - connection (Connection): The broken connection.
+        """
+        with self.lock:
+            self.number_of_connections -= 1
+            self.invalid += 1
+        try:
+            connection.connection.close()
+        except Error:
+            pass
 
     def release_connection(self, connection):
         """
@@ -111,31 +302,178 @@ class ConnectionPool:
         - connection (Connection): The connection to release.
         """
         with self.lock:
-            if connection in self.connections_in_use_list:
-                connection.in_use = False
-                self.connections_list.append(connection)
-                self.connections_in_use_list.remove(connection)
+            if connection not in self.connections_in_use:
+                return
+            self.connections_in_use.remove(connection)
+            connection.in_use = False
+            connection.last_used = time.monotonic()
+        self.idle_connections.put_nowait(connection)
+
+    def discard_connection(self, connection):
+        """
+        Closes a connection in use instead of returning it to the pool, e.g. when it's broken.
+
+        Parameters:
+        - connection (Connection): The connection to discard.
+        """
+        with self.lock:
+            if connection not in self.connections_in_use:
+                return
+            self.connections_in_use.remove(connection)
+            self.number_of_connections -= 1
+        connection.in_use = False
+        connection.connection.close()
+
+    @contextmanager
+    def connection(self, timeout = None):
+        """
+        Lends a connection for the with block and releases it at the end of the block.
+
+        Parameters:
+        - timeout (float, optional): Number of seconds to wait for a free connection, the pool's acquire_timeout if not given.
+
+        Yields:
+        - Connection: A connection object.
+        """
+        connection = self.get_connection(timeout)
+        try:
+            yield connection
+        finally:
+            self.release_connection(connection)
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: Number of open, free and used connections, the usage of the pool, number of opened, evicted and invalid
+          connections, handed out connections, waits, timeouts and the average and the longest wait time, in seconds.
+        """
+        with self.lock:
+            return {
+                "connections": self.number_of_connections,
+                "idle": self.idle_connections.qsize(),
+                "in_use": len(self.connections_in_use),
+                "usage": len(self.connections_in_use) / self.max_number_of_connections,
+                "created": self.created,
+                "evicted": self.evicted,
+                "invalid": self.invalid,
+                "acquisitions": self.acquisitions,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "average_wait_time": self.total_wait_time / self.waits if self.waits else 0,
+                "max_wait_time": self.max_wait_time
+            }
 
     def destroy_unused_connections(self):
-        """Destroys unused connections in excess of the minimum number."""
+        """Destroys free connections in excess of the minimum number."""
+        while True:
+            with self.lock:
+                if self.number_of_connections <= self.min_number_of_connections:
+                    return
+                try:
+                    connection = self.idle_connections.get_nowait()
+                except queue.Empty:
+                    return
+                self.number_of_connections -= 1
+                self.evicted += 1
+            connection.connection.close()
+
+    def evict_idle_connections(self):
+        """
+        Closes the free connections which weren't used for longer than the idle TTL, down to the minimum number.
+        The free connections are taken out of the LIFO queue, the oldest ones at its bottom are checked first,
+        and the fresh ones are put back in their order.
+
+        Returns:
+        - int: Number of closed connections.
+        """
+        expired = []
+        now = time.monotonic()
         with self.lock:
-            for connection in self.connections_list:
-                if len(self.connections_list) >= 11:
-                    connection.connection.close()
-                    self.connections_list.remove(connection)
-                    if len(self.connections_list) <= 10:
-                        break
+            idle = []
+            while True:
+                try:
+                    idle.append(self.idle_connections.get_nowait())
+                except queue.Empty:
+                    break
+            while idle and self.number_of_connections > self.min_number_of_connections \
+                    and now - idle[-1].last_used >= self.idle_ttl:
+                expired.append(idle.pop())
+                self.number_of_connections -= 1
+            for connection in reversed(idle):
+                self.idle_connections.put_nowait(connection)
+            self.evicted += len(expired)
+        for connection in expired:
+            connection.connection.close()
+        return len(expired)
 
     def keep_connections_at_the_starting_level(self):
         """Ensures the connection pool maintains the minimum number of connections."""
-        if len(self.connections_list) < self.min_number_of_connections:
-            for _ in self.connections_list:
-                connection = Connection(db_file)
-                self.connections_list.append(connection)
-                if len(self.connections_list) == self.min_number_of_connections:
-                    break
+        while True:
+            with self.lock:
+                if self.number_of_connections >= self.min_number_of_connections:
+                    return
+                self.number_of_connections += 1
+                self.created += 1
+            self.idle_connections.put_nowait(Connection(db_file))
+
+    def maintain(self):
+        """
+        Runs the maintenance of the pool - evicts the idle connections and keeps the minimum number of connections.
+        """
+        self.evict_idle_connections()
+        self.keep_connections_at_the_starting_level()
 
     def connections_manager(self):
-        """Manages connection pool tasks."""
-        schedule.every(1).minute.do(self.keep_connections_at_the_starting_level)
-        schedule.every(1).minute.do(self.destroy_unused_connections)
+        """Starts the maintenance thread of the pool."""
+        self.maintenance.start()
+
+    def close(self):
+        """
+        Stops the maintenance thread and closes the free connections, when the server_side stops.
+        """
+        self.maintenance.stop()
+        while True:
+            try:
+                connection = self.idle_connections.get_nowait()
+            except queue.Empty:
+                break
+            with self.lock:
+                self.number_of_connections -= 1
+            connection.connection.close()
+
+
+class PoolMaintenance(threading.Thread):
+    """
+    Background thread running the maintenance of the connection pool at a fixed interval.
+
+    Attributes:
+    - pool (ConnectionPool): The maintained pool.
+    - interval (float): Number of seconds between the runs of the maintenance.
+    - stop_event (threading.Event): Event waking the thread up when it's stopped.
+    """
+
+    def __init__(self, pool, interval):
+        """
+        Initializes the maintenance thread.
+
+        Parameters:
+        - pool (ConnectionPool): The maintained pool.
+        - interval (float): Number of seconds between the runs of the maintenance.
+        """
+        super().__init__(daemon = True)
+        self.pool = pool
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def run(self):
+        """
+        Runs the maintenance of the pool until the thread is stopped.
+        """
+        while not self.stop_event.wait(self.interval):
+            self.pool.maintain()
+
+    def stop(self):
+        """
+        Stops the maintenance thread.
+        """
+        self.stop_event.set()
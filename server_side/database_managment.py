@@ -4,8 +4,45 @@ from sqlite3 import Error
 class DatabaseUtils:
     """
     Utility class for executing SQL queries and managing database tables.
+
+    The server_side remembers the ID of the period it started and every later write uses it,
+    without asking the database. Readers, which don't start periods, read the latest period
+    or pass the period_id they want.
+
+    The schema is versioned with the database's user_version - create_db_tables runs every migration
+    newer than the version of the database, so older databases are brought up to date when the server_side starts.
+
+    The numbers of airplanes of every period are kept in the period_counters table by triggers of the connections table,
+    so they're read with a single row lookup, whatever the path of the write.
+
+    Attributes:
+    - period_id (int): ID of the server_side period of this object, None to use the latest period in the database.
+    - migrations (list): Versions of the schema with the methods bringing the database to them, in order.
+    - status_counters (dict): Statuses of the airplanes mapped to the columns of period_counters counting them.
     """
 
+    migrations = [
+        (1, "create_tables_migration"),
+        (2, "create_indexes_migration"),
+        (3, "create_period_counters_migration")
+    ]
+
+    status_counters = {
+        None: "in_the_air",
+        "SUCCESSFULLY LANDING": "landed",
+        "CRASHED BY OUT OF FUEL": "crashed_by_out_of_fuel",
+        "CRASHED BY COLLISION": "crashed_by_collision"
+    }
+
+    def __init__(self, period_id = None):
+        """
+        Initializes the database utilities.
+
+        Parameters:
+        - period_id (int, optional): ID of the server_side period to work with, None to use the latest period.
+        """
+        self.period_id = period_id
+
     def execute_sql_query(self, connection, query, *args, fetch_option = None):
         """
         Execute an SQL query on the database.
@@ -34,7 +71,49 @@ class DatabaseUtils:
 
     def create_db_tables(self, connection):
         """
-        Create database tables if they do not exist.
+        Create database tables if they do not exist, and bring the schema to the latest version.
+
+        Parameters:
+        - connection: Database connection object.
+        """
+        self.migrate(connection)
+
+    def get_schema_version(self, connection):
+        """
+        Retrieves the version of the database schema.
+
+        Parameters:
+        - connection: Database connection object.
+
+        Returns:
+        - int: Version of the schema, 0 for a new database.
+        """
+        return self.execute_sql_query(connection, "PRAGMA user_version", fetch_option = "fetchone")[0]
+
+    def migrate(self, connection, version = None):
+        """
+        Runs the migrations newer than the version of the database schema, and records the version after each of them.
+        The migrations only create what doesn't exist yet, so a migration interrupted in the middle can be run again.
+
+        Parameters:
+        - connection: Database connection object.
+        - version (int, optional): Version to migrate to, the latest one if not given.
+
+        Returns:
+        - int: Version of the schema after the migration.
+        """
+        current_version = self.get_schema_version(connection)
+        for migration_version, migration in self.migrations:
+            if migration_version <= current_version or (version is not None and migration_version > version):
+                continue
+            getattr(self, migration)(connection)
+            self.execute_sql_query(connection, f"PRAGMA user_version = {int(migration_version)}")
+            current_version = migration_version
+        return current_version
+
+    def create_tables_migration(self, connection):
+        """
+        Migration 1 - the server_periods and connections tables.
 
         Parameters:
         - connection: Database connection object.
@@ -42,6 +121,58 @@ class DatabaseUtils:
         self.create_server_periods_table(connection)
         self.create_connections_table(connection)
 
+    def create_indexes_migration(self, connection):
+        """
+        Migration 2 - covering indexes of the connections of a period, by airplane and by status.
+        The lookups of a single airplane and of the airplanes with a status are answered from the indexes,
+        without scanning the table.
+
+        Parameters:
+        - connection: Database connection object.
+        """
+        self.execute_sql_query(connection, """CREATE INDEX IF NOT EXISTS connections_period_airplane
+                                          ON connections (period_id, airplane_id, status, connection_date)""")
+        self.execute_sql_query(connection, """CREATE INDEX IF NOT EXISTS connections_period_status
+                                          ON connections (period_id, status, airplane_id, connection_date)""")
+
+    def create_period_counters_migration(self, connection):
+        """
+        Migration 3 - the period_counters table with the numbers of airplanes of every period, by status,
+        the triggers keeping them up to date and the counters of the periods which already exist.
+
+        Parameters:
+        - connection: Database connection object.
+        """
+        statuses = {column: "NULL" if status is None else f"'{status}'" for status, column in self.status_counters.items()}
+        columns = ", ".join(f"{column} INTEGER NOT NULL DEFAULT 0" for column in statuses)
+        self.execute_sql_query(connection, f"""CREATE TABLE IF NOT EXISTS period_counters(
+                                           period_id INTEGER PRIMARY KEY,
+                                           total INTEGER NOT NULL DEFAULT 0,
+                                           {columns},
+                                           FOREIGN KEY (period_id) REFERENCES server_periods (period_id) ON DELETE CASCADE
+                                           );""")
+        self.execute_sql_query(connection, """CREATE TRIGGER IF NOT EXISTS period_counters_new_period
+                                          AFTER INSERT ON server_periods BEGIN
+                                          INSERT OR IGNORE INTO period_counters (period_id) VALUES (NEW.period_id);
+                                          END""")
+        new_connection = ", ".join(f"{column} = {column} + (NEW.status IS {status})" for column, status in statuses.items())
+        self.execute_sql_query(connection, f"""CREATE TRIGGER IF NOT EXISTS period_counters_new_connection
+                                           AFTER INSERT ON connections BEGIN
+                                           INSERT OR IGNORE INTO period_counters (period_id) VALUES (NEW.period_id);
+                                           UPDATE period_counters SET total = total + 1, {new_connection} WHERE period_id = NEW.period_id;
+                                           END""")
+        new_status = ", ".join(f"{column} = {column} - (OLD.status IS {status}) + (NEW.status IS {status})"
+                               for column, status in statuses.items())
+        self.execute_sql_query(connection, f"""CREATE TRIGGER IF NOT EXISTS period_counters_new_status
+                                           AFTER UPDATE OF status ON connections BEGIN
+                                           UPDATE period_counters SET {new_status} WHERE period_id = NEW.period_id;
+                                           END""")
+        counted = ", ".join(f"SUM(connection_id IS NOT NULL AND status IS {status})" for status in statuses.values())
+        self.execute_sql_query(connection, f"""INSERT OR IGNORE INTO period_counters
+                                           SELECT server_periods.period_id, COUNT(connection_id), {counted}
+                                           FROM server_periods LEFT JOIN connections ON connections.period_id = server_periods.period_id
+                                           GROUP BY server_periods.period_id""")
+
     def create_server_periods_table(self, connection):
         """
         Create the server_periods table if it does not exist.
@@ -75,27 +206,33 @@ class DatabaseUtils:
 
     def add_new_server_period(self, connection):
         """
-        Adds a new server_side period to the database.
+        Adds a new server_side period to the database and makes it the period of this object.
 
         Parameters:
         - connection: Database connection object.
+
+        Returns:
+        - int: ID of the new period.
         """
         query = "INSERT INTO server_periods DEFAULT VALUES"
         self.execute_sql_query(connection, query)
+        self.period_id = connection.cursor.lastrowid
+        return self.period_id
 
-    def add_new_connection_to_db(self, connection, airplane_id):
+    def add_new_connection_to_db(self, connection, airplane_id, period_id = None):
         """
         Adds a new connection to the database.
 
         Parameters:
         - connection: Database connection object.
         - airplane_id: ID of the airplane to add to the database.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "INSERT INTO connections (period_id, airplane_id) VALUES (?, ?)"
         self.execute_sql_query(connection, query, (period_id, airplane_id))
 
-    def update_connection_status(self, connection, status, airplane_id):
+    def update_connection_status(self, connection, status, airplane_id, period_id = None):
         """
         Updates the status of a connection in the database.
 
@@ -103,25 +240,63 @@ class DatabaseUtils:
         - connection: Database connection object.
         - status: New status value.
         - airplane_id: ID of the airplane whose connection status is to be updated.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "UPDATE connections SET status = ? WHERE connection_id = (SELECT connection_id FROM connections WHERE period_id = ? AND airplane_id = ?)"
         self.execute_sql_query(connection, query, (status, period_id, airplane_id))
 
-    def update_period_end(self, connection):
+    def write_batch(self, connection, new_connections, status_updates):
+        """
+        Writes a batch of new connections and status updates in one transaction, with one executemany per kind of write.
+        The new connections are written first, so a status update finds the connection added in the same batch.
+
+        Parameters:
+        - connection: Database connection object.
+        - new_connections (list): Tuples (period_id, airplane_id, connection_date) of the new connections.
+        - status_updates (list): Tuples (status, period_id, airplane_id) of the status updates, in order of arrival.
+        """
+        with connection.connection:
+            if new_connections:
+                connection.cursor.executemany("INSERT INTO connections (period_id, airplane_id, connection_date) VALUES (?, ?, ?)",
+                                              new_connections)
+            if status_updates:
+                connection.cursor.executemany("UPDATE connections SET status = ? WHERE connection_id = "
+                                              "(SELECT connection_id FROM connections WHERE period_id = ? AND airplane_id = ?)",
+                                              status_updates)
+
+    def update_period_end(self, connection, period_id = None):
         """
         Updates the end time of the current server_side period in the database.
 
         Parameters:
         - connection: Database connection object.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "UPDATE server_periods SET period_end = CURRENT_TIMESTAMP WHERE period_id = ?"
         self.execute_sql_query(connection, query, (period_id, ))
 
+    def resolve_period_id(self, connection, period_id = None):
+        """
+        Establishes the period of the query - the given one, the period of this object, or the latest period in the database.
+
+        Parameters:
+        - connection: Database connection object.
+        - period_id (int, optional): ID of the requested period.
+
+        Returns:
+        - int: ID of the period.
+        """
+        if period_id is not None:
+            return period_id
+        if self.period_id is not None:
+            return self.period_id
+        return self.get_period_id(connection)
+
     def get_period_id(self, connection):
         """
-        Retrieves the ID of the current server_side period from the database.
+        Retrieves the ID of the latest server_side period from the database.
 
         Parameters:
         - connection: Database connection object.
@@ -133,66 +308,82 @@ class DatabaseUtils:
         period_id = self.execute_sql_query(connection, period_id_query, fetch_option = "fetchone")[0]
         return int(period_id)
 
-    def get_last_period_start_date(self, connection):
+    def get_last_period_start_date(self, connection, period_id = None):
         """
         Retrieves the current server start from database.
 
         Parameters:
         - connection: Database connection object.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
 
         Returns:
         - str: server start date in string type.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "SELECT period_start FROM server_periods WHERE period_id = ?"
         period_start_date = self.execute_sql_query(connection, query, (period_id, ), fetch_option = "fetchone")[0]
         return period_start_date
 
-    def get_airplanes_with_specified_status_per_period(self, connection, status):
+    def get_airplanes_with_specified_status_per_period(self, connection, status, period_id = None):
         """
         Retrieves airplanes list with specified status - in the air, successfully landed or crashed
 
         Parameters:
         - connection: Database connection object.
         - status: string represents status (or None for NULL).
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
 
         Returns:
         - list: airplane_id with appearance time.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "SELECT airplane_id, connection_date FROM connections WHERE period_id = ? AND (status = ? OR status IS NULL)"
         airplanes_with_status = self.execute_sql_query(connection, query, (period_id, status), fetch_option = "fetchall")
         return airplanes_with_status
 
-    def get_single_airplane_details(self, connection, id):
+    def get_single_airplane_details(self, connection, id, period_id = None):
         """
         Retrieves single airplane details.
 
         Parameters:
         - connection: Database connection object.
         - id: airplane id.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
 
         Returns:
         - airplane_id, airplane_connection_date and status.
         """
-        period_id = self.get_period_id(connection)
+        period_id = self.resolve_period_id(connection, period_id)
         query = "SELECT airplane_id, connection_date, status FROM connections WHERE period_id = ? AND airplane_id = ?"
         airplane_details = self.execute_sql_query(connection, query, (period_id, id), fetch_option = "fetchone")
         return airplane_details
 
-    def get_all_airplanes_number_per_period(self, connection):
+    def get_all_airplanes_number_per_period(self, connection, period_id = None):
         """
-        Retrieves the number of airplanes for the current period from the database.
+        Retrieves the number of airplanes for the current period from the counters of the period.
 
         Parameters:
         - connection: Database connection object.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
 
         Returns:
         - int: Number of airplanes for the current period.
         """
-        period_id = self.get_period_id(connection)
-        query = "SELECT * FROM connections WHERE period_id = ?"
-        airplanes_list = self.execute_sql_query(connection, query, (period_id, ), fetch_option = "fetchall")
-        if airplanes_list == None:
-            return 0
-        return len(airplanes_list)
+        return self.get_period_counters(connection, period_id)["total"]
+
+    def get_period_counters(self, connection, period_id = None):
+        """
+        Retrieves the counters of the period - the number of all airplanes and of the airplanes with every status.
+
+        Parameters:
+        - connection: Database connection object.
+        - period_id (int, optional): ID of the period, the period of this object or the latest one if not given.
+
+        Returns:
+        - dict: Names of the counters mapped to their values, zeros if the period has no counters.
+        """
+        period_id = self.resolve_period_id(connection, period_id)
+        names = ["total", *self.status_counters.values()]
+        query = f"SELECT {', '.join(names)} FROM period_counters WHERE period_id = ?"
+        counters = self.execute_sql_query(connection, query, (period_id, ), fetch_option = "fetchone")
+        return dict(zip(names, counters or [0] * len(names)))
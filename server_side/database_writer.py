@@ -0,0 +1,197 @@
+import queue
+import threading
+import time
+
+
+class DatabaseWriter(threading.Thread):
+    """
+    Background thread writing the connections and the statuses of the airplanes to the database.
+
+    The handlers only put the events in a queue, so they never wait for the database write lock or for the disk.
+    The writer takes every event waiting in the queue, up to the batch size, and writes them in one transaction -
+    when the events arrive faster, the batches simply grow, and the number of commits stays low.
+
+    Attributes:
+    - connection_pool (ConnectionPool): Pool from which the writer takes its connection.
+    - database_utils (DatabaseUtils): Utility writing the batches, with the period of the server_side.
+    - batch_size (int): Maximum number of events written in one transaction.
+    - events (queue.Queue): Events waiting to be written.
+    - stop_event (threading.Event): Event set when the writer is stopped.
+    - batches (int): Number of written batches.
+    - written_events (int): Number of written events.
+    - failed_events (int): Number of events lost in batches which failed.
+    - logger: The logger object, None to print the errors.
+    """
+
+    def __init__(self, connection_pool, database_utils, batch_size = 500, poll_interval = 0.1, logger = None):
+        """
+        Initializes the writer.
+
+        Parameters:
+        - connection_pool (ConnectionPool): Pool from which the writer takes its connection.
+        - database_utils (DatabaseUtils): Utility writing the batches, with the period of the server_side.
+        - batch_size (int): Maximum number of events written in one transaction.
+        - poll_interval (float): Number of seconds the writer waits for an event before it checks whether it's stopped.
+        - logger: The logger object, None to print the errors.
+        """
+        super().__init__(daemon = True)
+        self.connection_pool = connection_pool
+        self.database_utils = database_utils
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.events = queue.Queue()
+        self.stop_event = threading.Event()
+        self.batches = 0
+        self.written_events = 0
+        self.failed_events = 0
+        self.logger = logger
+
+    def add_new_connection(self, airplane_id):
+        """
+        Queues a new connection of the airplane, with the time of its arrival.
+
+        Parameters:
+        - airplane_id (str): ID of the connected airplane.
+        """
+        connection_date = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        self.events.put(("connection", (self.database_utils.period_id, airplane_id, connection_date)))
+
+    def update_connection_status(self, status, airplane_id):
+        """
+        Queues a new status of the airplane.
+
+        Parameters:
+        - status (str): New status of the airplane.
+        - airplane_id (str): ID of the airplane.
+        """
+        self.events.put(("status", (status, self.database_utils.period_id, airplane_id)))
+
+    def take_batch(self):
+        """
+        Waits for an event and takes it together with the events waiting behind it, up to the batch size.
+
+        Returns:
+        - list: The taken events, empty if none came before the poll interval.
+        """
+        try:
+            batch = [self.events.get(timeout = self.poll_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def log_error(self, message):
+        """
+        Logs the error of the writer, or prints it when the writer has no logger.
+
+        Parameters:
+        - message (str): Description of the error.
+        """
+        if self.logger is None:
+            print(f"Error: {message}")
+        else:
+            self.logger.error(message)
+
+    def drop_batch(self, batch, reason):
+        """
+        Counts the events of the batch as lost and logs the reason.
+
+        Parameters:
+        - batch (list): The lost events.
+        - reason: The error which made the batch lost.
+        """
+        self.failed_events += len(batch)
+        self.log_error(f"Batch of {len(batch)} database events lost: {reason}")
+
+    def write_batch(self, connection, batch):
+        """
+        Writes the batch in one transaction. The events queued before the period of the server_side was known
+        go to the current period. A batch which failed, with any error, is logged and dropped,
+        so a broken event doesn't stop the writing of the next ones.
+
+        Parameters:
+        - connection (Connection): The writer's database connection.
+        - batch (list): The events to write.
+        """
+        try:
+            period_id = self.database_utils.resolve_period_id(connection)
+            new_connections = [(row[0] or period_id, ) + row[1:] for kind, row in batch if kind == "connection"]
+            status_updates = [(row[0], row[1] or period_id, row[2]) for kind, row in batch if kind == "status"]
+            self.database_utils.write_batch(connection, new_connections, status_updates)
+            self.batches += 1
+            self.written_events += len(batch)
+        except Exception as e:
+            self.drop_batch(batch, e)
+        finally:
+            for _ in batch:
+                self.events.task_done()
+
+    def acquire_connection(self):
+        """
+        Takes the writer's connection from the pool. When the pool has no free connection, the error is logged
+        and the writer tries again after the poll interval, until it's stopped.
+
+        Returns:
+        - Connection or None: The connection, None if the writer was stopped before it got one.
+        """
+        while True:
+            try:
+                return self.connection_pool.get_connection()
+            except Exception as e:
+                self.log_error(f"Database writer has no connection: {e}")
+                if self.stop_event.wait(self.poll_interval):
+                    return None
+
+    def run(self):
+        """
+        Writes the queued events until the writer is stopped and the queue is empty.
+        When the writer is stopped before it got a connection, the queued events are counted as lost,
+        so flush never waits for events which can't be written.
+        """
+        connection = self.acquire_connection()
+        if connection is None:
+            batch = self.take_batch()
+            while batch:
+                self.drop_batch(batch, "no database connection")
+                for _ in batch:
+                    self.events.task_done()
+                batch = self.take_batch()
+            return
+        try:
+            while not self.stop_event.is_set() or not self.events.empty():
+                batch = self.take_batch()
+                if batch:
+                    self.write_batch(connection, batch)
+        finally:
+            self.connection_pool.release_connection(connection)
+
+    def flush(self):
+        """
+        Waits until every queued event is written.
+        """
+        self.events.join()
+
+    def stop(self):
+        """
+        Stops the writer after writing every queued event, when the server_side stops.
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: Number of queued, written and lost events, number of batches and the average size of a batch.
+        """
+        return {
+            "queued": self.events.qsize(),
+            "written": self.written_events,
+            "failed": self.failed_events,
+            "batches": self.batches,
+            "average_batch_size": self.written_events / self.batches if self.batches else 0
+        }
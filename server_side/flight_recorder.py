@@ -0,0 +1,296 @@
+import json
+import os
+import threading
+import numpy as np
+from common.clock import create_clock
+from common.config_variables import flights_dir
+from common.message_template import MessageTemplate
+
+
+class FlightRecorder:
+    """
+    Records every applied coordinate update of the airplanes, with the command the server_side issued in reply,
+    in memory-mapped column files - one directory per server_side period and one file of fixed-size records per column.
+
+    A record is written straight into the mapped pages, so recording costs a few array stores and no system call.
+    The files grow by doubling, and the number of written records is saved in the meta file of the period
+    when the recorder is flushed, so a FlightRecording can read the period while it's still recorded.
+
+    Attributes:
+    - columns (dict): Names of the columns mapped to the NumPy types of their values.
+    - commands (dict): Names of the commands mapped to their codes in the records, None for no command.
+    - directory (str): Directory of the recordings of all periods.
+    - clock: Clock of the timestamps, in seconds from the start of the period.
+    - initial_capacity (int): Number of records of the files of a new period.
+    - lock (threading.Lock): Lock for thread-safe appending of the records.
+    - period_id (int): ID of the recorded period, None before the recording starts.
+    - period_directory (str): Directory of the column files of the recorded period.
+    - start_date (datetime): Date of the start of the period.
+    - start_time (float): Time of the clock at the start of the period.
+    - capacity (int): Number of records the files can hold before they grow.
+    - records (int): Number of written records.
+    - arrays (dict): Names of the columns mapped to their memory-mapped arrays, None while not recording.
+    """
+
+    columns = {"timestamp": "f8", "airplane_id": "u4", "x": "i4", "y": "i4", "z": "i4", "command": "u1"}
+    commands = {None: 0, "avoid_collision": MessageTemplate.codes["avoid_collision"], "collision": MessageTemplate.codes["collision"]}
+
+    def __init__(self, directory = flights_dir, clock = None, initial_capacity = 65536):
+        """
+        Initializes the recorder, the recording starts with start_period.
+
+        Parameters:
+        - directory (str): Directory of the recordings of all periods.
+        - clock: Clock of the timestamps, a wall clock if not given.
+        - initial_capacity (int): Number of records of the files of a new period.
+        """
+        self.directory = directory
+        self.clock = clock or create_clock()
+        self.initial_capacity = initial_capacity
+        self.lock = threading.Lock()
+        self.period_id = None
+        self.period_directory = None
+        self.start_date = None
+        self.start_time = 0
+        self.capacity = 0
+        self.records = 0
+        self.arrays = None
+
+    @staticmethod
+    def period_directory_name(directory, period_id):
+        """
+        Returns:
+        - str: Directory of the column files of the period.
+        """
+        return os.path.join(directory, f"period_{period_id}")
+
+    def start_period(self, period_id):
+        """
+        Creates the column files of the period and starts recording to them.
+
+        Parameters:
+        - period_id (int): ID of the server_side period.
+        """
+        with self.lock:
+            self.period_id = period_id
+            self.period_directory = self.period_directory_name(self.directory, period_id)
+            os.makedirs(self.period_directory, exist_ok = True)
+            self.start_date = self.clock.now()
+            self.start_time = self.clock.monotonic()
+            self.records = 0
+            self.map_columns(self.initial_capacity)
+        self.flush()
+
+    def column_file(self, name):
+        """
+        Returns:
+        - str: Path of the file of the column of the recorded period.
+        """
+        return os.path.join(self.period_directory, f"{name}.bin")
+
+    def unmap_columns(self):
+        """
+        Writes the mapped pages to the files and unmaps them. A mapped file can't be resized on Windows,
+        so the maps are closed before the files are truncated. Called with the lock held.
+        """
+        if self.arrays is None:
+            return
+        arrays = self.arrays
+        self.arrays = None
+        for name in list(arrays):
+            array = arrays.pop(name)
+            array.flush()
+            array._mmap.close()
+
+    def map_columns(self, capacity):
+        """
+        Resizes the column files to the capacity and maps them again. The records already written stay in place.
+
+        Parameters:
+        - capacity (int): Number of records the files have to hold.
+        """
+        self.unmap_columns()
+        arrays = {}
+        for name, dtype in self.columns.items():
+            with open(self.column_file(name), "ab") as column_file:
+                column_file.truncate(capacity * np.dtype(dtype).itemsize)
+            arrays[name] = np.memmap(self.column_file(name), dtype = dtype, mode = "r+", shape = (capacity, ))
+        self.arrays = arrays
+        self.capacity = capacity
+
+    def reserve(self, number):
+        """
+        Makes room for the next records, doubling the files when they are full. Called with the lock held.
+
+        Parameters:
+        - number (int): Number of records to append.
+        """
+        if self.records + number > self.capacity:
+            capacity = self.capacity
+            while self.records + number > capacity:
+                capacity *= 2
+            self.map_columns(capacity)
+
+    def record(self, airplane_id, coordinates, command = None):
+        """
+        Appends the coordinate update of an airplane.
+
+        Parameters:
+        - airplane_id (int): Identifier of the airplane.
+        - coordinates (list): x, y and z coordinates of the airplane.
+        - command (str, optional): Name of the command sent to the airplane in reply, None if there was none.
+        """
+        with self.lock:
+            if self.arrays is None:
+                return
+            self.reserve(1)
+            index = self.records
+            arrays = self.arrays
+            arrays["timestamp"][index] = self.clock.monotonic() - self.start_time
+            arrays["airplane_id"][index] = airplane_id
+            arrays["x"][index], arrays["y"][index], arrays["z"][index] = coordinates
+            arrays["command"][index] = self.commands[command]
+            self.records = index + 1
+
+    def record_batch(self, airplane_ids, coordinates, commands):
+        """
+        Appends the coordinate updates applied in one tick, with a single timestamp.
+
+        Parameters:
+        - airplane_ids (list): Identifiers of the airplanes.
+        - coordinates (list): x, y and z coordinates of every airplane.
+        - commands (list): Names of the commands sent to every airplane, None where there was none.
+        """
+        number = len(airplane_ids)
+        if number == 0:
+            return
+        coordinates = np.asarray(coordinates, dtype = "i4").reshape(number, 3)
+        with self.lock:
+            if self.arrays is None:
+                return
+            self.reserve(number)
+            records = slice(self.records, self.records + number)
+            arrays = self.arrays
+            arrays["timestamp"][records] = self.clock.monotonic() - self.start_time
+            arrays["airplane_id"][records] = airplane_ids
+            arrays["x"][records] = coordinates[:, 0]
+            arrays["y"][records] = coordinates[:, 1]
+            arrays["z"][records] = coordinates[:, 2]
+            arrays["command"][records] = [self.commands[command] for command in commands]
+            self.records += number
+
+    def flush(self):
+        """
+        Writes the mapped pages to the files and saves the number of records in the meta file of the period,
+        which is replaced at once, so a reader never sees it half written.
+        """
+        with self.lock:
+            if self.arrays is None:
+                return
+            for array in self.arrays.values():
+                array.flush()
+            meta = {"period_id": self.period_id, "start_date": self.start_date.isoformat(sep = " "),
+                    "records": self.records, "columns": self.columns}
+        meta_file = os.path.join(self.period_directory, "meta.json")
+        with open(f"{meta_file}.tmp", "w") as file:
+            json.dump(meta, file)
+        os.replace(f"{meta_file}.tmp", meta_file)
+
+    def close(self):
+        """
+        Flushes the recording and cuts the column files to the written records, when the server_side stops.
+        """
+        self.flush()
+        with self.lock:
+            if self.arrays is None:
+                return
+            self.unmap_columns()
+            for name, dtype in self.columns.items():
+                with open(self.column_file(name), "r+b") as column_file:
+                    column_file.truncate(self.records * np.dtype(dtype).itemsize)
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: ID of the recorded period, number of written records and the capacity of the files.
+        """
+        with self.lock:
+            return {"period_id": self.period_id, "records": self.records, "capacity": self.capacity}
+
+
+class FlightRecording:
+    """
+    Reads the recording of a period. The columns are NumPy views of the mapped files, nothing is copied
+    until it's filtered, so the recordings of long periods are read at once.
+
+    Attributes:
+    - period_id (int): ID of the recorded period.
+    - start_date (str): Date of the start of the period.
+    - records (int): Number of records saved when the recording was last flushed.
+    - columns (dict): Names of the columns mapped to their read-only arrays.
+    """
+
+    def __init__(self, period_id, directory = flights_dir):
+        """
+        Maps the column files of the period.
+
+        Parameters:
+        - period_id (int): ID of the period.
+        - directory (str): Directory of the recordings of all periods.
+        """
+        period_directory = FlightRecorder.period_directory_name(directory, period_id)
+        with open(os.path.join(period_directory, "meta.json")) as file:
+            meta = json.load(file)
+        self.period_id = meta["period_id"]
+        self.start_date = meta["start_date"]
+        self.records = meta["records"]
+        self.columns = {}
+        for name, dtype in meta["columns"].items():
+            if self.records == 0:
+                self.columns[name] = np.empty(0, dtype = dtype)
+            else:
+                self.columns[name] = np.memmap(os.path.join(period_directory, f"{name}.bin"), dtype = dtype, mode = "r",
+                                               shape = (self.records, ))
+
+    def __len__(self):
+        return self.records
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def coordinates(self):
+        """
+        Returns:
+        - numpy.ndarray: x, y and z coordinates of every record, as an array of shape (records, 3).
+        """
+        return np.column_stack((self.columns["x"], self.columns["y"], self.columns["z"]))
+
+    def between(self, start, end):
+        """
+        Selects the records of a time window, e.g. to replay the moments before an incident.
+        The records are appended in order of time, so the window is a slice of the columns and nothing is copied.
+
+        Parameters:
+        - start (float): Start of the window, in seconds from the start of the period.
+        - end (float): End of the window, in seconds from the start of the period.
+
+        Returns:
+        - dict: Names of the columns mapped to the views of the records of the window.
+        """
+        timestamps = self.columns["timestamp"]
+        first = np.searchsorted(timestamps, start, side = "left")
+        last = np.searchsorted(timestamps, end, side = "right")
+        return {name: column[first:last] for name, column in self.columns.items()}
+
+    def airplane_track(self, airplane_id):
+        """
+        Selects the records of a single airplane.
+
+        Parameters:
+        - airplane_id (int): Identifier of the airplane.
+
+        Returns:
+        - dict: Names of the columns mapped to the records of the airplane, in order of time.
+        """
+        mask = self.columns["airplane_id"] == airplane_id
+        return {name: np.asarray(column[mask]) for name, column in self.columns.items()}
@@ -0,0 +1,63 @@
+from common.message_framing import frame_message
+from common.serialization_codecs import available_codecs, create_codec
+from server_side.server_messages import HandlerProtocols, ServerProtocols
+
+
+class MessageCache:
+    """
+    Ready-to-send frames of the server_side's messages which never change - the collision commands,
+    the directions, the airport is full message and the service points of every quarter.
+    They are serialized and framed once, at the start of the server_side, for every codec the airplanes can choose,
+    and the handlers write them to the sockets as they are.
+
+    Attributes:
+    - frames (dict): Names of the codecs mapped to the names of the messages and their framed messages.
+    """
+
+    def __init__(self, airport, codecs = None):
+        """
+        Builds the frames of the constant messages.
+
+        Parameters:
+        - airport (Airport): Airport whose service points are sent to the airplanes.
+        - codecs (list, optional): Names of the codecs, every available codec if not given.
+        """
+        handler_protocols = HandlerProtocols()
+        messages = {
+            "avoid_collision": handler_protocols.avoid_collision_message(),
+            "collision": handler_protocols.collision_message(),
+            "airport_is_full": ServerProtocols().airport_is_full_message()
+        }
+        for target in ("Initial landing point", "Waiting point", "Zero point"):
+            messages[target] = handler_protocols.direct_airplane_message(target)
+        for quarter, points in airport.establish_points_by_quarter().items():
+            messages[self.points_name(quarter)] = handler_protocols.points_for_airplane_message(quarter,
+                                                                                               points["initial_landing_point"],
+                                                                                               points["waiting_point"],
+                                                                                               points["zero_point"])
+        self.frames = {}
+        for codec_name in codecs or available_codecs():
+            codec = create_codec(codec_name)
+            self.frames[codec_name] = {name: frame_message(codec.encode(message)) for name, message in messages.items()}
+
+    @staticmethod
+    def points_name(quarter):
+        """
+        Returns:
+        - str: Name of the service points message of the quarter.
+        """
+        return f"points_{quarter}"
+
+    def frame(self, codec_name, message_name):
+        """
+        Returns the framed message.
+
+        Parameters:
+        - codec_name (str): Name of the codec of the connection.
+        - message_name (str): Name of the message - "avoid_collision", "collision", "airport_is_full",
+          a target of the direction, or the name of the service points message of a quarter.
+
+        Returns:
+        - bytes: The length prefix followed by the encoded message.
+        """
+        return self.frames[codec_name][message_name]
@@ -0,0 +1,74 @@
+from threading import Lock
+from server_side.database_managment import DatabaseUtils
+
+
+class PeriodCounters:
+    """
+    Identifiers and running counters of the airplanes of the server_side period, kept in memory.
+
+    The counters are seeded from the database once, when the period starts, and then every connection takes
+    its identifier and updates the counters in constant time, without asking the database.
+
+    Attributes:
+    - lock (threading.Lock): Lock for thread-safe access to the identifiers and the counters.
+    - next_airplane_id (int): Identifier given to the next connected airplane.
+    - counters (dict): Number of all airplanes of the period and of the airplanes with every status.
+    """
+
+    def __init__(self):
+        """
+        Initializes the counters of an empty period.
+        """
+        self.lock = Lock()
+        self.next_airplane_id = 1
+        self.counters = {"total": 0, **{column: 0 for column in DatabaseUtils.status_counters.values()}}
+
+    def seed(self, counters):
+        """
+        Takes the counters of the period from the database, the next identifier follows the airplanes already counted.
+
+        Parameters:
+        - counters (dict): Counters of the period, as returned by DatabaseUtils.get_period_counters.
+        """
+        with self.lock:
+            self.counters.update(counters)
+            self.next_airplane_id = self.counters["total"] + 1
+
+    def allocate_airplane_id(self):
+        """
+        Gives the next identifier to a connected airplane.
+
+        Returns:
+        - int: The identifier of the airplane.
+        """
+        with self.lock:
+            airplane_id = self.next_airplane_id
+            self.next_airplane_id += 1
+            return airplane_id
+
+    def count_connection(self):
+        """
+        Counts an airplane which finished the handshake as an airplane in the air.
+        """
+        with self.lock:
+            self.counters["total"] += 1
+            self.counters["in_the_air"] += 1
+
+    def count_status(self, status):
+        """
+        Moves an airplane from the airplanes in the air to the airplanes with its final status.
+
+        Parameters:
+        - status (str): The final status of the airplane.
+        """
+        with self.lock:
+            self.counters["in_the_air"] -= 1
+            self.counters[DatabaseUtils.status_counters[status]] += 1
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: Number of all airplanes of the period and of the airplanes with every status.
+        """
+        with self.lock:
+            return dict(self.counters)
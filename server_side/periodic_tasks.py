@@ -0,0 +1,73 @@
+import heapq
+import itertools
+from common.clock import MonotonicClock
+
+
+class PeriodicTasks:
+    """
+    Timer queue for loops which wait on a selector - it tells how long the loop may wait
+    and runs the callbacks which are due.
+
+    Attributes:
+    - clock: Clock of the tasks, the intervals are counted in its seconds.
+    - tasks (list): Heap of [next run time, order, interval, callback] entries.
+    - order (itertools.count): Tie breaker keeping tasks with the same run time in the order of adding.
+    - logger: The logger object, None to print the errors.
+    """
+
+    def __init__(self, clock = None, logger = None):
+        """
+        Initializes an empty timer queue.
+
+        Parameters:
+        - clock: Clock of the tasks, a real time clock if not given.
+        - logger: The logger object, None to print the errors.
+        """
+        self.clock = clock or MonotonicClock()
+        self.logger = logger
+        self.tasks = []
+        self.order = itertools.count()
+
+    def add_task(self, interval, callback, run_now = True):
+        """
+        Adds a callback run every interval seconds.
+
+        Parameters:
+        - interval (float): Time between two runs, in seconds of the clock.
+        - callback (callable): Function called without arguments.
+        - run_now (bool): If True, the first run happens at the nearest run_due_tasks call.
+        """
+        first_run = self.clock.monotonic() if run_now else self.clock.monotonic() + interval
+        heapq.heappush(self.tasks, [first_run, next(self.order), interval, callback])
+
+    def time_to_next_task(self):
+        """
+        Counts the time left to the nearest task, in real seconds, so it can be the timeout of a selector.
+
+        Returns:
+        - float or None: Seconds to wait, 0 if a task is already due, None if there are no tasks.
+        """
+        if not self.tasks:
+            return None
+        return max(0, self.clock.real_seconds(self.tasks[0][0] - self.clock.monotonic()))
+
+    def run_due_tasks(self):
+        """
+        Runs every task whose time has come and schedules its next run.
+        A task which is late is scheduled from now, so it's never run several times in a row to catch up.
+        An error of a task is logged, and the task stays scheduled like the others.
+        """
+        now = self.clock.monotonic()
+        while self.tasks and self.tasks[0][0] <= now:
+            task = heapq.heappop(self.tasks)
+            next_run, order, interval, callback = task
+            try:
+                callback()
+            except Exception as e:
+                if self.logger is None:
+                    print(f"Error: {e}")
+                else:
+                    self.logger.exception(f"Periodic task {callback.__name__} failed: {e}")
+            finally:
+                task[0] = next_run + interval if next_run + interval > now else now + interval
+                heapq.heappush(self.tasks, task)
@@ -1,15 +1,22 @@
-import datetime
 import os
+import selectors
 import socket as s
 from threading import Lock
-from common.config_variables import HOST, PORT, INTERNET_ADDRESS_FAMILY, SOCKET_TYPE, log_file
+from common.clock import create_clock
+from common.config_variables import HOST, PORT, INTERNET_ADDRESS_FAMILY, SOCKET_TYPE, CLOCK_SPEED, log_file
 from common.logger_config import logger_config
 from common.serialization_utils import SerializeUtils
 from connection_pool import ConnectionPool
 from database_managment import DatabaseUtils
+from database_writer import DatabaseWriter
+from flight_recorder import FlightRecorder
 from server_messages import ServerProtocols
 from airport import Airport, Radar
 from client_handler import ClientHandler
+from message_cache import MessageCache
+from periodic_tasks import PeriodicTasks
+from period_counters import PeriodCounters
+from tick_engine import TickEngine
 
 
 class Server:
@@ -26,21 +33,33 @@ class Server:
         database_utils (DatabaseUtils): An instance of DatabaseUtils for database operations.
         lock (Lock): A lock for thread synchronization.
         is_running (bool): A flag indicating whether the server_side is running.
+        is_paused (bool): A flag indicating whether accepting new client_side connections is paused.
+        clock: Clock of the server_side's lifetime, ticks, periodic tasks and holding times.
         start_date (datetime): The start date and time of the server_side.
+        start_time (float): The monotonic time of the server_side's start, in seconds of the clock.
         version (str): The version of the server_side.
         airport (Airport): An instance of the Airport class.
         communication_utils (ServerProtocols): An instance of ServerProtocols for communication protocols.
-        connection_pool: Connection pool from which connections for server and handlers are taken
+        connection_pool: Connection pool from which the connections of the server_side and the database writer are taken
         server_connection: The server_side's database connection.
         clients_list (list): A list of connected clients.
+        selector (selectors.DefaultSelector): The selector waiting for new connections on the server_side socket.
+        periodic_tasks (PeriodicTasks): Timers of the lifetime check, the pause flag check and the radar refresh.
+        radar (Radar): Radar drawing the airplanes, if the server_side has one.
+        tick_engine (TickEngine): Engine applying the coordinates and checking collisions of all airplanes once per tick.
+        message_cache (MessageCache): Ready-to-send frames of the constant messages, built from the airport's points.
+        database_writer (DatabaseWriter): Thread writing the connections and statuses queued by the handlers in batches.
+        period_counters (PeriodCounters): Identifiers and running counters of the airplanes of the period, seeded when it starts.
+        flight_recorder (FlightRecorder): Recorder of the applied coordinates and the issued commands of the period.
     """
 
-    def __init__(self, connection_pool):
+    def __init__(self, connection_pool, clock = None):
         """
         Initializes the Server class with default values and objects.
 
         Parameters:
             - connection_pool: Connection pool object initialized before start the server_side.
+            - clock: Clock of the server_side's lifetime, ticks, periodic tasks and holding times, created for the CLOCK_SPEED if not given.
         """
         self.HOST = HOST
         self.PORT = PORT
@@ -52,30 +71,43 @@ class Server:
         self.database_utils = DatabaseUtils()
         self.lock = Lock()
         self.is_running = True
-        self.start_date = datetime.datetime.now()
+        self.is_paused = False
+        self.clock = clock or create_clock(CLOCK_SPEED)
+        self.start_date = self.clock.now()
+        self.start_time = self.clock.monotonic()
         self.version = "1.3.0"
-        self.airport = Airport()
+        self.airport = Airport(self.clock)
         self.communication_utils = ServerProtocols()
         self.connection_pool = connection_pool
         self.server_connection = self.connection_pool.get_connection()
         self.clients_list = []
+        self.selector = selectors.DefaultSelector()
+        self.periodic_tasks = PeriodicTasks(self.clock, logger = self.logger)
+        self.radar = None
+        self.flight_recorder = FlightRecorder(clock = self.clock)
+        self.tick_engine = TickEngine(self.airport, recorder = self.flight_recorder, clock = self.clock, logger = self.logger)
+        self.message_cache = MessageCache(self.airport)
+        self.database_writer = DatabaseWriter(self.connection_pool, self.database_utils, logger = self.logger)
+        self.period_counters = PeriodCounters()
 
     def check_server_lifetime(self):
         """
         Checks the server_side's lifetime to determine if it should stop running.
         """
-        current_time = datetime.datetime.now()
-        time_difference = current_time - self.start_date
-        if time_difference >= datetime.timedelta(hours = 5):
+        if self.clock.monotonic() - self.start_time >= 5 * 3600:
             self.is_running = False
 
     def db_service_when_server_starts(self):
         """
         Performs database-related services when the server_side starts.
-        This includes creating database tables and adding a new server_side period.
+        This includes creating database tables, adding a new server_side period, seeding the counters of the period,
+        starting the flight recording of the period and starting the database writer.
         """
         self.database_utils.create_db_tables(self.server_connection)
         self.database_utils.add_new_server_period(self.server_connection)
+        self.period_counters.seed(self.database_utils.get_period_counters(self.server_connection))
+        self.flight_recorder.start_period(self.database_utils.period_id)
+        self.database_writer.start()
 
     def create_and_start_new_thread(self, client_socket, address):
         """
@@ -88,7 +120,7 @@ class Server:
         Returns:
             ClientHandler: The handler for the client_side connection.
         """
-        thread_id = self.database_utils.get_all_airplanes_number_per_period(self.server_connection) + 1
+        thread_id = self.period_counters.allocate_airplane_id()
         client_handler = ClientHandler(self, client_socket, address, thread_id)
         self.clients_list.append(client_handler)
         client_handler.start()
@@ -112,9 +144,7 @@ class Server:
         Parameters:
             client_socket (socket): The client_side socket object.
         """
-        airport_full_message = self.communication_utils.airport_is_full_message()
-        airport_full_message_json = self.serialize_utils.serialize_to_json(airport_full_message)
-        client_socket.sendall(airport_full_message_json)
+        client_socket.sendall(self.message_cache.frame("json", "airport_is_full"))
         client_socket.close()
 
     def handler_manager(self, client_socket, address):
@@ -146,21 +176,81 @@ class Server:
         file = os.path.isfile(path)
         return file
 
-    def server_work_manager(self):
+    def check_pause_state(self):
         """
-        Manages the server_side's work, accepts client_side connections, and handles exceptions.
+        Pauses or resumes accepting client_side connections, depending on the flag file.
+        While paused, the server_side socket is not watched by the selector, so new connections wait in the backlog.
         """
-        try:
-            self.check_server_lifetime()
-            self.server_socket.settimeout(0.01)
-            client_socket, address = self.server_socket.accept()
+        flag_file = self.check_file_flag_exists()
+        if flag_file and not self.is_paused:
+            self.selector.unregister(self.server_socket)
+            self.is_paused = True
+            self.logger.info("Server paused")
+        elif not flag_file and self.is_paused:
+            self.selector.register(self.server_socket, selectors.EVENT_READ)
+            self.is_paused = False
+            self.logger.info("Server resumed")
+
+    def refresh_radar(self):
+        """
+        Redraws the radar, if the server_side has one.
+        """
+        if self.radar is not None:
+            self.radar.draw(pause_time = 0.01)
+
+    def log_tick_statistics(self):
+        """
+        Logs the tick rate, the tick deadline misses and the tick durations of the tick engine.
+        """
+        self.logger.info(f"Tick engine statistics: {self.tick_engine.statistics()}")
+
+    def log_arrival_statistics(self):
+        """
+        Logs the landings per hour, the average holding time and the queues of the arrival manager.
+        """
+        self.logger.info(f"Arrival statistics: {self.airport.arrival_manager.statistics()}")
+
+    def log_pool_statistics(self):
+        """
+        Logs the size, the usage and the wait times of the database connection pool.
+        """
+        self.logger.info(f"Connection pool statistics: {self.connection_pool.statistics()}")
+
+    def log_database_writer_statistics(self):
+        """
+        Logs the queued, written and lost events and the batch sizes of the database writer.
+        """
+        self.logger.info(f"Database writer statistics: {self.database_writer.statistics()}")
+
+    def log_period_counters(self):
+        """
+        Logs the numbers of all airplanes of the period and of the airplanes with every status.
+        """
+        self.logger.info(f"Period counters: {self.period_counters.statistics()}")
+
+    def accept_client_connections(self):
+        """
+        Accepts every connection waiting in the backlog of the server_side socket.
+        """
+        while True:
+            try:
+                client_socket, address = self.server_socket.accept()
+            except BlockingIOError:
+                return
             self.logger.info(f"Connection from {address}")
+            client_socket.setblocking(True)
             client_socket.settimeout(5)
-            client_handler = self.handler_manager(client_socket, address)
-        except s.timeout:
-            pass
-        except client_socket.timeout as e:
-            self.handle_handler_exception(client_handler, e)
+            self.handler_manager(client_socket, address)
+
+    def server_work_manager(self):
+        """
+        Manages the server_side's work - waits until a client_side connects or until the nearest periodic task is due,
+        accepts the waiting connections and runs the due tasks.
+        """
+        events = self.selector.select(timeout = self.periodic_tasks.time_to_next_task())
+        for key, mask in events:
+            self.accept_client_connections()
+        self.periodic_tasks.run_due_tasks()
 
     def main(self):
         """
@@ -172,16 +262,21 @@ class Server:
             self.db_service_when_server_starts()
             self.server_socket.bind((self.HOST, self.PORT))
             self.server_socket.listen()
+            self.server_socket.setblocking(False)
+            self.selector.register(self.server_socket, selectors.EVENT_READ)
+            self.periodic_tasks.add_task(1, self.check_server_lifetime)
+            self.periodic_tasks.add_task(1, self.check_pause_state)
+            self.periodic_tasks.add_task(1, self.refresh_radar)
+            self.periodic_tasks.add_task(60, self.log_tick_statistics, run_now = False)
+            self.periodic_tasks.add_task(60, self.log_arrival_statistics, run_now = False)
+            self.periodic_tasks.add_task(60, self.log_pool_statistics, run_now = False)
+            self.periodic_tasks.add_task(60, self.log_database_writer_statistics, run_now = False)
+            self.periodic_tasks.add_task(60, self.log_period_counters, run_now = False)
+            self.periodic_tasks.add_task(5, self.flight_recorder.flush, run_now = False)
+            self.tick_engine.start()
             try:
                 while self.is_running:
-                    flag_file = self.check_file_flag_exists()
-                    self.logger.info(flag_file)
-                    if flag_file:
-                        self.logger.info("Server paused")
-                        continue
-                    else:
-                        radar.draw()
-                        self.server_work_manager()
+                    self.server_work_manager()
             except OSError as e:
                 self.logger.exception(f"Error in server_side: {e}")
                 self.is_running = False
@@ -191,12 +286,18 @@ class Server:
     def stop(self):
         """
         Stops the server_side, closes client_side connections, and performs cleanup operations.
+        The database writer writes every queued event before the period is closed.
         """
         if len(self.clients_list) > 0:
             for handler in self.clients_list:
                 handler.is_running = False
+        self.tick_engine.stop()
+        self.flight_recorder.close()
+        self.database_writer.stop()
         self.database_utils.update_period_end(self.server_connection)
+        self.connection_pool.close()
         self.logger.info("Server`s out")
+        self.selector.close()
         self.server_socket.close()
 
 
@@ -204,5 +305,5 @@ class Server:
 if __name__ == "__main__":
     connection_pool = ConnectionPool(10, 100)
     server = Server(connection_pool)
-    radar = Radar(server.airport)
+    server.radar = Radar(server.airport)
     server.main()
@@ -18,7 +18,8 @@ class ServerProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating that the airport is full and the client_side needs to fly to another location.
         """
-        return self.protocol_template(status = self.status["error_status"], message = "Airport`s full, you have to fly to another...")
+        return self.protocol_template(status = self.status["error_status"], message = "Airport`s full, you have to fly to another...",
+                                      code = self.codes["airport_is_full"])
 
 
 class HandlerProtocols(MessageTemplate):
@@ -31,17 +32,25 @@ class HandlerProtocols(MessageTemplate):
     def __init__(self):
         super().__init__()
 
-    def welcome_message_to_client(self, id):
+    def welcome_message_to_client(self, id, codecs = None, telemetry = False):
         """
         Generates a welcome message to the client_side.
 
         Parameters:
         - id (str): The unique identifier of the client_side.
+        - codecs (list, optional): Names of the codecs the server_side offers for the next messages, in its order of preference.
+        - telemetry (bool, optional): Flag indicating whether the server_side accepts binary telemetry frames after the handshake.
 
         Returns:
         dict: A communication protocol template welcoming the client_side and requesting their coordinates.
         """
-        return self.protocol_template(status = self.status["success_status"] , message = "Welcome to our airport !", data = id)
+        message = self.protocol_template(status = self.status["success_status"] , message = "Welcome to our airport !", data = id,
+                                         code = self.codes["welcome"])
+        if codecs is not None:
+            message["codecs"] = codecs
+        if telemetry:
+            message["telemetry"] = True
+        return message
 
     def points_for_airplane_message(self, quarter, init_landing_point_coordinates, waiting_point_coordinates, zero_point_coordinates):
         """
@@ -63,7 +72,8 @@ class HandlerProtocols(MessageTemplate):
                                           "init_landing_point_coordinates": init_landing_point_coordinates,
                                           "waiting_point_coordinates": waiting_point_coordinates,
                                           "zero_point_coordinates": zero_point_coordinates
-                                      })
+                                      },
+                                      code = self.codes["points"])
 
     def direct_airplane_message(self, target):
         """
@@ -75,7 +85,8 @@ class HandlerProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template instructing the airplane to fly to a specific target.
         """
-        return self.protocol_template(status = self.status["success_status"], message = "Fly to: ", data = target)
+        return self.protocol_template(status = self.status["success_status"], message = "Fly to: ", data = target,
+                                      code = self.codes["direction"])
 
     def avoid_collision_message(self):
         """
@@ -84,7 +95,8 @@ class HandlerProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template advising the airplane to correct its flight path to avoid collision.
         """
-        return self.protocol_template(status = self.status["error_status"], message = "You`re to close to another airplane ! Correct your flight.")
+        return self.protocol_template(status = self.status["error_status"], message = "You`re to close to another airplane ! Correct your flight.",
+                                      code = self.codes["avoid_collision"])
 
     def collision_message(self):
         """
@@ -93,4 +105,5 @@ class HandlerProtocols(MessageTemplate):
         Returns:
         dict: A communication protocol template indicating that a collision has occurred and the airplane is destroyed.
         """
-        return self.protocol_template(status = self.status["error_status"], message = "Crash !...")
+        return self.protocol_template(status = self.status["error_status"], message = "Crash !...",
+                                      code = self.codes["collision"])
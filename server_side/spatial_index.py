@@ -0,0 +1,135 @@
+from threading import Lock
+from common.math_calculation import euclidean_formula
+
+
+class SpatialGrid:
+    """
+    Spatial index dividing the airspace into cubic cells of the same size.
+    Every airplane is kept in the cell containing its position, so looking for airplanes closer than
+    the cell size needs only the airplane's own cell and the 26 cells around it.
+
+    Attributes:
+    - cell_size (int): Length of the cell edge, the biggest radius which can be asked for.
+    - cells (dict): Cell coordinates mapped to the set of airplane keys inside this cell.
+    - positions (dict): Airplane keys mapped to their (x, y, z, cell) tuple.
+    - lock (threading.Lock): Lock for thread-safe access from the handlers.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Initializes an empty grid.
+
+        Parameters:
+        - cell_size (int): Length of the cell edge.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.positions = {}
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.positions)
+
+    def cell_of(self, x, y, z):
+        """
+        Establishes the cell containing the given point.
+
+        Returns:
+        - tuple: Integer coordinates of the cell.
+        """
+        return (int(x // self.cell_size), int(y // self.cell_size), int(z // self.cell_size))
+
+    def update(self, key, x, y, z):
+        """
+        Adds the airplane to the grid or moves it to its new position.
+        The cells sets are touched only when the airplane crosses a cell border.
+
+        Parameters:
+        - key: Identifier of the airplane.
+        - x, y, z: New coordinates of the airplane.
+        """
+        cell = self.cell_of(x, y, z)
+        with self.lock:
+            old_position = self.positions.get(key)
+            if old_position is None or old_position[3] != cell:
+                if old_position is not None:
+                    self.discard_from_cell(key, old_position[3])
+                self.cells.setdefault(cell, set()).add(key)
+            self.positions[key] = (x, y, z, cell)
+
+    def remove(self, key):
+        """
+        Removes the airplane from the grid, if it's there.
+
+        Parameters:
+        - key: Identifier of the airplane.
+        """
+        with self.lock:
+            old_position = self.positions.pop(key, None)
+            if old_position is not None:
+                self.discard_from_cell(key, old_position[3])
+
+    def discard_from_cell(self, key, cell):
+        """
+        Removes the key from the cell set and drops the set when it becomes empty.
+        """
+        cell_keys = self.cells[cell]
+        cell_keys.discard(key)
+        if not cell_keys:
+            del self.cells[cell]
+
+    def neighbours(self, key, radius):
+        """
+        Finds airplanes closer to the given one than the radius, looking only at the adjacent cells.
+
+        Parameters:
+        - key: Identifier of the airplane.
+        - radius (int): Searched distance, not bigger than the cell size.
+
+        Returns:
+        - list: (other airplane key, distance) tuples.
+        """
+        if radius > self.cell_size:
+            raise ValueError(f"Radius {radius} is bigger than the cell size {self.cell_size}")
+        with self.lock:
+            position = self.positions.get(key)
+            if position is None:
+                return []
+            x, y, z, (cell_x, cell_y, cell_z) = position
+            candidates = []
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        cell_keys = self.cells.get((cell_x + dx, cell_y + dy, cell_z + dz))
+                        if cell_keys:
+                            candidates.extend(self.positions[other_key] + (other_key, ) for other_key in cell_keys)
+        neighbours = []
+        for other_x, other_y, other_z, other_cell, other_key in candidates:
+            if other_key != key:
+                distance = euclidean_formula(x, y, z, other_x, other_y, other_z)
+                if distance < radius:
+                    neighbours.append((other_key, distance))
+        return neighbours
+
+    def neighbourhoods(self):
+        """
+        Groups the airplanes for the pair checks - every occupied cell together with the airplanes of its 26 adjacent cells.
+        An airplane can be closer than the cell size only to the airplanes of its own group.
+
+        Returns:
+        - list: (number of airplanes inside the cell, keys of the airplanes inside the cell followed by the keys
+          of the airplanes in the adjacent cells) tuples.
+        """
+        with self.lock:
+            groups = []
+            for (cell_x, cell_y, cell_z), cell_keys in self.cells.items():
+                nearby_keys = list(cell_keys)
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for dz in (-1, 0, 1):
+                            if dx or dy or dz:
+                                other_keys = self.cells.get((cell_x + dx, cell_y + dy, cell_z + dz))
+                                if other_keys:
+                                    nearby_keys.extend(other_keys)
+                groups.append((len(cell_keys), nearby_keys))
+            return groups
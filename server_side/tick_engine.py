@@ -0,0 +1,216 @@
+import threading
+from common.clock import MonotonicClock
+
+
+class TickEngine(threading.Thread):
+    """
+    Fixed-rate simulation tick of the server_side. Coordinates received by the handlers during a tick are collected,
+    applied to the airport at once, and a single proximity check of all airplanes decides which commands are sent.
+
+    Attributes:
+    - airport: The Airport whose airplanes are updated and checked.
+    - clock: Clock of the ticks, the tick interval is counted in its seconds.
+    - tick_rate (float): Number of ticks per second of the clock.
+    - tick_interval (float): Time between the starts of two ticks, in seconds of the clock.
+    - handlers (dict): Airplane keys mapped to the handlers of the connected airplanes.
+    - pending_updates (dict): Airplane keys mapped to the newest coordinates received during the current tick.
+    - lock (threading.Lock): Lock guarding handlers, pending updates and the airport during a tick.
+    - is_running (bool): Flag indicating whether the tick thread is running.
+    - next_deadline (float): Monotonic time of the clock at which the next tick should start.
+    - ticks (int): Number of finished ticks.
+    - deadline_misses (int): Number of ticks which finished after the start time of the next tick.
+    - errors (int): Number of ticks which failed with an error.
+    - failed_sends (int): Number of commands dropped because they couldn't be written at once.
+    - last_tick_duration (float): Duration of the last tick, in seconds.
+    - max_tick_duration (float): Duration of the longest tick, in seconds.
+    - logger: The logger object, None to print the errors.
+    """
+
+    def __init__(self, airport, tick_rate = 1, recorder = None, clock = None, logger = None):
+        """
+        Initializes the tick engine.
+
+        Parameters:
+        - airport: The Airport whose airplanes are updated and checked.
+        - tick_rate (float): Number of ticks per second of the clock.
+        - recorder (FlightRecorder, optional): Recorder of the applied coordinates and the issued commands.
+        - clock: Clock of the ticks, a real time clock if not given.
+        - logger: The logger object, None to print the errors.
+        """
+        super().__init__(daemon = True)
+        self.airport = airport
+        self.clock = clock or MonotonicClock()
+        self.recorder = recorder
+        self.tick_rate = tick_rate
+        self.tick_interval = 1 / tick_rate
+        self.handlers = {}
+        self.pending_updates = {}
+        self.lock = threading.Lock()
+        self.is_running = True
+        self.next_deadline = self.clock.monotonic() + self.tick_interval
+        self.ticks = 0
+        self.deadline_misses = 0
+        self.errors = 0
+        self.failed_sends = 0
+        self.last_tick_duration = 0
+        self.max_tick_duration = 0
+        self.logger = logger
+
+    def register_handler(self, handler):
+        """
+        Adds the handler's airplane to the airport and starts sending it the collision commands.
+
+        Parameters:
+        - handler: Handler of the airplane, after the initial correspondence.
+        """
+        with self.lock:
+            self.handlers[handler.airplane_key] = handler
+            self.airport.update_airplane(handler.airplane_object)
+
+    def remove_airplane(self, airplane_key):
+        """
+        Removes the airplane from the airport, together with its handler and not applied coordinates.
+
+        Parameters:
+        - airplane_key: Key of the airplane.
+        """
+        with self.lock:
+            self.handlers.pop(airplane_key, None)
+            self.pending_updates.pop(airplane_key, None)
+            self.airport.remove_airplane(airplane_key)
+
+    def submit_coordinates(self, airplane_key, coordinates):
+        """
+        Stores the coordinates received from the airplane, to apply them at the next tick.
+        When the airplane reports more than once during a tick, only the newest coordinates are kept.
+
+        Parameters:
+        - airplane_key: Key of the airplane.
+        - coordinates (list): x, y and z coordinates of the airplane.
+        """
+        with self.lock:
+            self.pending_updates[airplane_key] = coordinates
+
+    def tick(self):
+        """
+        Applies the collected coordinates, publishes one airspace snapshot for the tick,
+        checks the distances between all airplanes and sends the collision and avoid collision commands.
+        The applied coordinates are recorded together with the commands, if the engine has a recorder.
+        """
+        applied_updates = []
+        with self.lock:
+            pending_updates = self.pending_updates
+            self.pending_updates = {}
+            for airplane_key, coordinates in pending_updates.items():
+                handler = self.handlers.get(airplane_key)
+                if handler is not None:
+                    handler.airplane_object[airplane_key]["coordinates"] = coordinates
+                    self.airport.update_airplane(handler.airplane_object)
+                    applied_updates.append((airplane_key, handler.thread_id, coordinates))
+            self.airport.airspace.publish()
+            crashed, avoiding = self.airport.check_all_distances()
+            crashed_handlers = [self.handlers[airplane_key] for airplane_key in crashed if airplane_key in self.handlers]
+            avoiding_handlers = [self.handlers[airplane_key] for airplane_key in avoiding if airplane_key in self.handlers]
+        for handler in crashed_handlers:
+            self.send_command(handler, "collision")
+        for handler in avoiding_handlers:
+            self.send_command(handler, "avoid_collision")
+        if self.recorder is not None:
+            self.record_updates(applied_updates, crashed, avoiding)
+
+    def record_updates(self, applied_updates, crashed, avoiding):
+        """
+        Records the coordinates applied in the tick, with the command each airplane got.
+
+        Parameters:
+        - applied_updates (list): Tuples of the key, the identifier and the coordinates of the updated airplanes.
+        - crashed: Keys of the airplanes which got the collision command.
+        - avoiding: Keys of the airplanes which got the avoid collision command.
+        """
+        crashed, avoiding = set(crashed), set(avoiding)
+        commands = ["collision" if airplane_key in crashed else "avoid_collision" if airplane_key in avoiding else None
+                    for airplane_key, airplane_id, coordinates in applied_updates]
+        self.recorder.record_batch([airplane_id for airplane_key, airplane_id, coordinates in applied_updates],
+                                   [coordinates for airplane_key, airplane_id, coordinates in applied_updates], commands)
+
+    def send_command(self, handler, message_name):
+        """
+        Sends the command to the airplane without waiting for it. A command which can't be written at once,
+        because the airplane doesn't read its messages or disconnected in the meantime, is dropped and counted -
+        the command is sent again at the next tick if it's still needed.
+
+        Parameters:
+        - handler: Handler of the airplane.
+        - message_name (str): Name of the command in the server_side's message cache.
+        """
+        try:
+            sent = handler.try_send_cached_message(message_name)
+        except (OSError, ValueError) as e:
+            handler.logger.warning(f"Command for {handler.airplane_key} not sent: {e}")
+            sent = False
+        if not sent:
+            self.failed_sends += 1
+
+    def time_to_next_tick(self):
+        """
+        Returns:
+        - float: Seconds of the clock left to the start of the next tick, 0 if it's already late.
+        """
+        return max(0, self.next_deadline - self.clock.monotonic())
+
+    def run_tick(self):
+        """
+        Runs a tick, measures it and schedules the next one.
+        A tick which ends after the planned start of the next tick is counted as a deadline miss,
+        and the next tick is scheduled from now instead of running the skipped ticks in a row.
+        An error of the tick is logged and counted, and the ticks go on.
+        """
+        tick_start = self.clock.monotonic()
+        try:
+            self.tick()
+        except Exception as e:
+            self.errors += 1
+            if self.logger is None:
+                print(f"Error: {e}")
+            else:
+                self.logger.exception(f"Tick {self.ticks + 1} failed: {e}")
+        finally:
+            tick_end = self.clock.monotonic()
+            self.ticks += 1
+            self.last_tick_duration = tick_end - tick_start
+            self.max_tick_duration = max(self.max_tick_duration, self.last_tick_duration)
+            self.next_deadline += self.tick_interval
+            if tick_end > self.next_deadline:
+                self.deadline_misses += 1
+                self.next_deadline = tick_end + self.tick_interval
+
+    def statistics(self):
+        """
+        Returns:
+        - dict: Tick rate, number of ticks, deadline misses, errors, dropped commands and tick durations.
+        """
+        return {
+            "tick_rate": self.tick_rate,
+            "ticks": self.ticks,
+            "deadline_misses": self.deadline_misses,
+            "errors": self.errors,
+            "failed_sends": self.failed_sends,
+            "last_tick_duration": self.last_tick_duration,
+            "max_tick_duration": self.max_tick_duration,
+            "airplanes": len(self.handlers)
+        }
+
+    def run(self):
+        """
+        Runs the ticks at the fixed rate until the engine is stopped.
+        """
+        self.next_deadline = self.clock.monotonic() + self.tick_interval
+        while self.is_running:
+            self.clock.sleep(self.time_to_next_tick())
+            self.run_tick()
+
+    def stop(self):
+        """
+        Stops the tick thread.
+        """
+        self.is_running = False
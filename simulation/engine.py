@@ -0,0 +1,268 @@
+import collections
+import json
+import random
+import time
+from client_side.airplane import Airplane
+from client_side.client_messages import ClientProtocols
+from common.clock import VirtualClock
+from server_side.airport import Airport
+from server_side.server_messages import HandlerProtocols
+
+
+class SimulatedConnection:
+    """
+    In-process replacement of an airplane connection. For the Airplane it plays the role of the Client,
+    and for the arrival manager the role of the handler - the messages are passed to the engine as dictionaries
+    instead of going through sockets.
+
+    Attributes:
+    - engine: SimulationEngine which owns the connection.
+    - airplane (Airplane): The simulated airplane.
+    - airplane_key (str): Key of the airplane in the airport.
+    - communication_utils (ClientProtocols): Messages of the client_side, used by the Airplane.
+    - is_running (bool): Flag indicating whether the airplane is still in the simulation.
+    - replies (collections.deque): Replies of the server_side waiting for read_message_from_server.
+    - orders (collections.deque): Orders the server_side sent on its own, handled at the start of the next step.
+    - coordinates_sent (bool): Flag indicating whether the airplane reported its coordinates in the current step.
+    """
+
+    def __init__(self, engine, airplane_id, coordinates):
+        """
+        Initializes the connection together with its airplane.
+
+        Parameters:
+        - engine: SimulationEngine which owns the connection.
+        - airplane_id (int): Identifier of the airplane.
+        - coordinates (dict): Initial coordinates of the airplane.
+        """
+        self.engine = engine
+        self.airplane = Airplane(self, coordinates, engine.clock)
+        self.airplane.id = airplane_id
+        self.airplane_key = f"Airplane_{airplane_id}"
+        self.communication_utils = ClientProtocols()
+        self.is_running = True
+        self.replies = collections.deque()
+        self.orders = collections.deque()
+        self.coordinates_sent = False
+
+    def send_airplane_coordinates(self, client_socket, sleep_time_in_sec):
+        """
+        Reports the airplane's coordinates to the engine. There is no sleep - the engine's time step paces the airplanes.
+        """
+        self.coordinates_sent = True
+
+    def send_message_to_server(self, client_socket, data):
+        """
+        Passes the message to the engine, which handles it like the server_side's handler at once.
+        """
+        self.engine.handle_message(self, data)
+
+    def read_message_from_server(self, client_socket):
+        """
+        Returns:
+        - dict: The oldest reply of the server_side.
+        """
+        return self.replies.popleft()
+
+    def stop(self, client_socket):
+        """
+        Stops the airplane, like closing the connection of the client_side.
+        """
+        self.is_running = False
+
+    def direct_to_zero_point(self):
+        """
+        Sends the airplane to the zero point, after the arrival manager reserved its corridor.
+        """
+        self.engine.airport.airspace.set_status(self.airplane_key, "LANDING")
+        self.orders.append(self.engine.communication_utils.direct_airplane_message("Zero point"))
+
+    def handle_orders(self):
+        """
+        Handles the orders sent by the server_side on its own, like Client.handling_additional_messages_from_server.
+        """
+        while self.orders and self.is_running:
+            order = self.orders.popleft()
+            codes = self.communication_utils.codes
+            code = self.communication_utils.message_code(order)
+            if code == codes["avoid_collision"]:
+                self.airplane.avoid_collision(100)
+            elif code == codes["direction"] and order["data"] == "Zero point":
+                self.airplane.direct_to_zero_point()
+            elif code == codes["collision"]:
+                self.send_message_to_server(None, self.communication_utils.crash_message())
+                self.is_running = False
+
+
+class SimulationEngine:
+    """
+    Headless, deterministic simulation of the airport. Airplanes are stepped in-process with a fixed time step:
+    they move with the Airplane's own routing logic, the airport routes them and sequences the arrivals
+    like the server_side's handlers do, and the collisions of all airplanes are checked once per step.
+    The airplanes' fuel and the holding times are measured with the simulation's virtual clock,
+    and given the same seed the simulation always gives the same result.
+
+    Attributes:
+    - airplanes_number (int): Number of airplanes appearing during the simulation.
+    - time_step (float): Simulated seconds per step, the time between two coordinates of an airplane.
+    - duration (float): Length of the simulated period, in seconds.
+    - max_airplanes (int): Maximum number of airplanes at the airport at once, the next ones are sent away.
+    - random (random.Random): Seeded source of the appearance times and initial coordinates.
+    - clock (VirtualClock): Clock of the simulation, it moves by the time step at every step.
+    - airport (Airport): The simulated airport.
+    - communication_utils (HandlerProtocols): Messages of the server_side's handlers.
+    - appearance_times (collections.deque): Simulation times at which the next airplanes appear.
+    - connections (dict): Airplane keys mapped to the connections of the airplanes at the airport.
+    - outcomes (collections.Counter): Number of airplanes per final status.
+    - steps (int): Number of finished steps.
+    """
+
+    final_statuses = {
+        HandlerProtocols.codes["landed"]: "SUCCESSFULLY LANDING",
+        HandlerProtocols.codes["out_of_fuel"]: "CRASHED BY OUT OF FUEL",
+        HandlerProtocols.codes["crash"]: "CRASHED BY COLLISION"
+    }
+
+    def __init__(self, airplanes_number, seed = 0, time_step = 1, duration = 5 * 3600, max_airplanes = 100):
+        """
+        Initializes the simulation and draws the appearance times of all airplanes.
+
+        Parameters:
+        - airplanes_number (int): Number of airplanes appearing during the simulation.
+        - seed (int): Seed of the random numbers.
+        - time_step (float): Simulated seconds per step.
+        - duration (float): Length of the simulated period, in seconds.
+        - max_airplanes (int): Maximum number of airplanes at the airport at once.
+        """
+        self.airplanes_number = airplanes_number
+        self.time_step = time_step
+        self.duration = duration
+        self.max_airplanes = max_airplanes
+        self.random = random.Random(seed)
+        self.clock = VirtualClock()
+        self.airport = Airport(self.clock)
+        self.communication_utils = HandlerProtocols()
+        self.appearance_times = collections.deque(sorted(self.random.uniform(0, duration) for _ in range(airplanes_number)))
+        self.connections = {}
+        self.outcomes = collections.Counter()
+        self.steps = 0
+
+    def add_airplane(self, airplane_id):
+        """
+        Lets the airplane into the airport, like the initial correspondence of a handler, or sends it away when the airport is full.
+
+        Parameters:
+        - airplane_id (int): Identifier of the airplane.
+        """
+        coordinates = Airplane.establish_init_airplane_coordinates(self.random)
+        if len(self.connections) >= self.max_airplanes:
+            self.outcomes["REJECTED"] += 1
+            return
+        connection = SimulatedConnection(self, airplane_id, coordinates)
+        quarter = self.airport.establish_airplane_quarter(coordinates)
+        connection.airplane.set_points(self.communication_utils.points_for_airplane_message(
+            quarter,
+            list(self.airport.initial_landing_point[quarter].point_coordinates()),
+            list(self.airport.waiting_point[quarter].point_coordinates()),
+            list(self.airport.zero_point[quarter[0]].point_coordinates())
+        ))
+        connection.airplane.fly_to_initial_landing_point = True
+        self.connections[connection.airplane_key] = connection
+        self.airport.update_airplane(connection.airplane.parse_airplane_obj_to_json())
+
+    def handle_message(self, connection, message):
+        """
+        Handles the message of the airplane the way BaseClientHandler.handle_response_from_client does.
+
+        Parameters:
+        - connection (SimulatedConnection): Connection of the airplane.
+        - message (dict): The message of the airplane.
+        """
+        codes = self.communication_utils.codes
+        code = self.communication_utils.message_code(message)
+        if code == codes["target_reached"] and message["data"] == "Initial landing point":
+            airplane = connection.airplane
+            if self.airport.arrival_manager.request_landing(connection, airplane.quarter[0], [airplane.x, airplane.y, airplane.z]):
+                self.airport.airspace.set_status(connection.airplane_key, "LANDING")
+                connection.replies.append(self.communication_utils.direct_airplane_message("Zero point"))
+            else:
+                self.airport.airspace.set_status(connection.airplane_key, "WAITING")
+                connection.replies.append(self.communication_utils.direct_airplane_message("Waiting point"))
+        elif code in self.final_statuses:
+            self.remove_airplane(connection, self.final_statuses[code])
+
+    def remove_airplane(self, connection, status):
+        """
+        Takes the airplane out of the airport and the arrival sequence, and counts its final status.
+
+        Parameters:
+        - connection (SimulatedConnection): Connection of the airplane.
+        - status (str): The final status of the airplane.
+        """
+        connection.is_running = False
+        next_connection = self.airport.arrival_manager.release(connection.airplane_key, landed = status == "SUCCESSFULLY LANDING")
+        if next_connection is not None:
+            next_connection.direct_to_zero_point()
+        self.airport.remove_airplane(connection.airplane_key)
+        del self.connections[connection.airplane_key]
+        self.outcomes[status] += 1
+
+    def move_airplane(self, connection):
+        """
+        Moves the airplane by one step, like one iteration of the client_side's main loop.
+
+        Parameters:
+        - connection (SimulatedConnection): Connection of the airplane.
+        """
+        connection.handle_orders()
+        if connection.is_running:
+            connection.airplane.airplane_movement_manager(None)
+
+    def step(self):
+        """
+        Runs one time step - lets in the airplanes which appeared, moves every airplane, applies the reported coordinates
+        and checks the collisions of all airplanes at once.
+        """
+        self.clock.advance(self.time_step)
+        while self.appearance_times and self.appearance_times[0] <= self.clock.monotonic():
+            self.appearance_times.popleft()
+            self.add_airplane(self.airplanes_number - len(self.appearance_times))
+        for connection in list(self.connections.values()):
+            self.move_airplane(connection)
+        reported = [connection for connection in self.connections.values() if connection.coordinates_sent]
+        for connection in reported:
+            connection.coordinates_sent = False
+            airplane = connection.airplane
+            self.airport.update_airplane({connection.airplane_key: {"coordinates": [airplane.x, airplane.y, airplane.z],
+                                                                    "quarter": airplane.quarter}})
+        self.airport.airspace.publish()
+        crashed, avoiding = self.airport.check_all_distances()
+        for airplane_key in crashed:
+            self.connections[airplane_key].orders.append(self.communication_utils.collision_message())
+        for airplane_key in avoiding:
+            self.connections[airplane_key].orders.append(self.communication_utils.avoid_collision_message())
+        self.steps += 1
+
+    def run(self):
+        """
+        Runs the simulation until the end of the period, or until the last airplane leaves the airport after it.
+
+        Returns:
+        - dict: Simulated and wall time, final statuses of the airplanes and the arrival statistics.
+        """
+        started_at = time.perf_counter()
+        while self.clock.monotonic() < self.duration or (self.connections and self.clock.monotonic() < self.duration + Airplane.fuel_time):
+            self.step()
+        return {
+            "airplanes": self.airplanes_number,
+            "steps": self.steps,
+            "simulated_time": self.clock.monotonic(),
+            "wall_time": time.perf_counter() - started_at,
+            "outcomes": dict(self.outcomes),
+            "in_the_air": len(self.connections),
+            "arrivals": self.airport.arrival_manager.statistics()
+        }
+
+
+if __name__ == "__main__":
+    print(json.dumps(SimulationEngine(1000, seed = 1).run(), indent = 4))
@@ -0,0 +1,14 @@
+import os
+import sys
+import pytest
+
+# The server_side modules import their siblings by bare name, like when the server_side is started from its directory.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server_side"))
+
+
+@pytest.fixture
+def fill_receive_buffer():
+    def fill(view, data):
+        view[:len(data)] = data
+        return len(data)
+    return fill
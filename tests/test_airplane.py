@@ -1,6 +1,7 @@
 import pytest
-import datetime
 from client_side.airplane import Airplane
+from client_side.client_messages import ClientProtocols
+from common.clock import VirtualClock
 
 
 @pytest.fixture
@@ -49,16 +50,13 @@ def test_set_points(init_airplane_obj):
     assert airplane.waiting_point == (-3500, 1000, 2350)
     assert airplane.zero_point == (0, 450, 0)
 
-def test_fuel_consumption(init_airplane_obj, mocker):
-    airplane = init_airplane_obj
-    date_of_appearance_for_test = datetime.datetime.now() - datetime.timedelta(hours = 4)
-    airplane.date_of_appearance = date_of_appearance_for_test
-    mock_datetime = mocker.patch.object(datetime, "datetime")
-    mock_datetime.now.return_value = date_of_appearance_for_test + datetime.timedelta(hours = 3, seconds = 1)
-    assert not airplane.fuel_consumption()
-    new_date_of_appearance = datetime.datetime.now() - datetime.timedelta(hours = 2)
-    airplane.date_of_appearance = new_date_of_appearance
+def test_fuel_consumption(mocker):
+    clock = VirtualClock()
+    airplane = Airplane(mocker.Mock(), {"x": -5000, "y": 3500, "z": 4400}, clock)
+    clock.advance(2 * 3600)
     assert airplane.fuel_consumption()
+    clock.advance(3600 + 1)
+    assert not airplane.fuel_consumption()
 
 def test_avoid_collision(init_airplane_obj):
     airplane = init_airplane_obj
@@ -77,10 +75,12 @@ def test_direct_to_initial_landing_point(mocker, init_airplane_obj, body, fly_to
     airplane = init_airplane_obj
     mock_client_socket = mocker.Mock()
     mock_client = airplane.client
+    mock_client.communication_utils = ClientProtocols()
     mocker.patch.object(airplane, "count_distance_and_send_airplane_coordinates", return_value = 50)
     mock_client.read_message_from_server.return_value = {
         "message": "test_message",
-        "body": body
+        "data": body,
+        "code": mock_client.communication_utils.codes["direction"]
     }
     airplane.direct_to_initial_landing_point(mock_client_socket)
     mock_client.send_message_to_server.assert_called_once_with(
@@ -93,6 +93,38 @@ def test_direct_to_initial_landing_point(mocker, init_airplane_obj, body, fly_to
     assert airplane.fly_to_runaway == fly_to_zero_point_flag
     assert airplane.speed == airplane_speed
 
+def test_landing_order_after_commands(mocker, init_airplane_obj):
+    airplane = init_airplane_obj
+    mock_client_socket = mocker.Mock()
+    mock_client = airplane.client
+    mock_client.communication_utils = ClientProtocols()
+    mock_client.is_running = True
+    codes = mock_client.communication_utils.codes
+    mock_avoid_collision = mocker.Mock()
+    mock_client.additional_message_handlers = {codes["avoid_collision"]: mock_avoid_collision}
+    avoid_collision_message = {"status": "WARNING", "message": "Avoid collision", "data": None, "code": codes["avoid_collision"]}
+    mock_client.read_message_from_server.side_effect = [
+        avoid_collision_message,
+        {"status": "SUCCESS", "message": "Fly to: ", "data": "Zero point", "code": codes["direction"]}
+    ]
+    mocker.patch.object(airplane, "count_distance_and_send_airplane_coordinates", return_value = 50)
+    airplane.direct_to_initial_landing_point(mock_client_socket)
+    mock_avoid_collision.assert_called_once_with(mock_client_socket, avoid_collision_message)
+    assert mock_client.read_message_from_server.call_count == 2
+    assert airplane.fly_to_runaway == True
+
+def test_landing_order_not_awaited_after_collision(mocker, init_airplane_obj):
+    airplane = init_airplane_obj
+    mock_client = airplane.client
+    mock_client.communication_utils = ClientProtocols()
+    codes = mock_client.communication_utils.codes
+    def handle_collision(client_socket, message):
+        mock_client.is_running = False
+    mock_client.additional_message_handlers = {codes["collision"]: handle_collision}
+    mock_client.read_message_from_server.side_effect = [{"status": "ERROR", "message": "Collision", "data": None, "code": codes["collision"]}]
+    assert airplane.read_landing_order(mocker.Mock()) is None
+    assert airplane.fly_to_runaway == False
+
 def test_direct_to_waiting_point(mocker, init_airplane_obj):
     airplane = init_airplane_obj
     mock_client_socket = mocker.Mock()
@@ -129,3 +161,12 @@ def test_parse_airplane_obj_to_json(init_airplane_obj):
                 "zero_point": (0, 450, 0),
             }
         }
+
+def test_direct_to_zero_point(init_airplane_obj):
+    airplane = init_airplane_obj
+    airplane.fly_to_waiting_point = True
+    airplane.direct_to_zero_point()
+    assert airplane.fly_to_waiting_point == False
+    assert airplane.fly_to_initial_landing_point == False
+    assert airplane.fly_to_runaway == True
+    assert airplane.speed == 75
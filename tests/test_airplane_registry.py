@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from server_side.airplane_registry import AirplaneRegistry
+
+
+@pytest.fixture
+def init_airplane_registry():
+    points_by_quarter = {"NE": {"initial_landing_point": [2000, 450, 2000],
+                                "waiting_point": [3500, 1000, 2350],
+                                "zero_point": [0, 450, 0]}}
+    registry = AirplaneRegistry(points_by_quarter, capacity = 2)
+    return registry
+
+
+def test_set_and_get_airplane(init_airplane_registry):
+    registry = init_airplane_registry
+    registry["Airplane_1"] = {"coordinates": [2000, 3000, 1500], "quarter": "NE"}
+    assert registry["Airplane_1"] == {"coordinates": [2000, 3000, 1500],
+                                      "quarter": "NE",
+                                      "status": "IN THE AIR",
+                                      "initial_landing_point": [2000, 450, 2000],
+                                      "waiting_point": [3500, 1000, 2350],
+                                      "zero_point": [0, 450, 0]}
+    assert "Airplane_1" in registry
+    assert len(registry) == 1
+
+def test_get_airplane_without_quarter(init_airplane_registry):
+    registry = init_airplane_registry
+    registry.update({"Airplane_1": {"coordinates": [100, 200, 300]}})
+    assert registry["Airplane_1"] == {"coordinates": [100, 200, 300], "quarter": None, "status": "IN THE AIR"}
+
+def test_delete_airplane_reuses_slot(init_airplane_registry):
+    registry = init_airplane_registry
+    registry["Airplane_1"] = {"coordinates": [1, 1, 1]}
+    registry["Airplane_2"] = {"coordinates": [2, 2, 2]}
+    slot = registry.slot_of("Airplane_1")
+    del registry["Airplane_1"]
+    assert "Airplane_1" not in registry
+    assert registry.slot_of("Airplane_1") is None
+    registry["Airplane_3"] = {"coordinates": [3, 3, 3]}
+    assert registry.slot_of("Airplane_3") == slot
+    assert list(registry) == ["Airplane_2", "Airplane_3"]
+    with pytest.raises(KeyError):
+        del registry["Airplane_1"]
+
+def test_registry_grows(init_airplane_registry):
+    registry = init_airplane_registry
+    for number in range(5):
+        registry[f"Airplane_{number}"] = {"coordinates": [number, number, number]}
+    assert len(registry.positions) == 8
+    assert len(registry) == 5
+    assert registry["Airplane_4"]["coordinates"] == [4, 4, 4]
+
+def test_set_status(init_airplane_registry):
+    registry = init_airplane_registry
+    registry["Airplane_1"] = {"coordinates": [2000, 3000, 1500], "quarter": "NE"}
+    registry.set_status("Airplane_1", "LANDING")
+    assert registry["Airplane_1"]["status"] == "LANDING"
+    with pytest.raises(ValueError):
+        registry.set_status("Airplane_1", "PARKED")
+
+def test_active_positions(init_airplane_registry):
+    registry = init_airplane_registry
+    registry["Airplane_1"] = {"coordinates": [1, 2, 3]}
+    registry["Airplane_2"] = {"coordinates": [4, 5, 6]}
+    registry["Airplane_3"] = {"coordinates": [7, 8, 9]}
+    del registry["Airplane_2"]
+    keys, positions = registry.active_positions()
+    assert keys == ["Airplane_1", "Airplane_3"]
+    assert np.array_equal(positions, [[1, 2, 3], [7, 8, 9]])
@@ -36,6 +36,7 @@ def test_airport_init(init_airport_obj):
     assert airport.air_corridor["S"].direction == "S"
     assert airport.air_corridor["S"].occupied == False
     assert len(airport.airplanes_list) == 0
+    assert len(airport.spatial_index) == 0
 
 
 @pytest.mark.parametrize("coordinates, result", [
@@ -61,3 +62,21 @@ def test_check_distance_between_airplanes(init_airport_obj, airplane_object, oth
     airplane = airplane_object
     assert airport.check_distance_between_airplanes(airplane, "Airplane_1", other_airplane_to_check_distance) == result
 
+
+def test_remove_airplane(init_airport_obj, airplane_object):
+    airport = init_airport_obj
+    airport.update_airplane(airplane_object)
+    assert len(airport.spatial_index) == 1
+    airport.remove_airplane("Airplane_1")
+    assert len(airport.airplanes_list) == 0
+    assert len(airport.spatial_index) == 0
+
+def test_check_all_distances(init_airport_obj, airplane_object):
+    airport = init_airport_obj
+    airport.update_airplane(airplane_object)
+    airport.update_airplane({"Airplane_2": {"coordinates": [2001, 3001, 1501]}, "Airplane_3": {"coordinates": [2000, 3000, 1150]}})
+    airport.airspace.publish()
+    assert airport.check_all_distances() == (["Airplane_1", "Airplane_2"], ["Airplane_3"])
+    airport.remove_airplane("Airplane_2")
+    airport.airspace.publish()
+    assert airport.check_all_distances() == ([], ["Airplane_1", "Airplane_3"])
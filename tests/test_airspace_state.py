@@ -0,0 +1,57 @@
+import pytest
+from server_side.airplane_registry import AirplaneRegistry
+from server_side.airspace_state import AirspaceState
+
+
+@pytest.fixture
+def init_airspace_state():
+    airspace = AirspaceState(AirplaneRegistry())
+    return airspace
+
+
+def test_airspace_state_init(init_airspace_state):
+    airspace = init_airspace_state
+    snapshot = airspace.snapshot()
+    assert airspace.version == 0
+    assert snapshot.version == 0
+    assert len(snapshot) == 0
+
+def test_snapshot_changes_only_when_published(init_airspace_state):
+    airspace = init_airspace_state
+    airspace.update({"Airplane_1": {"coordinates": [1, 2, 3], "quarter": "NE"}})
+    assert airspace.snapshot().version == 0
+    snapshot = airspace.publish()
+    assert snapshot is airspace.snapshot()
+    assert snapshot.version == 1
+    airspace.set_status("Airplane_1", "WAITING")
+    assert airspace.snapshot() is snapshot
+    airspace.publish()
+    assert airspace.snapshot() is not snapshot
+    assert airspace.snapshot().version == 2
+
+def test_snapshot_does_not_change(init_airspace_state):
+    airspace = init_airspace_state
+    airspace.update({"Airplane_1": {"coordinates": [1, 2, 3], "quarter": "NE"}})
+    snapshot = airspace.publish()
+    airspace.update({"Airplane_1": {"coordinates": [4, 5, 6], "quarter": "NE"}, "Airplane_2": {"coordinates": [7, 8, 9]}})
+    airspace.remove("Airplane_1")
+    airspace.publish()
+    assert list(snapshot) == ["Airplane_1"]
+    assert snapshot.get("Airplane_1") == {"coordinates": [1, 2, 3], "quarter": "NE", "status": "IN THE AIR"}
+    assert dict(airspace.snapshot().items()) == {"Airplane_2": {"coordinates": [7, 8, 9], "quarter": None, "status": "IN THE AIR"}}
+    with pytest.raises(ValueError):
+        snapshot.positions[0] = (0, 0, 0)
+
+def test_remove_missing_airplane(init_airspace_state):
+    airspace = init_airspace_state
+    assert airspace.remove("Airplane_1") == False
+    assert airspace.version == 0
+
+def test_publish(init_airspace_state):
+    airspace = init_airspace_state
+    airspace.update({"Airplane_1": {"coordinates": [1, 2, 3]}})
+    snapshot = airspace.publish()
+    assert airspace.published is snapshot
+    assert "Airplane_1" in snapshot
+    assert snapshot.get("Airplane_2") is None
+    assert airspace.publish() is snapshot
@@ -0,0 +1,84 @@
+import pytest
+from server_side.airport import Airport
+from server_side.arrival_manager import ArrivalManager
+
+
+@pytest.fixture
+def mock_clock(mocker):
+    mock_clock = mocker.Mock()
+    mock_clock.monotonic.return_value = 100.0
+    return mock_clock
+
+@pytest.fixture
+def init_arrival_manager(mock_clock):
+    airport = Airport()
+    manager = ArrivalManager(airport.air_corridor, airport.zero_point, clock = mock_clock)
+    return manager
+
+def mock_handler(mocker, airplane_key):
+    handler = mocker.Mock()
+    handler.airplane_key = airplane_key
+    return handler
+
+
+def test_request_landing_reserves_free_corridor(init_arrival_manager, mocker):
+    manager = init_arrival_manager
+    handler = mock_handler(mocker, "Airplane_1")
+    assert manager.request_landing(handler, "N", [-2000, 450, 2000]) == True
+    assert manager.reserved_by["N"] == "Airplane_1"
+    assert manager.air_corridors["N"].occupied == True
+    assert manager.request_landing(handler, "N", [-2000, 450, 2000]) == True
+    assert manager.request_landing(mock_handler(mocker, "Airplane_2"), "S", [2000, -450, 2000]) == True
+
+def test_queue_is_ordered_by_estimated_time_of_arrival(init_arrival_manager, mocker):
+    manager = init_arrival_manager
+    manager.request_landing(mock_handler(mocker, "Airplane_1"), "N", [-2000, 450, 2000])
+    far_handler = mock_handler(mocker, "Airplane_2")
+    near_handler = mock_handler(mocker, "Airplane_3")
+    assert manager.request_landing(far_handler, "N", [-3500, 1000, 2350]) == False
+    assert manager.request_landing(near_handler, "N", [-1000, 450, 1000]) == False
+    assert manager.request_landing(far_handler, "N", [-2000, 450, 2000]) == False
+    assert len(manager.queues["N"]) == 2
+    assert manager.release("Airplane_1", landed = True) is near_handler
+    assert manager.reserved_by["N"] == "Airplane_3"
+    assert manager.release("Airplane_3", landed = True) is far_handler
+    assert manager.release("Airplane_2", landed = True) is None
+    assert manager.air_corridors["N"].occupied == False
+
+def test_queue_is_ordered_by_current_positions(mock_clock, mocker):
+    airport = Airport(mock_clock)
+    manager = airport.arrival_manager
+    manager.request_landing(mock_handler(mocker, "Airplane_1"), "N", [-2000, 450, 2000])
+    first_handler = mock_handler(mocker, "Airplane_2")
+    second_handler = mock_handler(mocker, "Airplane_3")
+    manager.request_landing(first_handler, "N", [-2000, 450, 2000])
+    manager.request_landing(second_handler, "N", [2000, 450, 2000])
+    airport.update_airplane({"Airplane_2": {"coordinates": [-3500, 1000, 2350]}, "Airplane_3": {"coordinates": [500, 450, 500]}})
+    airport.airspace.publish()
+    assert manager.release("Airplane_1", landed = True) is second_handler
+    assert manager.release("Airplane_3", landed = True) is first_handler
+
+def test_release_queued_airplane(init_arrival_manager, mocker):
+    manager = init_arrival_manager
+    manager.request_landing(mock_handler(mocker, "Airplane_1"), "S", [2000, -450, 2000])
+    manager.request_landing(mock_handler(mocker, "Airplane_2"), "S", [2000, -450, 2000])
+    assert manager.release("Airplane_2") is None
+    assert manager.queues["S"] == []
+    assert manager.release("Airplane_1") is None
+    assert manager.reserved_by["S"] is None
+    assert manager.release("Airplane_3") is None
+
+def test_statistics(init_arrival_manager, mock_clock, mocker):
+    manager = init_arrival_manager
+    manager.request_landing(mock_handler(mocker, "Airplane_1"), "N", [-2000, 450, 2000])
+    manager.request_landing(mock_handler(mocker, "Airplane_2"), "N", [-2000, 450, 2000])
+    mock_clock.monotonic.return_value = 130.0
+    manager.release("Airplane_1", landed = True)
+    mock_clock.monotonic.return_value = 1900.0
+    manager.release("Airplane_2", landed = True)
+    assert manager.statistics() == {
+        "landings": 2,
+        "landings_per_hour": 4,
+        "average_holding_time": 30,
+        "queued": {"N": 0, "S": 0}
+    }
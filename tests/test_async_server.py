@@ -0,0 +1,120 @@
+import asyncio
+import json
+import pytest
+from server_side.async_server import AsyncServer, AsyncClientHandler
+from common.message_framing import HEADER, frame_message
+
+
+@pytest.fixture
+def init_async_server(mocker):
+    server = AsyncServer(mocker.Mock())
+    server.database_writer = mocker.Mock()
+    return server
+
+async def start_listening(server):
+    server.resumed = asyncio.Event()
+    server.resumed.set()
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    return listener, listener.sockets[0].getsockname()[1]
+
+async def read_message(reader):
+    header = await reader.readexactly(HEADER.size)
+    return json.loads(await reader.readexactly(HEADER.unpack(header)[0]))
+
+def write_message(writer, data):
+    writer.write(frame_message(json.dumps(data).encode()))
+
+async def wait_until(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
+
+async def connect_airplane(port, coordinates):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    welcome = await read_message(reader)
+    write_message(writer, {"status": "SUCCESS", "message": "Our coordinates: ", "data": coordinates})
+    points = await read_message(reader)
+    airplane_key = f"Airplane_{welcome['data']}"
+    write_message(writer, {"status": "SUCCESS", "message": "Our data: ",
+                           "data": {airplane_key: {"coordinates": list(coordinates.values()), "quarter": points["data"]["quarter"]}}})
+    direction = await read_message(reader)
+    return reader, writer, airplane_key, points, direction
+
+
+def test_handshake(init_async_server):
+    server = init_async_server
+    async def scenario():
+        listener, port = await start_listening(server)
+        async with listener:
+            reader, writer, airplane_key, points, direction = await connect_airplane(port, {"x": -4000, "y": 3000, "z": 3000})
+            await asyncio.wait_for(wait_until(lambda: airplane_key in server.tick_engine.handlers), 5)
+            writer.close()
+            await asyncio.wait_for(wait_until(lambda: not server.clients_list), 5)
+        return airplane_key, points, direction
+    airplane_key, points, direction = asyncio.run(scenario())
+    assert points["data"]["quarter"] == "NW"
+    assert points["data"]["init_landing_point_coordinates"] == [-2000, 450, 2000]
+    assert direction["data"] == "Initial landing point"
+    server.database_writer.add_new_connection.assert_called_once_with(airplane_key)
+
+def test_coordinates_exchange(init_async_server):
+    server = init_async_server
+    async def scenario():
+        listener, port = await start_listening(server)
+        async with listener:
+            reader, writer, airplane_key, points, direction = await connect_airplane(port, {"x": -4000, "y": 3000, "z": 3000})
+            write_message(writer, {"status": "SUCCESS", "message": "Our coordinates: ", "data": {"x": -3900, "y": 2950, "z": 2990}})
+            await asyncio.wait_for(wait_until(lambda: airplane_key in server.tick_engine.pending_updates), 5)
+            server.tick_engine.run_tick()
+            coordinates = server.airport.airplanes_list[airplane_key]["coordinates"]
+            writer.close()
+            await asyncio.wait_for(wait_until(lambda: not server.clients_list), 5)
+        return coordinates
+    coordinates = asyncio.run(scenario())
+    assert list(coordinates) == [-3900, 2950, 2990]
+    assert server.tick_engine.ticks == 1
+    assert server.tick_engine.failed_sends == 0
+
+def test_disconnect_cleanup(init_async_server):
+    server = init_async_server
+    async def scenario():
+        listener, port = await start_listening(server)
+        async with listener:
+            first = await connect_airplane(port, {"x": -4000, "y": 3000, "z": 3000})
+            second = await connect_airplane(port, {"x": 4000, "y": -3000, "z": 3000})
+            await asyncio.wait_for(wait_until(lambda: len(server.tick_engine.handlers) == 2), 5)
+            first[1].close()
+            await asyncio.wait_for(wait_until(lambda: len(server.clients_list) == 1), 5)
+            remaining = ({handler.airplane_key for handler in server.clients_list}, set(server.tick_engine.handlers),
+                         set(server.airport.airplanes_list))
+            second[1].close()
+            await asyncio.wait_for(wait_until(lambda: not server.clients_list), 5)
+        return first[2], second[2], remaining
+    first_key, second_key, remaining = asyncio.run(scenario())
+    assert remaining == ({second_key}, {second_key}, {second_key})
+    assert server.tick_engine.handlers == {}
+    assert len(server.airport.airplanes_list) == 0
+
+def test_reject_client_when_airport_is_full(init_async_server):
+    server = init_async_server
+    server.max_clients = 0
+    async def scenario():
+        listener, port = await start_listening(server)
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            message = await read_message(reader)
+            writer.close()
+        return message
+    message = asyncio.run(scenario())
+    assert message == server.communication_utils.airport_is_full_message()
+    assert len(server.clients_list) == 0
+
+def test_try_write_message_drops_message_for_full_buffer(init_async_server, mocker):
+    writer = mocker.Mock()
+    writer.is_closing.return_value = False
+    writer.transport.get_write_buffer_size.return_value = AsyncClientHandler.write_buffer_limit + 1
+    client_handler = AsyncClientHandler(init_async_server, mocker.Mock(), writer, 1)
+    assert client_handler.try_write_message(b"message") == False
+    writer.write.assert_not_called()
+    writer.transport.get_write_buffer_size.return_value = 0
+    assert client_handler.try_write_message(b"message") == True
+    writer.write.assert_called_once_with(b"message")
@@ -2,7 +2,8 @@ import pytest
 import socket as s
 from client_side.client import Client
 from client_side.airplane import Airplane
-from server_side.database_managment import SerializeUtils
+from common.serialization_utils import SerializeUtils
+from common.message_framing import frame_message
 
 
 @pytest.fixture
@@ -35,16 +36,17 @@ def test_client_init(init_client, get_airplane_obj):
     assert client.airplane.y == 3500
     assert client.airplane.z == 4400
 
-def test_read_message_from_server(mocker, init_client, mock_client_socket):
+def test_read_message_from_server(mocker, init_client, mock_client_socket, fill_receive_buffer):
     client = init_client
     mocked_client_socket = mock_client_socket
     serialize_utils = SerializeUtils()
-    mocked_client_socket.recv.return_value = b'{"message": "Test message", "body": "Test body"}'
+    framed_message = frame_message(b'{"message": "Test message", "body": "Test body"}')
+    mocked_client_socket.recv_into.side_effect = lambda view: fill_receive_buffer(view, framed_message)
     expected_message = {"message": "Test message", "body": "Test body"}
     mocker.patch.object(serialize_utils, "deserialize_json", return_value = expected_message)
     received_message = client.read_message_from_server(mocked_client_socket)
     assert received_message == expected_message
-    mocked_client_socket.recv.assert_called_once_with(client.BUFFER)
+    mocked_client_socket.recv_into.assert_called_once()
 
 def test_send_message_to_server(mocker, init_client, mock_client_socket):
     client = init_client
@@ -54,4 +56,4 @@ def test_send_message_to_server(mocker, init_client, mock_client_socket):
     b_data = b'{"message": "Test message", "body": "Test body"}'
     mocker.patch.object(serialize_utils, "serialize_to_json")
     client.send_message_to_server(mocked_client_socket, data)
-    mocked_client_socket.sendall.assert_called_once_with(b_data)
+    mocked_client_socket.sendall.assert_called_once_with(frame_message(b_data))
@@ -0,0 +1,41 @@
+import datetime
+import pytest
+from common import clock as clock_module
+from common.clock import AcceleratedClock, MonotonicClock, VirtualClock, WallClock, create_clock
+
+
+@pytest.fixture
+def mock_monotonic(mocker):
+    mock_monotonic = mocker.patch.object(clock_module.time, "monotonic", return_value = 10.0)
+    return mock_monotonic
+
+
+def test_monotonic_clock_now(mock_monotonic):
+    clock = MonotonicClock()
+    mock_monotonic.return_value = 12.5
+    assert clock.monotonic() == 12.5
+    assert clock.now() - clock.start_date == datetime.timedelta(seconds = 2.5)
+
+def test_accelerated_clock(mock_monotonic, mocker):
+    mock_sleep = mocker.patch.object(clock_module.time, "sleep")
+    clock = AcceleratedClock(100)
+    mock_monotonic.return_value = 11.0
+    assert clock.monotonic() == 110.0
+    assert clock.now() - clock.start_date == datetime.timedelta(seconds = 100)
+    clock.sleep(1)
+    mock_sleep.assert_called_once_with(0.01)
+
+def test_virtual_clock():
+    clock = VirtualClock(start_date = datetime.datetime(2024, 1, 1))
+    assert clock.monotonic() == 0
+    clock.advance(60)
+    clock.sleep(30)
+    assert clock.monotonic() == 90
+    assert clock.now() == datetime.datetime(2024, 1, 1, 0, 1, 30)
+
+def test_create_clock():
+    assert type(create_clock()) is MonotonicClock
+    accelerated_clock = create_clock(100)
+    assert isinstance(accelerated_clock, AcceleratedClock)
+    assert accelerated_clock.speed == 100
+    assert isinstance(WallClock().now(), datetime.datetime)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from server_side.collision_engine import CollisionEngine
+from server_side.spatial_index import SpatialGrid
+
+
+@pytest.mark.parametrize("chunk_elements", [1, 2 ** 22])
+def test_scan_positions(chunk_elements):
+    engine = CollisionEngine(chunk_elements)
+    keys = [f"Airplane_{number}" for number in range(1, 7)]
+    positions = np.array([[2000, 3000, 1500], [2001, 3001, 1501], [2000, 3000, 1150],
+                          [-2000, -3000, 1500], [-2000, -3000, 1150], [4000, 4000, 4000]], dtype = np.float64)
+    crashed, avoiding = engine.scan_positions(keys, positions)
+    assert crashed == ["Airplane_1", "Airplane_2"]
+    assert avoiding == ["Airplane_3", "Airplane_4", "Airplane_5"]
+
+def test_scan_positions_of_single_airplane():
+    engine = CollisionEngine()
+    assert engine.scan_positions(["Airplane_1"], np.array([[0, 0, 0]], dtype = np.float64)) == ([], [])
+
+def test_classify_pairs_matches_rounded_distance():
+    rng = np.random.default_rng(5)
+    positions = rng.integers(0, 700, size = (60, 3)).astype(np.float64)
+    crashed, avoiding = CollisionEngine.classify_pairs(positions)
+    distances = np.sqrt(((positions[:, None, :] - positions[None, :, :]) ** 2).sum(axis = 2))
+    rounded = np.array([[round(distance) for distance in row] for row in distances])
+    np.fill_diagonal(rounded, 10 ** 6)
+    expected_crashed = (rounded < 50).any(axis = 1)
+    expected_avoiding = ((rounded > 300) & (rounded < 400)).any(axis = 1) & ~expected_crashed
+    assert crashed.tolist() == expected_crashed.tolist()
+    assert avoiding.tolist() == expected_avoiding.tolist()
+
+def test_scan_neighbourhoods_matches_scan_positions():
+    rng = np.random.default_rng(7)
+    positions = rng.integers(0, 1500, size = (80, 3)).astype(np.float64)
+    keys = [f"Airplane_{number}" for number in range(80)]
+    grid = SpatialGrid(400)
+    for key, position in zip(keys, positions):
+        grid.update(key, *position)
+    engine = CollisionEngine()
+    rows = {key: row for row, key in enumerate(keys)}
+    assert engine.scan_neighbourhoods(keys, positions, rows, grid.neighbourhoods()) == engine.scan_positions(keys, positions)
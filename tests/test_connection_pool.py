@@ -1,6 +1,9 @@
 import os
+import threading
+import time
+import sqlite3
 import pytest
-from server_side.connection_pool import Connection, ConnectionPool
+from server_side.connection_pool import Connection, ConnectionFactory, ConnectionPool, PoolTimeoutError
 
 
 @pytest.fixture
@@ -12,7 +15,7 @@ def init_connection_obj():
 
 @pytest.fixture
 def init_pool():
-    pool = ConnectionPool(10, 100)
+    pool = ConnectionPool(10, 100, acquire_timeout = 0.01)
     return pool
 
 def test_init_connection_obj(init_connection_obj):
@@ -21,42 +24,179 @@ def test_init_connection_obj(init_connection_obj):
 
 def test_init_pool(init_pool):
     pool = init_pool
-    assert len(pool.connections_list) == 10
-    assert len(pool.connections_in_use_list) == 0
+    assert pool.idle_connections.qsize() == 10
+    assert len(pool.connections_in_use) == 0
+    assert pool.number_of_connections == 10
     assert pool.min_number_of_connections == 10
     assert pool.max_number_of_connections == 100
 
 def test_get_connection(init_pool):
     pool = init_pool
     pool.get_connection()
-    assert len(pool.connections_list) == 9
-    assert len(pool.connections_in_use_list) == 1
+    assert pool.idle_connections.qsize() == 9
+    assert len(pool.connections_in_use) == 1
     for _ in range(99):
         pool.get_connection()
-    assert pool.get_connection() == False
+    assert pool.number_of_connections == 100
+    with pytest.raises(PoolTimeoutError):
+        pool.get_connection()
+    assert pool.statistics()["timeouts"] == 1
+
+def test_get_connection_waits_for_released_connection(init_pool):
+    pool = init_pool
+    connections = [pool.get_connection() for _ in range(100)]
+    timer = threading.Timer(0.05, pool.release_connection, args = (connections[0], ))
+    timer.start()
+    assert pool.get_connection(timeout = 5) is connections[0]
+    statistics = pool.statistics()
+    assert statistics["waits"] == 1
+    assert statistics["max_wait_time"] > 0
+    assert statistics["acquisitions"] == 101
 
 def test_release_connection(init_pool):
     pool = init_pool
     conn = pool.get_connection()
-    assert len(pool.connections_in_use_list) == 1
+    assert len(pool.connections_in_use) == 1
     assert conn.in_use == True
     pool.release_connection(conn)
-    assert len(pool.connections_in_use_list) == 0
+    assert len(pool.connections_in_use) == 0
     assert conn.in_use == False
+    pool.release_connection(conn)
+    assert pool.idle_connections.qsize() == 10
+
+def test_released_connection_is_reused_first(init_pool):
+    pool = init_pool
+    conn = pool.get_connection()
+    pool.release_connection(conn)
+    assert pool.get_connection() is conn
+
+def test_connection_context_manager(init_pool):
+    pool = init_pool
+    with pool.connection() as conn:
+        assert conn.in_use == True
+        assert pool.statistics()["in_use"] == 1
+    assert conn.in_use == False
+    assert pool.statistics()["in_use"] == 0
+
+def test_discard_connection(init_pool):
+    pool = init_pool
+    conn = pool.get_connection()
+    pool.discard_connection(conn)
+    assert pool.number_of_connections == 9
+    assert len(pool.connections_in_use) == 0
 
 def test_destroy_unused_connections(init_pool):
     pool = init_pool
-    for _ in range(20):
-        conn = pool.get_connection()
-        pool.connections_list.append(conn)
-    assert len(pool.connections_list) == 20
+    connections = [pool.get_connection() for _ in range(20)]
+    for conn in connections:
+        pool.release_connection(conn)
+    assert pool.idle_connections.qsize() == 20
     pool.destroy_unused_connections()
-    assert len(pool.connections_list) == 10
+    assert pool.idle_connections.qsize() == 10
+    assert pool.number_of_connections == 10
 
 def test_keep_connections_at_the_starting_level(init_pool):
     pool = init_pool
     for _ in range(2):
-        pool.get_connection()
-    assert len(pool.connections_list) == 8
+        pool.discard_connection(pool.get_connection())
+    assert pool.number_of_connections == 8
     pool.keep_connections_at_the_starting_level()
-    assert len(pool.connections_list) == 10
+    assert pool.number_of_connections == 10
+    assert pool.idle_connections.qsize() == 10
+
+def test_invalid_connection_is_replaced(init_pool):
+    pool = init_pool
+    broken_connection = pool.get_connection()
+    pool.release_connection(broken_connection)
+    broken_connection.connection.close()
+    assert broken_connection.is_valid() == False
+    conn = pool.get_connection()
+    assert conn is not broken_connection
+    assert conn.is_valid() == True
+    assert pool.statistics()["invalid"] == 1
+    assert pool.number_of_connections == 9
+
+def test_evict_idle_connections(init_pool):
+    pool = init_pool
+    connections = [pool.get_connection() for _ in range(15)]
+    for conn in connections:
+        pool.release_connection(conn)
+    for conn in connections[:12]:
+        conn.last_used -= pool.idle_ttl
+    assert pool.evict_idle_connections() == 5
+    assert pool.number_of_connections == 10
+    assert pool.statistics()["evicted"] == 5
+    assert all(conn.is_valid() for conn in connections[12:])
+    assert pool.get_connection() is connections[-1]
+
+def test_evict_keeps_recently_used_connections(init_pool):
+    pool = init_pool
+    connections = [pool.get_connection() for _ in range(15)]
+    for conn in connections:
+        pool.release_connection(conn)
+    assert pool.evict_idle_connections() == 0
+    assert pool.number_of_connections == 15
+
+def test_maintenance_thread(mocker):
+    pool = ConnectionPool(2, 10, maintenance_interval = 0.01)
+    mock_maintain = mocker.patch.object(pool, "maintain")
+    time.sleep(0.1)
+    pool.close()
+    assert mock_maintain.call_count > 0
+    assert pool.maintenance.stop_event.is_set()
+    assert pool.number_of_connections == 0
+
+def test_statistics(init_pool):
+    pool = init_pool
+    pool.get_connection()
+    statistics = pool.statistics()
+    assert statistics["connections"] == 10
+    assert statistics["idle"] == 9
+    assert statistics["in_use"] == 1
+    assert statistics["usage"] == 0.01
+    assert statistics["created"] == 10
+
+@pytest.fixture
+def init_db_file(tmp_path):
+    db_file = str(tmp_path / "airport_db.db")
+    connection = Connection(db_file)
+    connection.connection.execute("CREATE TABLE connections (airplane_id VARCHAR)")
+    connection.connection.commit()
+    return db_file, connection
+
+def test_connection_factory_applies_profile(init_db_file):
+    db_file, connection = init_db_file
+    assert connection.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert connection.connection.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+def test_connection_factory_profiles(tmp_path):
+    factory = ConnectionFactory("durable")
+    connection = Connection(str(tmp_path / "airport_db.db"), factory = factory)
+    assert factory.pragmas["synchronous"] == "FULL"
+    assert connection.connection.execute("PRAGMA synchronous").fetchone()[0] == 2
+    with pytest.raises(KeyError):
+        ConnectionFactory("unknown")
+
+def test_read_only_connection(init_db_file):
+    db_file, connection = init_db_file
+    reader = Connection(db_file, read_only = True)
+    assert reader.connection.execute("SELECT COUNT(*) FROM connections").fetchone()[0] == 0
+    with pytest.raises(sqlite3.OperationalError, match = "readonly"):
+        reader.connection.execute("INSERT INTO connections VALUES ('Airplane_1')")
+
+def test_read_only_connection_creates_missing_database(tmp_path):
+    db_file = str(tmp_path / "airport_db.db")
+    reader = Connection(db_file, read_only = True)
+    assert reader.is_valid() == True
+
+def test_reader_does_not_wait_for_writer(init_db_file):
+    db_file, connection = init_db_file
+    reader = Connection(db_file, read_only = True)
+    reader.connection.execute("PRAGMA busy_timeout = 0")
+    connection.connection.execute("PRAGMA cache_size = 1")
+    connection.connection.executemany("INSERT INTO connections VALUES (?)", ((f"Airplane_{id}" * 500, ) for id in range(2000)))
+    assert connection.connection.in_transaction == True
+    assert reader.connection.execute("SELECT COUNT(*) FROM connections").fetchone()[0] == 0
+    connection.connection.commit()
+    assert reader.connection.execute("SELECT COUNT(*) FROM connections").fetchone()[0] == 2000
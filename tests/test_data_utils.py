@@ -1,5 +1,7 @@
 import pytest
-from server_side.database_managment import SerializeUtils, DatabaseUtils
+from common.serialization_utils import SerializeUtils
+from server_side.connection_pool import Connection
+from server_side.database_managment import DatabaseUtils
 
 
 @pytest.fixture
@@ -133,3 +135,114 @@ def test_get_single_airplane_details(mocker, init_database_utils_obj, mock_conne
     mock_airplane.return_value = ("Airplane_1", "2024-02-25 12:37:03", "IN THE AIR")
     airplane = utils.get_single_airplane_details(mock_connection, 1)
     assert airplane == ("Airplane_1", "2024-02-25 12:37:03", "IN THE AIR")
+
+@pytest.fixture
+def init_database(tmp_path):
+    connection = Connection(str(tmp_path / "airport_db.db"))
+    database_utils = DatabaseUtils()
+    database_utils.create_db_tables(connection)
+    return connection, database_utils
+
+def test_add_new_server_period_caches_period_id(init_database):
+    connection, database_utils = init_database
+    assert database_utils.add_new_server_period(connection) == 1
+    assert database_utils.add_new_server_period(connection) == 2
+    assert database_utils.period_id == 2
+
+def test_writes_use_cached_period_id(init_database, mocker):
+    connection, database_utils = init_database
+    database_utils.add_new_server_period(connection)
+    mock_get_period_id = mocker.spy(database_utils, "get_period_id")
+    database_utils.add_new_connection_to_db(connection, "Airplane_1")
+    database_utils.update_connection_status(connection, "SUCCESSFULLY LANDING", "Airplane_1")
+    database_utils.update_period_end(connection)
+    assert database_utils.get_single_airplane_details(connection, "Airplane_1")[2] == "SUCCESSFULLY LANDING"
+    assert mock_get_period_id.call_count == 0
+
+def test_reader_follows_latest_period(init_database):
+    connection, database_utils = init_database
+    database_utils.add_new_server_period(connection)
+    database_utils.add_new_connection_to_db(connection, "Airplane_1")
+    reader = DatabaseUtils()
+    assert reader.get_all_airplanes_number_per_period(connection) == 1
+    database_utils.add_new_server_period(connection)
+    assert reader.get_all_airplanes_number_per_period(connection) == 0
+
+def test_reader_picks_period(init_database):
+    connection, database_utils = init_database
+    database_utils.add_new_server_period(connection)
+    database_utils.add_new_connection_to_db(connection, "Airplane_1")
+    database_utils.add_new_connection_to_db(connection, "Airplane_2")
+    database_utils.add_new_server_period(connection)
+    reader = DatabaseUtils()
+    assert reader.get_all_airplanes_number_per_period(connection, period_id = 1) == 2
+    assert reader.get_airplanes_with_specified_status_per_period(connection, None, period_id = 1)[0][0] == "Airplane_1"
+    assert DatabaseUtils(period_id = 1).get_single_airplane_details(connection, "Airplane_2")[0] == "Airplane_2"
+
+def test_migrate_new_database(init_database):
+    connection, database_utils = init_database
+    assert database_utils.get_schema_version(connection) == database_utils.migrations[-1][0]
+    indexes = {row[0] for row in connection.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"connections_period_airplane", "connections_period_status"} <= indexes
+
+def test_migrate_is_idempotent(init_database, mocker):
+    connection, database_utils = init_database
+    mock_create_tables = mocker.spy(database_utils, "create_tables_migration")
+    version = database_utils.migrate(connection)
+    assert version == database_utils.migrations[-1][0]
+    assert mock_create_tables.call_count == 0
+
+def test_migrate_old_database(tmp_path):
+    connection = Connection(str(tmp_path / "airport_db.db"))
+    database_utils = DatabaseUtils()
+    database_utils.create_server_periods_table(connection)
+    database_utils.create_connections_table(connection)
+    database_utils.add_new_server_period(connection)
+    database_utils.add_new_connection_to_db(connection, "Airplane_1")
+    assert database_utils.get_schema_version(connection) == 0
+    database_utils.create_db_tables(connection)
+    assert database_utils.get_schema_version(connection) == database_utils.migrations[-1][0]
+    assert database_utils.get_period_counters(connection)["in_the_air"] == 1
+    assert database_utils.get_single_airplane_details(connection, "Airplane_1")[0] == "Airplane_1"
+
+def test_migrate_to_version(tmp_path):
+    connection = Connection(str(tmp_path / "airport_db.db"))
+    database_utils = DatabaseUtils()
+    assert database_utils.migrate(connection, version = 1) == 1
+    assert database_utils.migrate(connection) == database_utils.migrations[-1][0]
+
+def test_lookups_use_indexes(init_database):
+    connection, database_utils = init_database
+    plan = connection.connection.execute("EXPLAIN QUERY PLAN SELECT airplane_id, connection_date, status FROM connections "
+                                         "WHERE period_id = ? AND airplane_id = ?", (1, "Airplane_1")).fetchall()
+    assert "COVERING INDEX connections_period_airplane" in plan[0][3]
+    plan = connection.connection.execute("EXPLAIN QUERY PLAN SELECT airplane_id, connection_date FROM connections "
+                                         "WHERE period_id = ? AND (status = ? OR status IS NULL)", (1, "COLLISION")).fetchall()
+    assert "COVERING INDEX connections_period_status" in plan[0][3]
+
+def test_period_counters(init_database):
+    connection, database_utils = init_database
+    database_utils.add_new_server_period(connection)
+    for airplane_id in range(1, 6):
+        database_utils.add_new_connection_to_db(connection, f"Airplane_{airplane_id}")
+    database_utils.update_connection_status(connection, "SUCCESSFULLY LANDING", "Airplane_1")
+    database_utils.update_connection_status(connection, "SUCCESSFULLY LANDING", "Airplane_2")
+    database_utils.update_connection_status(connection, "CRASHED BY COLLISION", "Airplane_3")
+    database_utils.write_batch(connection, [(1, "Airplane_6", "2024-02-25 12:37:03")], [("CRASHED BY OUT OF FUEL", 1, "Airplane_6")])
+    assert database_utils.get_period_counters(connection) == {"total": 6, "in_the_air": 2, "landed": 2,
+                                                              "crashed_by_out_of_fuel": 1, "crashed_by_collision": 1}
+    assert database_utils.get_all_airplanes_number_per_period(connection) == 6
+
+def test_period_counters_of_new_period(init_database):
+    connection, database_utils = init_database
+    database_utils.add_new_server_period(connection)
+    database_utils.add_new_connection_to_db(connection, "Airplane_1")
+    database_utils.add_new_server_period(connection)
+    assert database_utils.get_period_counters(connection)["total"] == 0
+    assert database_utils.get_period_counters(connection, period_id = 1)["total"] == 1
+    assert database_utils.get_period_counters(connection, period_id = 3)["total"] == 0
+
+def test_airplanes_number_without_table_scan(init_database):
+    connection, database_utils = init_database
+    plan = connection.connection.execute("EXPLAIN QUERY PLAN SELECT total FROM period_counters WHERE period_id = ?", (1, )).fetchall()
+    assert "USING INTEGER PRIMARY KEY" in plan[0][3]
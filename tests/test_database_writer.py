@@ -0,0 +1,125 @@
+import pytest
+from server_side.connection_pool import Connection, PoolTimeoutError
+from server_side.database_managment import DatabaseUtils
+from server_side.database_writer import DatabaseWriter
+
+
+@pytest.fixture
+def init_database(tmp_path, mocker):
+    connection = Connection(str(tmp_path / "airport_db.db"))
+    database_utils = DatabaseUtils()
+    database_utils.create_db_tables(connection)
+    database_utils.add_new_server_period(connection)
+    connection_pool = mocker.Mock()
+    connection_pool.get_connection.return_value = connection
+    return connection, database_utils, connection_pool
+
+@pytest.fixture
+def init_database_writer(init_database):
+    connection, database_utils, connection_pool = init_database
+    database_writer = DatabaseWriter(connection_pool, database_utils, poll_interval = 0.01)
+    return database_writer
+
+def test_writer_writes_queued_events(init_database, init_database_writer):
+    connection, database_utils, connection_pool = init_database
+    database_writer = init_database_writer
+    database_writer.start()
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.update_connection_status("SUCCESSFULLY LANDING", "Airplane_1")
+    database_writer.flush()
+    assert database_utils.get_single_airplane_details(connection, "Airplane_1")[2] == "SUCCESSFULLY LANDING"
+    database_writer.stop()
+    connection_pool.release_connection.assert_called_once_with(connection)
+
+def test_writer_groups_events_in_batches(init_database, init_database_writer, mocker):
+    connection, database_utils, connection_pool = init_database
+    database_writer = init_database_writer
+    mock_write_batch = mocker.spy(database_utils, "write_batch")
+    for airplane_id in range(1, 101):
+        database_writer.add_new_connection(f"Airplane_{airplane_id}")
+        database_writer.update_connection_status("CRASHED BY COLLISION", f"Airplane_{airplane_id}")
+    database_writer.start()
+    database_writer.stop()
+    assert mock_write_batch.call_count == 1
+    assert database_writer.statistics()["written"] == 200
+    assert database_utils.get_all_airplanes_number_per_period(connection) == 100
+    assert len(database_utils.get_airplanes_with_specified_status_per_period(connection, "CRASHED BY COLLISION")) == 100
+
+def test_writer_limits_batch_size(init_database):
+    connection, database_utils, connection_pool = init_database
+    database_writer = DatabaseWriter(connection_pool, database_utils, batch_size = 10, poll_interval = 0.01)
+    for airplane_id in range(25):
+        database_writer.add_new_connection(f"Airplane_{airplane_id}")
+    database_writer.start()
+    database_writer.stop()
+    assert database_writer.statistics()["batches"] == 3
+    assert database_utils.get_all_airplanes_number_per_period(connection) == 25
+
+def test_writer_stop_writes_queued_events(init_database, init_database_writer):
+    connection, database_utils, connection_pool = init_database
+    database_writer = init_database_writer
+    database_writer.start()
+    for airplane_id in range(50):
+        database_writer.add_new_connection(f"Airplane_{airplane_id}")
+    database_writer.stop()
+    assert database_writer.statistics()["queued"] == 0
+    assert database_utils.get_all_airplanes_number_per_period(connection) == 50
+
+def test_writer_drops_failed_batch(init_database, init_database_writer, mocker):
+    connection, database_utils, connection_pool = init_database
+    database_writer = init_database_writer
+    database_writer.add_new_connection(None)
+    database_writer.start()
+    database_writer.flush()
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.stop()
+    statistics = database_writer.statistics()
+    assert statistics["failed"] == 1
+    assert statistics["written"] == 1
+    assert database_utils.get_all_airplanes_number_per_period(connection) == 1
+
+def test_writer_uses_current_period(init_database):
+    connection, database_utils, connection_pool = init_database
+    database_writer = DatabaseWriter(connection_pool, DatabaseUtils(), poll_interval = 0.01)
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.start()
+    database_writer.stop()
+    assert database_utils.get_single_airplane_details(connection, "Airplane_1")[0] == "Airplane_1"
+
+def test_writer_survives_any_batch_error(init_database, init_database_writer, mocker):
+    connection, database_utils, connection_pool = init_database
+    database_writer = init_database_writer
+    mocker.patch.object(database_utils, "write_batch", side_effect = [ValueError("broken event"), None])
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.start()
+    database_writer.flush()
+    database_writer.add_new_connection("Airplane_2")
+    database_writer.flush()
+    assert database_writer.is_alive()
+    database_writer.stop()
+    statistics = database_writer.statistics()
+    assert statistics["failed"] == 1
+    assert statistics["written"] == 1
+
+def test_writer_retries_getting_connection(init_database, mocker):
+    connection, database_utils, connection_pool = init_database
+    logger = mocker.Mock()
+    connection_pool.get_connection.side_effect = [PoolTimeoutError("No free connection"), connection]
+    database_writer = DatabaseWriter(connection_pool, database_utils, poll_interval = 0.01, logger = logger)
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.start()
+    database_writer.flush()
+    database_writer.stop()
+    assert logger.error.call_count == 1
+    assert database_writer.statistics()["written"] == 1
+
+def test_writer_stopped_without_connection_drops_events(init_database, mocker):
+    connection, database_utils, connection_pool = init_database
+    connection_pool.get_connection.side_effect = PoolTimeoutError("No free connection")
+    database_writer = DatabaseWriter(connection_pool, database_utils, poll_interval = 0.01, logger = mocker.Mock())
+    database_writer.add_new_connection("Airplane_1")
+    database_writer.start()
+    database_writer.stop()
+    database_writer.flush()
+    assert database_writer.statistics()["failed"] == 1
+    connection_pool.release_connection.assert_not_called()
@@ -0,0 +1,111 @@
+import pytest
+from client_side.fleet_client import FleetAirplane, FleetClient
+from common.config_variables import TELEMETRY_TAG
+from common.message_framing import HEADER, TELEMETRY
+
+
+@pytest.fixture
+def init_fleet_client(mocker):
+    mocker.patch("client_side.fleet_client.logger_config")
+    fleet_client = FleetClient(2, clock_speed = 10)
+    fleet_client.selector = mocker.Mock()
+    return fleet_client
+
+@pytest.fixture
+def init_fleet_airplane(init_fleet_client, mocker):
+    fleet_client = init_fleet_client
+    mock_socket = mocker.Mock()
+    mock_socket.sent = []
+    mock_socket.send.side_effect = lambda data: mock_socket.sent.append(bytes(data)) or len(data)
+    fleet_airplane = FleetAirplane(fleet_client, mock_socket, fleet_client.clock)
+    fleet_client.airplanes.add(fleet_airplane)
+    return fleet_airplane
+
+def sent_messages(fleet_airplane):
+    return [data[HEADER.size:] for data in fleet_airplane.socket.sent]
+
+
+def test_fleet_client_init(init_fleet_client):
+    fleet_client = init_fleet_client
+    assert fleet_client.step_interval == 0.1
+    assert fleet_client.airplanes == set()
+    assert fleet_client.statistics["started"] == 0
+
+def test_initial_correspondence(init_fleet_airplane):
+    fleet_airplane = init_fleet_airplane
+    fleet_client = fleet_airplane.fleet
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Welcome to our airport !", "data": 7})
+    assert fleet_airplane.airplane.id == 7
+    assert fleet_airplane.state == "points"
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Your coordinates points: ",
+                                   "data": {"quarter": "NW", "init_landing_point_coordinates": [-2000, 450, 2000],
+                                            "waiting_point_coordinates": [-3500, 1000, 2350], "zero_point_coordinates": [0, 450, 0]}})
+    assert fleet_airplane.state == "direction"
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Fly to: ", "data": "Initial landing point"})
+    assert fleet_airplane.state == "flying"
+    assert fleet_airplane.airplane.fly_to_initial_landing_point == True
+    assert fleet_airplane.handshake_time is not None
+    assert fleet_client.statistics["connected"] == 1
+    assert len(fleet_client.timers) == 1
+    assert len(sent_messages(fleet_airplane)) == 2
+    assert b"Airplane_7" in sent_messages(fleet_airplane)[1]
+
+def test_codec_negotiation(init_fleet_airplane):
+    fleet_airplane = init_fleet_airplane
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Welcome to our airport !", "data": 7, "code": 1,
+                                   "codecs": ["unknown", "json"]})
+    assert fleet_airplane.serialize_utils.codec.name == "json"
+    assert b'"codec": "json"' in sent_messages(fleet_airplane)[0]
+
+def test_coordinates_in_telemetry_frames(init_fleet_airplane):
+    fleet_airplane = init_fleet_airplane
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Welcome to our airport !", "data": 7, "code": 1,
+                                   "telemetry": True})
+    assert b"Our coordinates: " in sent_messages(fleet_airplane)[0]
+    fleet_airplane.send_airplane_coordinates(fleet_airplane.socket, 0)
+    fleet_airplane.send_airplane_coordinates(fleet_airplane.socket, 0)
+    airplane = fleet_airplane.airplane
+    assert sent_messages(fleet_airplane)[2] == TELEMETRY.pack(TELEMETRY_TAG, 7, 2, airplane.x, airplane.y, airplane.z)
+
+def test_airport_is_full(init_fleet_airplane):
+    fleet_airplane = init_fleet_airplane
+    fleet_airplane.handle_message({"status": "ERROR", "message": "Airport`s full, you have to fly to another...", "data": None})
+    assert fleet_airplane.is_running == False
+    assert fleet_airplane.fleet.statistics["rejected"] == 1
+
+def test_landing_order_comes_later(init_fleet_airplane):
+    fleet_airplane = init_fleet_airplane
+    airplane = fleet_airplane.airplane
+    airplane.initial_landing_point = [airplane.x, airplane.y, airplane.z]
+    airplane.fly_to_initial_landing_point = True
+    fleet_airplane.state = "flying"
+    airplane.direct_to_initial_landing_point(fleet_airplane.socket)
+    assert (airplane.fly_to_initial_landing_point, airplane.fly_to_waiting_point, airplane.fly_to_runaway) == (False, False, False)
+    fleet_airplane.handle_message({"status": "SUCCESS", "message": "Fly to: ", "data": "Zero point"})
+    assert airplane.fly_to_runaway == True
+    assert airplane.speed == 75
+
+def test_flush_keeps_unsent_data(init_fleet_airplane, mocker):
+    fleet_airplane = init_fleet_airplane
+    fleet_client = fleet_airplane.fleet
+    fleet_airplane.socket.send.side_effect = lambda data: 3
+    fleet_airplane.outgoing += b"123456"
+    fleet_client.flush(fleet_airplane)
+    assert fleet_airplane.outgoing == bytearray(b"456")
+    fleet_client.selector.modify.assert_called_with(fleet_airplane.socket, 3, data = fleet_airplane)
+
+def test_run_due_timers(init_fleet_client, mocker):
+    fleet_client = init_fleet_client
+    mock_monotonic = mocker.patch("client_side.fleet_client.time.monotonic", return_value = 10.0)
+    first_callback = mocker.Mock()
+    second_callback = mocker.Mock()
+    fleet_client.schedule(0, first_callback, "first")
+    fleet_client.schedule(5, second_callback, "second")
+    fleet_client.run_due_timers()
+    first_callback.assert_called_once_with("first")
+    second_callback.assert_not_called()
+    assert fleet_client.time_to_next_timer() == 5
+    mock_monotonic.return_value = 15.0
+    fleet_client.run_due_timers()
+    second_callback.assert_called_once_with("second")
+    assert fleet_client.time_to_next_timer() is None
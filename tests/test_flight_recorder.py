@@ -0,0 +1,80 @@
+import os
+import numpy as np
+import pytest
+from common.clock import VirtualClock
+from server_side.flight_recorder import FlightRecorder, FlightRecording
+
+
+@pytest.fixture
+def init_flight_recorder(tmp_path):
+    clock = VirtualClock()
+    flight_recorder = FlightRecorder(str(tmp_path), clock = clock, initial_capacity = 4)
+    flight_recorder.start_period(1)
+    return flight_recorder, clock
+
+def test_start_period(init_flight_recorder, tmp_path):
+    flight_recorder, clock = init_flight_recorder
+    assert flight_recorder.capacity == 4
+    assert os.path.getsize(tmp_path / "period_1" / "timestamp.bin") == 4 * 8
+    assert len(FlightRecording(1, str(tmp_path))) == 0
+
+def test_record_before_start_is_skipped(tmp_path):
+    flight_recorder = FlightRecorder(str(tmp_path))
+    flight_recorder.record(1, [1, 2, 3])
+    assert flight_recorder.records == 0
+
+def test_record_and_read(init_flight_recorder, tmp_path):
+    flight_recorder, clock = init_flight_recorder
+    flight_recorder.record(1, [100, -200, 3000])
+    clock.advance(1.5)
+    flight_recorder.record(2, [-100, 200, 2500], "avoid_collision")
+    flight_recorder.flush()
+    recording = FlightRecording(1, str(tmp_path))
+    assert len(recording) == 2
+    assert isinstance(recording["x"], np.memmap)
+    assert recording["timestamp"].tolist() == [0, 1.5]
+    assert recording["airplane_id"].tolist() == [1, 2]
+    assert recording.coordinates().tolist() == [[100, -200, 3000], [-100, 200, 2500]]
+    assert recording["command"].tolist() == [0, FlightRecorder.commands["avoid_collision"]]
+
+def test_files_grow(init_flight_recorder, tmp_path):
+    flight_recorder, clock = init_flight_recorder
+    for airplane_id in range(10):
+        flight_recorder.record(airplane_id, [airplane_id, airplane_id, airplane_id])
+    assert flight_recorder.capacity == 16
+    flight_recorder.record_batch(list(range(10, 30)), [[id, id, id] for id in range(10, 30)], [None] * 19 + ["collision"])
+    assert flight_recorder.capacity == 32
+    flight_recorder.flush()
+    recording = FlightRecording(1, str(tmp_path))
+    assert recording["x"].tolist() == list(range(30))
+    assert recording["command"][-1] == FlightRecorder.commands["collision"]
+
+def test_files_are_unmapped_before_resizing(init_flight_recorder):
+    flight_recorder, clock = init_flight_recorder
+    old_maps = [array._mmap for array in flight_recorder.arrays.values()]
+    flight_recorder.record_batch(list(range(5)), [[id, id, id] for id in range(5)], [None] * 5)
+    assert all(old_map.closed for old_map in old_maps)
+    closing_maps = [array._mmap for array in flight_recorder.arrays.values()]
+    flight_recorder.close()
+    assert all(closing_map.closed for closing_map in closing_maps)
+
+def test_close_cuts_files(init_flight_recorder, tmp_path):
+    flight_recorder, clock = init_flight_recorder
+    flight_recorder.record(1, [1, 2, 3])
+    flight_recorder.close()
+    flight_recorder.record(1, [1, 2, 3])
+    assert os.path.getsize(tmp_path / "period_1" / "x.bin") == 4
+    assert len(FlightRecording(1, str(tmp_path))) == 1
+
+def test_between_and_airplane_track(init_flight_recorder, tmp_path):
+    flight_recorder, clock = init_flight_recorder
+    for second in range(6):
+        flight_recorder.record_batch([1, 2], [[second, 0, 1000], [-second, 0, 1000]], [None, None])
+        clock.advance(1)
+    flight_recorder.flush()
+    recording = FlightRecording(1, str(tmp_path))
+    window = recording.between(2, 3)
+    assert window["timestamp"].tolist() == [2, 2, 3, 3]
+    assert np.shares_memory(window["x"], recording["x"])
+    track = recording.airplane_track(2)
+    assert track["x"].tolist() == [0, -1, -2, -3, -4, -5]
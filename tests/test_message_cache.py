@@ -0,0 +1,41 @@
+import pytest
+from common.message_framing import HEADER
+from common.serialization_codecs import available_codecs, create_codec
+from server_side.airport import Airport
+from server_side.message_cache import MessageCache
+from server_side.server_messages import HandlerProtocols
+
+
+@pytest.fixture
+def init_message_cache():
+    airport = Airport()
+    message_cache = MessageCache(airport)
+    return airport, message_cache
+
+def decode_frame(codec_name, frame):
+    assert HEADER.unpack_from(frame)[0] == len(frame) - HEADER.size
+    return create_codec(codec_name).decode(frame[HEADER.size:])
+
+def test_frames_for_every_codec(init_message_cache):
+    airport, message_cache = init_message_cache
+    assert list(message_cache.frames) == available_codecs()
+
+@pytest.mark.parametrize("codec_name", available_codecs())
+def test_constant_messages(init_message_cache, codec_name):
+    airport, message_cache = init_message_cache
+    handler_protocols = HandlerProtocols()
+    assert decode_frame(codec_name, message_cache.frame(codec_name, "collision")) == handler_protocols.collision_message()
+    assert decode_frame(codec_name, message_cache.frame(codec_name, "avoid_collision")) == handler_protocols.avoid_collision_message()
+    assert decode_frame(codec_name, message_cache.frame(codec_name, "Zero point")) == handler_protocols.direct_airplane_message("Zero point")
+
+def test_points_of_every_quarter(init_message_cache):
+    airport, message_cache = init_message_cache
+    for quarter in ("NW", "NE", "SW", "SE"):
+        points = decode_frame("json", message_cache.frame("json", message_cache.points_name(quarter)))
+        assert points["data"]["quarter"] == quarter
+        assert points["data"]["init_landing_point_coordinates"] == list(airport.initial_landing_point[quarter].point_coordinates())
+        assert points["data"]["zero_point_coordinates"] == list(airport.zero_point[quarter[0]].point_coordinates())
+
+def test_frame_is_built_once(init_message_cache):
+    airport, message_cache = init_message_cache
+    assert message_cache.frame("json", "collision") is message_cache.frame("json", "collision")
@@ -0,0 +1,86 @@
+import pytest
+import socket as s
+from common.config_variables import TELEMETRY_TAG
+from common.message_framing import FrameReader, frame_message, frame_telemetry, is_telemetry, HEADER, TELEMETRY
+
+
+@pytest.fixture
+def init_frame_reader():
+    frame_reader = FrameReader(buffer_size = 16)
+    return frame_reader
+
+@pytest.fixture
+def sockets_pair():
+    sender, receiver = s.socketpair()
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+def test_frame_message():
+    assert frame_message(b'{"a": 1}') == HEADER.pack(8) + b'{"a": 1}'
+
+def test_receive_many_messages_in_one_read(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    sender.sendall(frame_message(b"one") + frame_message(b"two"))
+    assert frame_reader.receive(receiver) == 2
+    assert list(frame_reader.messages) == [b"one", b"two"]
+    assert frame_reader.start == 0
+    assert frame_reader.end == 0
+
+def test_read_message_split_between_reads(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    framed_message = frame_message(b"coordinates")
+    sender.sendall(framed_message[:6])
+    assert frame_reader.receive(receiver) == 0
+    assert not frame_reader.has_messages()
+    sender.sendall(framed_message[6:])
+    assert frame_reader.read_message(receiver) == b"coordinates"
+
+def test_read_message_bigger_than_buffer(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    payload = b"x" * 5000
+    sender.sendall(frame_message(payload) + frame_message(b"next"))
+    assert frame_reader.read_message(receiver) == payload
+    assert frame_reader.read_message(receiver) == b"next"
+    assert len(frame_reader.buffer) >= 5000
+
+def test_make_room_moves_unread_bytes(init_frame_reader):
+    frame_reader = init_frame_reader
+    frame_reader.buffer[:16] = b"0123456789abcdef"
+    frame_reader.start = 10
+    frame_reader.end = 16
+    frame_reader.make_room()
+    assert frame_reader.start == 0
+    assert frame_reader.end == 6
+    assert bytes(frame_reader.buffer[:6]) == b"abcdef"
+
+def test_receive_closed_connection(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    sender.close()
+    with pytest.raises(ConnectionError):
+        frame_reader.receive(receiver)
+
+def test_message_size_limit(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    sender.sendall(HEADER.pack(2 ** 31))
+    with pytest.raises(ValueError):
+        frame_reader.receive(receiver)
+
+def test_frame_telemetry():
+    framed_telemetry = frame_telemetry(7, 3, -4000, 3000, 2500)
+    assert len(framed_telemetry) == HEADER.size + TELEMETRY.size
+    assert is_telemetry(framed_telemetry[HEADER.size:])
+    assert not is_telemetry(b'{"status": "SUCCESS"}')
+
+def test_read_telemetry_between_messages(init_frame_reader, sockets_pair):
+    frame_reader = init_frame_reader
+    sender, receiver = sockets_pair
+    sender.sendall(frame_message(b"first") + frame_telemetry(7, 3, -4000, 3000, 2500) + frame_message(b"last"))
+    assert frame_reader.read_message(receiver) == b"first"
+    assert frame_reader.read_message(receiver) == (TELEMETRY_TAG, 7, 3, -4000, 3000, 2500)
+    assert frame_reader.read_message(receiver) == b"last"
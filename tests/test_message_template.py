@@ -0,0 +1,46 @@
+import pytest
+from common.message_template import MessageTemplate
+from client_side.client_messages import ClientProtocols
+from server_side.server_messages import HandlerProtocols, ServerProtocols
+
+
+@pytest.fixture
+def init_message_template():
+    message_template = MessageTemplate()
+    return message_template
+
+def test_protocol_template_with_code(init_message_template):
+    message_template = init_message_template
+    assert message_template.protocol_template("SUCCESS", "test_message", "test_data", 1) == \
+           {"status": "SUCCESS", "message": "test_message", "data": "test_data", "code": 1}
+
+def test_codes_are_unique():
+    assert len(set(MessageTemplate.codes.values())) == len(MessageTemplate.codes)
+
+@pytest.mark.parametrize("message, code_name", [
+    (ServerProtocols().airport_is_full_message(), "airport_is_full"),
+    (HandlerProtocols().welcome_message_to_client(1), "welcome"),
+    (HandlerProtocols().direct_airplane_message("Zero point"), "direction"),
+    (HandlerProtocols().avoid_collision_message(), "avoid_collision"),
+    (HandlerProtocols().collision_message(), "collision"),
+    (ClientProtocols().airplane_coordinates_message({"x": 1, "y": 2, "z": 3}), "coordinates"),
+    (ClientProtocols().reaching_the_target_message("Initial landing point"), "target_reached"),
+    (ClientProtocols().successfully_landing_message(), "landed"),
+    (ClientProtocols().out_of_fuel_message(), "out_of_fuel"),
+    (ClientProtocols().crash_message(), "crash")
+])
+def test_messages_carry_their_codes(message, code_name):
+    assert message["code"] == MessageTemplate.codes[code_name]
+    assert MessageTemplate.message_code(message) == MessageTemplate.codes[code_name]
+
+@pytest.mark.parametrize("message", [
+    HandlerProtocols().welcome_message_to_client(1),
+    HandlerProtocols().direct_airplane_message("Waiting point"),
+    ClientProtocols().crash_message()
+])
+def test_message_code_of_legacy_message(message):
+    code = message.pop("code")
+    assert MessageTemplate.message_code(message) == code
+
+def test_message_code_of_unknown_message():
+    assert MessageTemplate.message_code({"status": "SUCCESS", "message": "Unknown", "data": None}) is None
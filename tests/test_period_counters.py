@@ -0,0 +1,45 @@
+import threading
+import pytest
+from server_side.period_counters import PeriodCounters
+
+
+@pytest.fixture
+def init_period_counters():
+    period_counters = PeriodCounters()
+    return period_counters
+
+def test_init_period_counters(init_period_counters):
+    period_counters = init_period_counters
+    assert period_counters.next_airplane_id == 1
+    assert period_counters.statistics() == {"total": 0, "in_the_air": 0, "landed": 0,
+                                            "crashed_by_out_of_fuel": 0, "crashed_by_collision": 0}
+
+def test_seed(init_period_counters):
+    period_counters = init_period_counters
+    period_counters.seed({"total": 7, "in_the_air": 2, "landed": 4, "crashed_by_out_of_fuel": 0, "crashed_by_collision": 1})
+    assert period_counters.allocate_airplane_id() == 8
+    assert period_counters.statistics()["landed"] == 4
+
+def test_allocate_airplane_id_is_unique(init_period_counters):
+    period_counters = init_period_counters
+    airplane_ids = []
+
+    def allocate():
+        for _ in range(1000):
+            airplane_ids.append(period_counters.allocate_airplane_id())
+
+    threads = [threading.Thread(target = allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(airplane_ids) == list(range(1, 8001))
+
+def test_count_connection_and_status(init_period_counters):
+    period_counters = init_period_counters
+    for _ in range(3):
+        period_counters.count_connection()
+    period_counters.count_status("SUCCESSFULLY LANDING")
+    period_counters.count_status("CRASHED BY COLLISION")
+    assert period_counters.statistics() == {"total": 3, "in_the_air": 1, "landed": 1,
+                                            "crashed_by_out_of_fuel": 0, "crashed_by_collision": 1}
@@ -0,0 +1,66 @@
+import pytest
+from common.clock import AcceleratedClock
+from server_side.periodic_tasks import PeriodicTasks
+
+
+@pytest.fixture
+def mock_clock(mocker):
+    mock_clock = mocker.Mock()
+    mock_clock.monotonic.return_value = 100.0
+    mock_clock.real_seconds.side_effect = lambda seconds: seconds
+    return mock_clock
+
+@pytest.fixture
+def init_periodic_tasks(mock_clock):
+    tasks = PeriodicTasks(mock_clock)
+    return tasks
+
+def test_time_to_next_task_without_tasks(init_periodic_tasks):
+    tasks = init_periodic_tasks
+    assert tasks.time_to_next_task() is None
+
+def test_time_to_next_task(init_periodic_tasks, mock_clock, mocker):
+    tasks = init_periodic_tasks
+    tasks.add_task(1, mocker.Mock(), run_now = False)
+    tasks.add_task(5, mocker.Mock(), run_now = False)
+    assert tasks.time_to_next_task() == 1
+    mock_clock.monotonic.return_value = 100.4
+    assert tasks.time_to_next_task() == pytest.approx(0.6)
+    mock_clock.monotonic.return_value = 102
+    assert tasks.time_to_next_task() == 0
+
+def test_run_due_tasks(init_periodic_tasks, mock_clock, mocker):
+    tasks = init_periodic_tasks
+    fast_task = mocker.Mock()
+    slow_task = mocker.Mock()
+    tasks.add_task(1, fast_task)
+    tasks.add_task(3, slow_task, run_now = False)
+    tasks.run_due_tasks()
+    assert fast_task.call_count == 1
+    assert slow_task.call_count == 0
+    mock_clock.monotonic.return_value = 103
+    tasks.run_due_tasks()
+    assert fast_task.call_count == 2
+    assert slow_task.call_count == 1
+    assert tasks.time_to_next_task() == 1
+
+def test_time_to_next_task_of_accelerated_clock(mocker):
+    tasks = PeriodicTasks(AcceleratedClock(10))
+    tasks.add_task(60, mocker.Mock(), run_now = False)
+    assert tasks.time_to_next_task() == pytest.approx(6, abs = 0.1)
+
+def test_failed_task_stays_scheduled(mock_clock, mocker):
+    logger = mocker.Mock()
+    tasks = PeriodicTasks(mock_clock, logger = logger)
+    failing_task = mocker.Mock(side_effect = RuntimeError("database is gone"), __name__ = "failing_task")
+    other_task = mocker.Mock()
+    tasks.add_task(1, failing_task)
+    tasks.add_task(1, other_task)
+    tasks.run_due_tasks()
+    assert other_task.call_count == 1
+    logger.exception.assert_called_once()
+    assert len(tasks.tasks) == 2
+    mock_clock.monotonic.return_value = 101
+    tasks.run_due_tasks()
+    assert failing_task.call_count == 2
+    assert other_task.call_count == 2
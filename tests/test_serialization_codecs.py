@@ -0,0 +1,45 @@
+import pytest
+from common.serialization_codecs import CODECS, JsonCodec, available_codecs, choose_codec, create_codec
+from common.serialization_utils import SerializeUtils
+from benchmarks.serialization_benchmark import real_messages
+
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+@pytest.mark.parametrize("message_name", list(real_messages()))
+def test_codec_round_trip(codec_name, message_name):
+    codec = create_codec(codec_name)
+    message = real_messages()[message_name]
+    decoded = codec.decode(codec.encode(message))
+    assert decoded["message"] == message["message"]
+    assert decoded["code"] == message["code"]
+
+def test_json_codec_encoding():
+    assert JsonCodec().encode({"test_key": "test_value"}) == b'{"test_key": "test_value"}'
+
+def test_create_unknown_codec():
+    with pytest.raises(ValueError):
+        create_codec("unknown")
+
+def test_json_is_always_available():
+    assert available_codecs()[-1] == "json"
+
+@pytest.mark.parametrize("offered_codecs, result", [
+    (None, "json"),
+    ([], "json"),
+    (["unknown"], "json"),
+    (["unknown", "json"], "json")
+])
+def test_choose_codec(offered_codecs, result):
+    assert choose_codec(offered_codecs) == result
+
+def test_choose_codec_keeps_preference_of_other_side():
+    offered_codecs = list(reversed(available_codecs()))
+    assert choose_codec(offered_codecs) == offered_codecs[0]
+
+def test_serialize_utils_set_codec():
+    serialize_utils = SerializeUtils()
+    assert serialize_utils.codec.name == "json"
+    codec_name = available_codecs()[0]
+    serialize_utils.set_codec(codec_name)
+    assert serialize_utils.codec.name == codec_name
+    assert serialize_utils.deserialize_json(serialize_utils.serialize_to_json({"test_key": [1, 2]})) == {"test_key": [1, 2]}
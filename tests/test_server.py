@@ -2,7 +2,9 @@ import os
 import pytest
 import socket as s
 from server_side.server import Server, ClientHandler
-from server_side.database_managment import SerializeUtils
+from server_side.client_handler import BaseClientHandler
+from common.serialization_utils import SerializeUtils
+from common.message_framing import frame_message
 
 
 @pytest.fixture
@@ -46,36 +48,26 @@ def test_send_message_to_client(init_client_handler, mock_socket, mocker):
     b_data = b'{"message": "Test message", "body": "Test body"}'
     mocker.patch.object(serialize_utils, "serialize_to_json")
     client_handler.send_message_to_client(data)
-    mocked_socket.sendall.assert_called_once_with(b_data)
+    mocked_socket.sendall.assert_called_once_with(frame_message(b_data))
 
-def test_read_message_from_client(init_client_handler, mock_socket, mocker):
+def test_read_message_from_client(init_client_handler, mock_socket, mocker, fill_receive_buffer):
     client_handler = init_client_handler
     mocked_socket = mock_socket
     serialize_utils = SerializeUtils()
-    mocked_socket.recv.return_value = b'{"message": "Test message", "body": "Test body"}'
+    framed_message = frame_message(b'{"message": "Test message", "body": "Test body"}')
+    mocked_socket.recv_into.side_effect = lambda view: fill_receive_buffer(view, framed_message)
     expected_message = {"message": "Test message", "body": "Test body"}
     mocker.patch.object(serialize_utils, "deserialize_json", return_value = expected_message)
     received_message = client_handler.read_message_from_client(mocked_socket)
     assert received_message == expected_message
-    mocked_socket.recv.assert_called_once_with(client_handler.BUFFER)
+    mocked_socket.recv_into.assert_called_once()
 
-def test_update_airplane_coordinates(init_client_handler, mocker):
+def test_update_airplane_coordinates_with_tick_engine(init_client_handler, mocker):
     client_handler = init_client_handler
-    client_handler.airplane_object = {
-        client_handler.airplane_key: {
-            "coordinates": [-5000, 2000, 3000]
-        }
-    }
-    mocked_possible_collisions = mocker.Mock()
-    client_handler.check_possible_collisions = mocked_possible_collisions
-    updated_coordinates = {"body": {"x": -4500, "y": 2500, "z": 2600}}
+    mock_submit_coordinates = mocker.patch.object(client_handler.server.tick_engine, "submit_coordinates")
+    updated_coordinates = {"data": {"x": -4500, "y": 2500, "z": 2600}}
     client_handler.update_airplane_coordinates(updated_coordinates)
-    mocked_possible_collisions.assert_called_once()
-    assert client_handler.airplane_object[client_handler.airplane_key]["coordinates"] == [
-        updated_coordinates["body"]["x"],
-        updated_coordinates["body"]["y"],
-        updated_coordinates["body"]["z"]
-    ]
+    mock_submit_coordinates.assert_called_once_with(client_handler.airplane_key, [-4500, 2500, 2600])
 
 def test_server_init(init_server):
     server = init_server
@@ -84,7 +76,7 @@ def test_server_init(init_server):
     assert server.INTERNET_ADDRESS_FAMILY == s.AF_INET
     assert server.SOCKET_TYPE == s.SOCK_STREAM
     assert server.is_running == True
-    assert server.version == "1.2.3"
+    assert server.version == "1.3.0"
     assert len(server.clients_list) == 0
 
 def test_check_file_flag_exsits(mocker, init_server):
@@ -100,3 +92,30 @@ def test_check_file_flag_not_exsits(init_server, mocker):
     mock_os_path_is_file.return_value = False
     check_file_flag_not_exists = server.check_file_flag_exists()
     assert check_file_flag_not_exists == False
+
+def test_try_write_message_drops_message_for_full_socket(init_server):
+    server_socket, client_socket = s.socketpair()
+    client_handler = ClientHandler(init_server, server_socket, ("127.0.0.1", 65433), 10)
+    server_socket.setblocking(False)
+    try:
+        while True:
+            server_socket.send(b"x" * 65536)
+    except BlockingIOError:
+        server_socket.setblocking(True)
+    assert client_handler.try_write_message(frame_message(b"{}")) == False
+    with client_handler.send_lock:
+        assert client_handler.try_write_message(frame_message(b"{}")) == False
+    server_socket.close()
+    client_socket.close()
+
+def test_try_write_message(init_server):
+    server_socket, client_socket = s.socketpair()
+    client_handler = ClientHandler(init_server, server_socket, ("127.0.0.1", 65433), 10)
+    assert client_handler.try_write_message(frame_message(b"{}")) == True
+    assert client_socket.recv(1024) == frame_message(b"{}")
+    server_socket.close()
+    client_socket.close()
+
+def test_base_client_handler_is_abstract(init_server):
+    with pytest.raises(TypeError):
+        BaseClientHandler(init_server, ("127.0.0.1", 65433), 10)
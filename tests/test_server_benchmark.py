@@ -0,0 +1,41 @@
+import pytest
+from benchmarks.server_benchmark import MeasuredFleetAirplane, MeasuredFleetClient, is_saturated, percentiles
+
+
+def stage_with(rejected = 0, failed = 0, started = 10, connected = 10, p95 = 0.01):
+    return {"fleet": {"rejected": rejected, "failed": failed, "started": started, "connected": connected},
+            "handshake_time": {"p95": p95}}
+
+
+def test_percentiles():
+    summary = percentiles([i / 100 for i in range(100, 0, -1)])
+    assert summary == {"count": 100, "p50": 0.51, "p95": 0.96, "p99": 1.0, "max": 1.0}
+
+def test_percentiles_without_values():
+    assert percentiles([]) == {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+
+@pytest.mark.parametrize("stage, result", [
+    (stage_with(), False),
+    (stage_with(p95 = None), False),
+    (stage_with(rejected = 1), True),
+    (stage_with(failed = 1), True),
+    (stage_with(connected = 9), True),
+    (stage_with(p95 = 1.5), True)
+])
+def test_is_saturated(stage, result):
+    assert is_saturated(stage, 1) == result
+
+def test_coordinates_round_trip(mocker):
+    mocker.patch("client_side.fleet_client.logger_config")
+    mock_monotonic = mocker.patch("benchmarks.server_benchmark.time.monotonic", return_value = 10.0)
+    fleet = MeasuredFleetClient(1, clock_speed = 10)
+    fleet.selector = mocker.Mock()
+    fleet_airplane = MeasuredFleetAirplane(fleet, mocker.Mock(), fleet.clock)
+    fleet_airplane.socket.send.side_effect = len
+    fleet_airplane.state = "flying"
+    fleet_airplane.send_airplane_coordinates(fleet_airplane.socket, 0)
+    mock_monotonic.return_value = 10.25
+    fleet_airplane.handle_message({"status": "WARNING", "message": "Avoid collision", "code": 4})
+    fleet_airplane.handle_message({"status": "WARNING", "message": "Avoid collision", "code": 4})
+    assert fleet.coordinates_round_trips == [pytest.approx(0.25)]
+    assert fleet.commands == 2
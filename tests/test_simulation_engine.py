@@ -0,0 +1,47 @@
+import pytest
+from simulation.engine import SimulationEngine
+
+
+@pytest.fixture
+def init_simulation_engine():
+    engine = SimulationEngine(20, seed = 7, duration = 600, max_airplanes = 10)
+    return engine
+
+
+def test_simulation_engine_init(init_simulation_engine):
+    engine = init_simulation_engine
+    assert engine.clock.monotonic() == 0
+    assert len(engine.appearance_times) == 20
+    assert list(engine.appearance_times) == sorted(engine.appearance_times)
+    assert engine.airport.arrival_manager.clock is engine.clock
+
+def test_add_airplane(init_simulation_engine):
+    engine = init_simulation_engine
+    engine.add_airplane(1)
+    connection = engine.connections["Airplane_1"]
+    assert connection.airplane.fly_to_initial_landing_point == True
+    assert connection.airplane.quarter in ("NW", "NE", "SW", "SE")
+    assert "Airplane_1" in engine.airport.airplanes_list
+    engine.max_airplanes = 1
+    engine.add_airplane(2)
+    assert engine.outcomes["REJECTED"] == 1
+    assert "Airplane_2" not in engine.connections
+
+def test_step_moves_airplanes(init_simulation_engine):
+    engine = init_simulation_engine
+    engine.add_airplane(1)
+    connection = engine.connections["Airplane_1"]
+    coordinates = [connection.airplane.x, connection.airplane.y, connection.airplane.z]
+    engine.step()
+    assert engine.clock.monotonic() == 1
+    assert engine.airport.airplanes_list["Airplane_1"]["coordinates"] != coordinates
+    assert engine.airport.airplanes_list["Airplane_1"]["coordinates"] == [connection.airplane.x, connection.airplane.y, connection.airplane.z]
+
+def test_run_is_deterministic(init_simulation_engine):
+    first_report = init_simulation_engine.run()
+    second_report = SimulationEngine(20, seed = 7, duration = 600, max_airplanes = 10).run()
+    for report in (first_report, second_report):
+        report.pop("wall_time")
+    assert first_report == second_report
+    assert sum(first_report["outcomes"].values()) == 20
+    assert first_report["in_the_air"] == 0
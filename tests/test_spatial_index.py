@@ -0,0 +1,61 @@
+import pytest
+from server_side.spatial_index import SpatialGrid
+
+
+@pytest.fixture
+def init_spatial_grid():
+    grid = SpatialGrid(400)
+    return grid
+
+def test_cell_of(init_spatial_grid):
+    grid = init_spatial_grid
+    assert grid.cell_of(0, 399, 400) == (0, 0, 1)
+    assert grid.cell_of(-1, -400, -401) == (-1, -1, -2)
+
+def test_update_moves_airplane_between_cells(init_spatial_grid):
+    grid = init_spatial_grid
+    grid.update("Airplane_1", 100, 100, 100)
+    assert grid.cells == {(0, 0, 0): {"Airplane_1"}}
+    grid.update("Airplane_1", 150, 100, 100)
+    assert grid.cells == {(0, 0, 0): {"Airplane_1"}}
+    grid.update("Airplane_1", 500, 100, 100)
+    assert grid.cells == {(1, 0, 0): {"Airplane_1"}}
+    assert grid.positions["Airplane_1"] == (500, 100, 100, (1, 0, 0))
+    assert len(grid) == 1
+
+def test_remove(init_spatial_grid):
+    grid = init_spatial_grid
+    grid.update("Airplane_1", 100, 100, 100)
+    grid.remove("Airplane_1")
+    grid.remove("Airplane_2")
+    assert grid.cells == {}
+    assert len(grid) == 0
+
+def test_neighbours(init_spatial_grid):
+    grid = init_spatial_grid
+    grid.update("Airplane_1", 390, 390, 2000)
+    grid.update("Airplane_2", 410, 410, 2000)
+    grid.update("Airplane_3", 390, 740, 2000)
+    grid.update("Airplane_4", 390, 1000, 2000)
+    grid.update("Airplane_5", -3000, 390, 2000)
+    neighbours = sorted(grid.neighbours("Airplane_1", 400))
+    assert neighbours == [("Airplane_2", 28), ("Airplane_3", 350)]
+    assert grid.neighbours("Airplane_6", 400) == []
+
+def test_neighbours_radius_bigger_than_cell(init_spatial_grid):
+    grid = init_spatial_grid
+    with pytest.raises(ValueError):
+        grid.neighbours("Airplane_1", 500)
+
+def test_neighbourhoods(init_spatial_grid):
+    grid = init_spatial_grid
+    grid.update("Airplane_1", 100, 100, 100)
+    grid.update("Airplane_2", 200, 200, 200)
+    grid.update("Airplane_3", 500, 100, 100)
+    grid.update("Airplane_4", 1300, 100, 100)
+    groups = {tuple(sorted(nearby_keys[:cell_count])): sorted(nearby_keys) for cell_count, nearby_keys in grid.neighbourhoods()}
+    assert groups == {
+        ("Airplane_1", "Airplane_2"): ["Airplane_1", "Airplane_2", "Airplane_3"],
+        ("Airplane_3", ): ["Airplane_1", "Airplane_2", "Airplane_3"],
+        ("Airplane_4", ): ["Airplane_4"]
+    }
@@ -0,0 +1,106 @@
+import pytest
+from common.clock import VirtualClock
+from server_side.airport import Airport
+from server_side.tick_engine import TickEngine
+
+
+@pytest.fixture
+def init_tick_engine():
+    tick_engine = TickEngine(Airport(), tick_rate = 10, clock = VirtualClock(start_time = 100))
+    return tick_engine
+
+def mock_handler(mocker, airplane_key, coordinates):
+    handler = mocker.Mock()
+    handler.airplane_key = airplane_key
+    handler.airplane_object = {airplane_key: {"coordinates": coordinates, "quarter": "NW"}}
+    return handler
+
+def test_tick_engine_init(init_tick_engine):
+    tick_engine = init_tick_engine
+    assert tick_engine.tick_interval == 0.1
+    assert tick_engine.ticks == 0
+    assert tick_engine.deadline_misses == 0
+
+def test_submit_coordinates_keeps_newest(init_tick_engine):
+    tick_engine = init_tick_engine
+    tick_engine.submit_coordinates("Airplane_1", [1, 1, 1])
+    tick_engine.submit_coordinates("Airplane_1", [2, 2, 2])
+    assert tick_engine.pending_updates == {"Airplane_1": [2, 2, 2]}
+
+def test_tick_applies_updates_and_sends_commands(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    first_handler = mock_handler(mocker, "Airplane_1", [2000, 3000, 1500])
+    second_handler = mock_handler(mocker, "Airplane_2", [-2000, 3000, 1500])
+    third_handler = mock_handler(mocker, "Airplane_3", [2000, 3000, 1150])
+    for handler in (first_handler, second_handler, third_handler):
+        tick_engine.register_handler(handler)
+    tick_engine.submit_coordinates("Airplane_2", [2001, 3001, 1501])
+    tick_engine.tick()
+    assert tick_engine.airport.airplanes_list["Airplane_2"]["coordinates"] == [2001, 3001, 1501]
+    assert tick_engine.pending_updates == {}
+    first_handler.try_send_cached_message.assert_called_once_with("collision")
+    second_handler.try_send_cached_message.assert_called_once_with("collision")
+    third_handler.try_send_cached_message.assert_called_once_with("avoid_collision")
+
+def test_remove_airplane_drops_pending_update(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    tick_engine.register_handler(mock_handler(mocker, "Airplane_1", [2000, 3000, 1500]))
+    tick_engine.submit_coordinates("Airplane_1", [2001, 3001, 1501])
+    tick_engine.remove_airplane("Airplane_1")
+    tick_engine.tick()
+    assert len(tick_engine.airport.airplanes_list) == 0
+    assert tick_engine.handlers == {}
+
+def test_run_tick_counts_deadline_misses(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    tick_duration = [0.05]
+    mocker.patch.object(tick_engine, "tick", side_effect = lambda: tick_engine.clock.advance(tick_duration[0]))
+    tick_engine.next_deadline = 100
+    tick_engine.run_tick()
+    assert tick_engine.deadline_misses == 0
+    assert tick_engine.next_deadline == pytest.approx(100.1)
+    tick_engine.clock.sleep(tick_engine.time_to_next_tick())
+    tick_duration[0] = 0.25
+    tick_engine.run_tick()
+    assert tick_engine.deadline_misses == 1
+    assert tick_engine.next_deadline == pytest.approx(100.45)
+    assert tick_engine.statistics()["ticks"] == 2
+    assert tick_engine.statistics()["max_tick_duration"] == pytest.approx(0.25)
+
+def test_run_tick_survives_errors(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    tick_engine.logger = mocker.Mock()
+    mocker.patch.object(tick_engine, "tick", side_effect = ValueError("broken update"))
+    tick_engine.run_tick()
+    tick_engine.run_tick()
+    assert tick_engine.statistics()["errors"] == 2
+    assert tick_engine.statistics()["ticks"] == 2
+    assert tick_engine.logger.exception.call_count == 2
+
+def test_tick_records_applied_updates(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    tick_engine.recorder = mocker.Mock()
+    first_handler = mock_handler(mocker, "Airplane_1", [2000, 3000, 1500])
+    second_handler = mock_handler(mocker, "Airplane_2", [-2000, 3000, 1500])
+    third_handler = mock_handler(mocker, "Airplane_3", [2000, 3000, 1150])
+    for thread_id, handler in enumerate((first_handler, second_handler, third_handler), start = 1):
+        handler.thread_id = thread_id
+        tick_engine.register_handler(handler)
+    tick_engine.submit_coordinates("Airplane_2", [2001, 3001, 1501])
+    tick_engine.submit_coordinates("Airplane_3", [2000, 3000, 1150])
+    tick_engine.tick()
+    tick_engine.recorder.record_batch.assert_called_once_with([2, 3], [[2001, 3001, 1501], [2000, 3000, 1150]],
+                                                              ["collision", "avoid_collision"])
+
+def test_send_command_counts_dropped_commands(init_tick_engine, mocker):
+    tick_engine = init_tick_engine
+    slow_handler = mock_handler(mocker, "Airplane_1", [0, 0, 0])
+    slow_handler.try_send_cached_message.return_value = False
+    closed_handler = mock_handler(mocker, "Airplane_2", [0, 0, 0])
+    closed_handler.try_send_cached_message.side_effect = OSError("Bad file descriptor")
+    ready_handler = mock_handler(mocker, "Airplane_3", [0, 0, 0])
+    ready_handler.try_send_cached_message.return_value = True
+    for handler in (slow_handler, closed_handler, ready_handler):
+        tick_engine.send_command(handler, "avoid_collision")
+    assert tick_engine.statistics()["failed_sends"] == 2
+    closed_handler.logger.warning.assert_called_once()